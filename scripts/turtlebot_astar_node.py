@@ -0,0 +1,86 @@
+#!/usr/bin/python
+
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+# header files
+import time
+import rospy
+from turtlebot_astar.query import STATUS_MESSAGES, make_planner, validate
+from turtlebot_astar.execution import Executor
+from turtlebot_astar.robot import RosPublisher, make_publisher
+
+# planning budget, the robot starts driving the first path found and the search keeps improving it meanwhile
+PLANNING_TIME = 30.0
+
+
+# ROS node: read the query from the terminal, plan it and move the turtlebot along the path
+def main():
+    
+    # make ros publisher
+    rospy.init_node('turtlebot_astar')
+    pub_vel = make_publisher()
+    time.sleep(2)
+    
+    # map size is 1000 cm x 1000 cm
+    print()
+    print()
+    query = {}
+    query["startX"] = float(input("Enter the x-coordinate for start node(in m) : "))
+    query["startY"] = float(input("Enter the y-coordinate for start node(in m) : "))
+    query["startOrientation"] = float(input("Enter the orientation for start node : "))
+    query["goalX"] = float(input("Enter the x-coordinate for goal node(in m) : "))
+    query["goalY"] = float(input("Enter the y-coordinate for goal node(in m) : "))
+    query["firstRPM"] = float(input("Enter the first value of RPM : "))
+    query["secondRPM"] = float(input("Enter the second value of RPM : "))
+    query["clearance"] = float(input("Enter the clearance of the rigid robot(in m) : "))
+    
+    # take start and goal node as input
+    astar = make_planner(query)
+    status = validate(astar)
+    if(status != None):
+        print(STATUS_MESSAGES[status])
+        print("Please check README.md file for running turtlebot_astar_node.py file.")
+        return
+    
+    # plan in the background and drive the committed prefix of the path as soon as one is found
+    executor = Executor(astar, RosPublisher(pub_vel), PLANNING_TIME)
+    result = executor.Run()
+    
+    # print optimal path found or not
+    if(result["status"] == "timeout"):
+        print("\nNo path found within the planning time of %.0f s." % PLANNING_TIME)
+    elif(result["status"] == "partial"):
+        print("\nNo path found within the planning time of %.0f s, the robot drove towards the goal." % PLANNING_TIME)
+    elif(result["status"] != "done"):
+        print("\nNo optimal path found.")
+    else:
+        print("\nPath found (cost %.1f, at most %.2f times the optimal cost)." % (result["cost"], result["bound"]))
+        print("Time to first motion: %.2f s, mission time: %.2f s, %d commands for %d actions." % (result["timeToFirstMotion"], result["missionTime"], result["commands"], len(result["actions"])))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,12 @@
+#!/usr/bin/env python
+
+# ROS setup for the python package of turtlebot_astar (used by catkin_python_setup)
+from distutils.core import setup
+from catkin_pkg.python_setup import generate_distutils_setup
+
+setup_args = generate_distutils_setup(
+    packages=['turtlebot_astar'],
+    package_dir={'': 'src'}
+)
+
+setup(**setup_args)
@@ -0,0 +1,44 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+# planning core of the turtlebot A-star package, importing it never touches ROS or matplotlib
+from turtlebot_astar.obstacles import Box, Circle, ObstacleMap, load_map
+from turtlebot_astar.occupancy import OccupancyGrid, obstacle_space
+from turtlebot_astar.tiles import TiledOccupancy
+from turtlebot_astar.primitives import MotionPrimitives, arc_offsets
+from turtlebot_astar.lattice import SparseLattice, StateLattice
+from turtlebot_astar.node_store import Node, NodeStore
+from turtlebot_astar.stats import SearchStats
+from turtlebot_astar.heuristics import DistanceField
+from turtlebot_astar.signed_distance import SignedDistanceField
+from turtlebot_astar.priority_queue import IndexedHeap, LazyHeap
+from turtlebot_astar.astar import AStar
+from turtlebot_astar.replan import Replanner
+from turtlebot_astar.plan_cache import PlanCache
+from turtlebot_astar.query import load_queries, make_planner, run_query, validate
+from turtlebot_astar.batch import plan_batch
+from turtlebot_astar.hierarchical import Corridor, HierarchicalPlanner
+from turtlebot_astar.execution import Executor, RecordingPublisher, coalesce_actions
@@ -0,0 +1,181 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+# header files
+import time
+import numpy as np
+from turtlebot_astar.lattice import SparseLattice
+from turtlebot_astar.priority_queue import LazyHeap
+
+
+# anytime repairing a-star (ARA*) on the state lattice of an AStar object
+def anytime_search(astar, timeLimit, initialWeight=3.0, finalWeight=1.0, weightStep=0.5, callback=None, stop=None):
+    """
+    Inputs:
+    
+    astar: the AStar object (its lattice must not have been searched yet).
+    timeLimit: the wall-clock budget of the search (in seconds).
+    initialWeight: the heuristic weight of the first search, a high weight finds a first path quickly.
+    finalWeight: the heuristic weight of the last search (1.0 for an optimal path on the lattice).
+    weightStep: the decrease of the weight between two searches.
+    callback: optional function called with the solution dictionary every time the path or its bound improves.
+    stop: optional threading.Event, the search ends as if the deadline was hit once it is set.
+    
+    Outputs:
+    
+    Dictionary with
+        states: the path from start node to goal node (or to the node closest to the goal if no path was found).
+        actions: list containing the (dvx, dvy, dw) values for each state of the path.
+        cost: the cost to come of the last state of the path (inf when the path is partial or empty).
+        weight: the heuristic weight of the search that found the path.
+        bound: the suboptimality bound of the cost, relative to the best path on the lattice.
+        partial: True if the goal was not reached before the deadline and the path only leads towards it.
+        complete: True if the search with finalWeight finished before the deadline.
+        time: the time (in seconds) at which the path was found.
+    
+    Every search reuses the costs and the tree of the previous one: only the open nodes and the closed nodes
+    whose cost improved (inconsistent nodes) are put back in the open list with the new weight. The heuristic
+    is the unweighted distance to the goal (euclidean or around the obstacles), which never overestimates the cost of the actions, so a path found
+    with weight w costs at most w times the best path.
+    """
+    
+    startTime = time.perf_counter()
+    deadline = startTime + timeLimit
+    lattice = astar.lattice
+    if(isinstance(lattice, SparseLattice)):
+        raise ValueError("anytime_search needs a dense lattice (latticeStorage='dense')")
+    weights = astar.primitives.weights.tolist()
+    
+    # version - updates of every cell, parentVersion - version of the parent when the cell was linked to it
+    # a closed cell that improves moves to a new pose, the links of its old successors then become stale
+    version = np.zeros(lattice.distance.shape, dtype=np.int32)
+    parentVersion = np.zeros(lattice.distance.shape, dtype=np.int32)
+    
+    # heuristic of a cell (unweighted)
+    def heuristic(index):
+        return astar.Heuristic(float(lattice.x[index]), float(lattice.y[index]), 1.0)
+    
+    # start node
+    startIndex = lattice.Index(astar.start[0], astar.start[1], astar.start[2])
+    lattice.Update(startIndex, astar.start[0], astar.start[1], astar.start[2], 0, initialWeight * astar.Heuristic(astar.start[0], astar.start[1], 1.0), -1, -1)
+    openSet = set([startIndex])
+    inconsistent = set()
+    queue = LazyHeap()
+    queue.Push(startIndex, float(lattice.distance[startIndex]), 0.0)
+    
+    # best solution and the node closest to the goal
+    solution = {"states": [], "actions": [], "cost": float("inf"), "weight": None, "bound": float("inf"), "partial": False, "complete": False, "time": None}
+    bestIndex = None
+    closestIndex = startIndex
+    closestDistance = heuristic(startIndex)
+    
+    weight = initialWeight
+    timedOut = False
+    while(True):
+        
+        # improve the path with the current weight
+        lattice.closed[:] = False
+        improved = False
+        while(len(queue) > 0):
+            if(time.perf_counter() > deadline or (stop != None and stop.is_set())):
+                timedOut = True
+                break
+            (key, costToCome, currentIndex) = queue.Pop()
+            if(currentIndex not in openSet or key != lattice.distance[currentIndex]):
+                continue
+            if(solution["cost"] <= key):
+                queue.Push(currentIndex, key, costToCome)
+                break
+            openSet.discard(currentIndex)
+            lattice.closed[currentIndex] = True
+            parentIndex = lattice.parent[currentIndex]
+            if(parentIndex != -1 and parentVersion[currentIndex] != version[parentIndex]):
+                continue
+            
+            # goal reached, keep the path if it is cheaper than the best one
+            currentNode = lattice.State(currentIndex)
+            distanceToGoal = heuristic(currentIndex)
+            if(distanceToGoal < closestDistance):
+                (closestIndex, closestDistance) = (currentIndex, distanceToGoal)
+            if(astar.IsGoal(currentNode[0], currentNode[1])):
+                path = astar.Backtrack(currentIndex, version, parentVersion)
+                if(path != None and costToCome < solution["cost"]):
+                    solution.update({"states": path[0], "actions": path[1], "cost": costToCome, "weight": weight, "bound": weight, "time": time.perf_counter() - startTime})
+                    bestIndex = currentIndex
+                    improved = True
+                continue
+            
+            # traverse the edges
+            (newXs, newYs, newThetas, costs, dvxs, dvys, dws, flags) = astar.RolloutPrimitives(currentNode)
+            for index in range(0, len(flags)):
+                if(flags[index] == False):
+                    continue
+                newIndex = lattice.Index(newXs[index], newYs[index], newThetas[index])
+                newCostToCome = costToCome + weights[index]
+                if(newCostToCome < lattice.costToCome[newIndex]):
+                    newKey = newCostToCome + weight * astar.Heuristic(newXs[index], newYs[index], 1.0)
+                    lattice.Update(newIndex, newXs[index], newYs[index], newThetas[index], newCostToCome, newKey, currentIndex, index)
+                    version[newIndex] += 1
+                    parentVersion[newIndex] = version[currentIndex]
+                    if(lattice.closed[newIndex]):
+                        inconsistent.add(newIndex)
+                    else:
+                        openSet.add(newIndex)
+                        queue.Push(newIndex, newKey, newCostToCome)
+        
+        # tighten the bound with the smallest unweighted f value still waiting to be expanded, and publish the solution
+        if(bestIndex != None):
+            bound = solution["bound"]
+            if(timedOut == False):
+                waiting = [float(lattice.costToCome[index]) + heuristic(index) for index in openSet | inconsistent]
+                bound = 1.0
+                if(len(waiting) > 0):
+                    bound = max(1.0, min(weight, solution["cost"] / max(min(waiting), 1e-9)))
+            if(improved or bound < solution["bound"]):
+                solution["bound"] = min(bound, solution["bound"])
+                if(callback != None):
+                    callback(dict(solution))
+        
+        if(timedOut or weight <= finalWeight):
+            solution["complete"] = (timedOut == False)
+            break
+        
+        # decrease the weight and move the inconsistent nodes back to the open list
+        weight = max(finalWeight, weight - weightStep)
+        openSet |= inconsistent
+        inconsistent = set()
+        queue = LazyHeap()
+        for index in openSet:
+            lattice.distance[index] = float(lattice.costToCome[index]) + weight * heuristic(index)
+            queue.Push(index, float(lattice.distance[index]), float(lattice.costToCome[index]))
+    
+    # deadline hit before reaching the goal, return the path towards the node closest to the goal
+    # (a search that ran out of nodes proved there is no path and returns none)
+    if(bestIndex == None and timedOut):
+        path = astar.Backtrack(closestIndex, version, parentVersion)
+        if(path != None):
+            solution.update({"states": path[0], "actions": path[1], "partial": True, "time": time.perf_counter() - startTime})
+    return solution
@@ -0,0 +1,1163 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+# header files
+import numpy as np
+import math
+import time
+from turtlebot_astar.obstacles import ObstacleMap
+from turtlebot_astar.occupancy import OccupancyGrid
+from turtlebot_astar.tiles import TiledOccupancy
+from turtlebot_astar.primitives import MotionPrimitives, arc_offsets
+from turtlebot_astar.lattice import SparseLattice, StateLattice
+from turtlebot_astar.node_store import NodeStore
+from turtlebot_astar.stats import SearchStats
+from turtlebot_astar.heuristics import DistanceField
+from turtlebot_astar.signed_distance import SignedDistanceField
+from turtlebot_astar.priority_queue import make_open_list
+
+
+# class for AStar
+class AStar(object):
+    
+    # init function
+    def __init__(self, start, goal, wheelRPM, clearance, resolution=1.0, collisionCheck="grid", latticeResolution=5.0, thetaBins=16, openList="heapq", heuristic="euclidean", fieldResolution=5.0, obstacleMap=None, recordExplored=1, batchSize=1, latticeStorage="dense", goalShot=False):
+        """
+        Inputs:
+        
+        start: this is the start coordinate of the robot. It is a tuple of form (x, y, theta).
+        goal: this is the goal coordinate of the robot. It is a tuple of form (x, y).
+        wheelRPM: this is the values of RPM of the wheels. It is of form (leftRPM, rightRPM).
+        clearance: this is the clearance that the robot needs to have with the obstacles.
+        resolution: the cell size (in cms) of the rasterized obstacle space used for collision checks.
+        collisionCheck: "grid" (lookup in the rasterized obstacle space), "analytic" (evaluate the obstacle equations),
+                        "verify" (evaluate both and raise an error if the grid misses an obstacle), "distance" (compare
+                        the signed distance field of the map, shared by every clearance, with clearance + radius),
+                        "swept" (same test as "distance", but the arcs are followed in steps as long as the distance
+                        to the nearest obstacle allows, so only the samples near obstacles are checked) or "tiled"
+                        (same lookups as "grid", read through the tiles of a memory mapped file so only the part of
+                        the map the search touches is paged in).
+        latticeResolution: the cell size (in cms) of the state lattice used for duplicate detection.
+        thetaBins: the number of orientation bins of the state lattice.
+        openList: "heapq" (improved nodes are pushed again, stale entries are skipped when popped) or "indexed"
+                  (binary heap with decrease-key, one entry per node).
+        heuristic: "euclidean" (straight line distance to the goal) or "distance_field" (length of the shortest path to
+                   the goal around the inflated obstacles, computed once per goal and cached).
+        fieldResolution: the cell size (in cms) of the distance field.
+        obstacleMap: the ObstacleMap planned in (see turtlebot_astar.obstacles.load_map), defaults to the built-in map of the original project (ObstacleMap.Default()).
+        recordExplored: record every recordExplored-th expanded node in the exploredStates returned by search (1 records
+                        every node, 0 none, for runs that only need the path).
+        batchSize: the number of open nodes search pops and expands together in one vectorized step (see ExpandBatch),
+                   1 expands them one at a time.
+        latticeStorage: "dense" (arrays over every cell of the map) or "sparse" (arrays over the cells the search
+                        touches, for large maps; only used by search, not by search_anytime or the Replanner).
+        goalShot: try to connect the nodes popped near the goal straight to it with a turn and a straight line (see
+                  GoalShot), more often the closer they are, and end search with the first connection found.
+        """
+        
+        # start variable - tuple of of form (x, y, theta)
+        self.start = start
+        
+        # goal variable - tuple of form (x, y)
+        self.goal = goal
+        
+        # obstacleMap - the obstacles of the map, held in a spatial index
+        if(obstacleMap == None):
+            obstacleMap = ObstacleMap.Default()
+        self.obstacleMap = obstacleMap
+        
+        # the map size along x and y dimensions in cms (map dimension are from -500 to 500 for both x and y direction by default)
+        self.xLength = obstacleMap.xLength
+        self.yLength = obstacleMap.yLength
+        
+        # wheelRPM variable - tuple of form (leftRPM, rightRPM)
+        self.wheelRPM = wheelRPM
+        
+        # clearance variable - distance of the robot from the obstacle
+        self.clearance = min(clearance + 10, 25)
+        
+        # radius variable - the radius of the robot (taken from turtlebot datasheet)
+        self.radius = 20.0
+        
+        # wheelDistance - the distance between wheels (taken from turtlebot datasheet)
+        self.wheelDistance = 34.0
+        
+        # wheelRadius - the radius of the wheels (taken from turtlebot datasheet)
+        self.wheelRadius = 3.8
+        
+        # lattice - discretized (x, y, theta) states holding the costs and the backtracking data of the search
+        if(latticeStorage not in ("dense", "sparse")):
+            raise ValueError("latticeStorage must be 'dense' or 'sparse'")
+        self.lattice = (StateLattice if latticeStorage == "dense" else SparseLattice)(self.xLength, self.yLength, latticeResolution, thetaBins)
+        
+        # corridor - optional region the search is kept in (see turtlebot_astar.hierarchical), None for the whole map
+        self.corridor = None
+        
+        # targets - goals searched together (see turtlebot_astar.multi_goal), array of (x, y, reach) rows, None for the single goal
+        self.targets = None
+        
+        # weight - the weight of the heuristic (weighted a-star when greater than 1.0)
+        self.weight = 3.0
+        
+        # goalThreshold - threshold from goal node
+        self.goalThreshold = 15
+        
+        # goalShot - try to connect the nodes popped near the goal straight to it, shotRange - the distance (in cms) within
+        # which shots are tried, shotInterval - the pops between two shots at shotRange (fewer closer to the goal)
+        self.goalShot = goalShot
+        self.shotRange = 150.0
+        self.shotInterval = 32
+        
+        # openList - the kind of priority queue used by search
+        if(openList not in ("indexed", "heapq")):
+            raise ValueError("openList must be 'indexed' or 'heapq'")
+        self.openList = openList
+        
+        # recordExplored - the sampling interval of the expanded nodes kept in exploredStates
+        self.recordExplored = int(recordExplored)
+        
+        # batchSize - the number of nodes expanded together by search
+        if(int(batchSize) < 1):
+            raise ValueError("batchSize must be at least 1")
+        self.batchSize = int(batchSize)
+        
+        # maxSteps - the search stops after expanding these many nodes (exit when no path exists)
+        self.maxSteps = 1000000
+        
+        # frequency - the value of frequency for curved path
+        self.frequency = 100
+        
+        # primitives - the 8 actions of the robot, rolled out together
+        self.primitives = MotionPrimitives(self.wheelRPM, self.wheelRadius, self.wheelDistance, self.frequency)
+        
+        # collisionCheck - the mode used by IsObstacle
+        if(collisionCheck not in ("grid", "analytic", "verify", "distance", "swept", "tiled")):
+            raise ValueError("collisionCheck must be one of 'grid', 'analytic', 'verify', 'distance', 'swept' or 'tiled'")
+        self.collisionCheck = collisionCheck
+        
+        # occupancyGrid - the obstacle space inflated by clearance and radius, built once and shared between planners
+        self.occupancyGrid = None
+        if(collisionCheck in ("grid", "verify")):
+            self.occupancyGrid = OccupancyGrid.Build(self.obstacleMap, self.clearance, self.radius, resolution)
+        if(collisionCheck == "tiled"):
+            self.occupancyGrid = TiledOccupancy.Build(self.obstacleMap, self.clearance, self.radius, resolution)
+        
+        # resolution - the cell size of the rasterized obstacle space
+        self.resolution = resolution
+        
+        # signedDistance - distance from every cell to the nearest (uninflated) obstacle, cached on disk, built when first needed
+        self.signedDistance = None
+        if(collisionCheck in ("distance", "swept")):
+            self.signedDistance = SignedDistanceField.Build(self.obstacleMap, resolution)
+        
+        # distanceField - distance to the goal around the obstacles, used by the "distance_field" heuristic
+        if(heuristic not in ("euclidean", "distance_field")):
+            raise ValueError("heuristic must be 'euclidean' or 'distance_field'")
+        self.distanceField = None
+        if(heuristic == "distance_field"):
+            grid = self.occupancyGrid
+            if(isinstance(grid, OccupancyGrid) == False):
+                grid = OccupancyGrid.Build(self.obstacleMap, self.clearance, self.radius, resolution)
+            self.distanceField = DistanceField.Build(grid, self.goal, fieldResolution)
+    
+
+    # move is valid or not
+    def IsValid(self, currX, currY):
+        """
+        Inputs:
+        
+        currX - the current x-position of the robot.
+        currY - the current y-posiiton of the robot.
+        
+        Outputs:
+        
+        True / False depending on whether the nodes lies within the map (and the corridor, when one is set) or not.
+        """
+        
+        nodeInMap = (currX >= (-self.xLength + self.radius + self.clearance) and currX <= (self.xLength - self.radius - self.clearance) and currY >= (-self.yLength + self.radius + self.clearance) and currY <= (self.yLength - self.radius - self.clearance))
+        return nodeInMap and (self.corridor == None or self.corridor.Contains(currX, currY))
+
+
+    # moves are valid or not for a batch of positions
+    def IsValidBatch(self, currX, currY):
+        """
+        Inputs:
+        
+        currX - array of x-positions of the robot.
+        currY - array of y-positions of the robot.
+        
+        Outputs:
+        
+        Boolean array, True for the positions lying within the map (and the corridor, when one is set).
+        """
+        
+        margin = self.radius + self.clearance
+        valid = ((currX >= (-self.xLength + margin)) & (currX <= (self.xLength - margin)) & (currY >= (-self.yLength + margin)) & (currY <= (self.yLength - margin)))
+        if(self.corridor != None):
+            valid &= self.corridor.ContainsBatch(currX, currY)
+        return valid
+
+    
+    # checks for an obstacle in the given map
+    def IsObstacle(self, row, col):
+        """
+        Inputs:
+        
+        row - the current x-position of the robot.
+        col - the current y-posiiton of the robot.
+        
+        Outputs:
+        
+        True / False depending on whether the nodes lies within obstacle or not.
+        """
+        
+        if(self.collisionCheck in ("grid", "tiled")):
+            return self.occupancyGrid.IsObstacle(row, col)
+        if(self.collisionCheck in ("distance", "swept")):
+            return self.signedDistance.IsObstacle(row, col, self.clearance, self.radius)
+        
+        obstacle = self.IsObstacleAnalytic(row, col)
+        if(self.collisionCheck == "verify" and obstacle and self.occupancyGrid.IsObstacle(row, col) == False):
+            raise AssertionError("occupancy grid misses obstacle at (" + str(row) + ", " + str(col) + ")")
+        return obstacle
+    
+    
+    # checks for obstacles at a batch of positions
+    def IsObstacleBatch(self, rows, cols):
+        """
+        Inputs:
+        
+        rows - array of x-positions of the robot.
+        cols - array of y-positions of the robot.
+        
+        Outputs:
+        
+        Boolean array, True for the positions lying within obstacle.
+        """
+        
+        if(self.collisionCheck in ("grid", "tiled")):
+            return self.occupancyGrid.IsObstacleBatch(rows, cols)
+        if(self.collisionCheck in ("distance", "swept")):
+            return self.signedDistance.IsObstacleBatch(rows, cols, self.clearance, self.radius)
+        
+        obstacle = self.obstacleMap.IsObstacleBatch(rows, cols, self.clearance, self.radius)
+        if(self.collisionCheck == "verify" and np.any(obstacle & ~self.occupancyGrid.IsObstacleBatch(rows, cols))):
+            raise AssertionError("occupancy grid misses obstacles in the given batch")
+        return obstacle
+    
+    
+    # distance between the body of the robot and the nearest obstacle
+    def ObstacleDistance(self, currX, currY):
+        """
+        Inputs:
+        
+        currX - the current x-position of the robot.
+        currY - the current y-posiiton of the robot.
+        
+        Outputs:
+        
+        A lower bound of the distance (in cms) between the robot and the nearest obstacle, negative when they overlap
+        (-inf outside the map). Distances are capped at the maxDistance of the signed distance field.
+        """
+        
+        if(self.signedDistance == None):
+            self.signedDistance = SignedDistanceField.Build(self.obstacleMap, self.resolution)
+        return self.signedDistance.Distance(currX, currY) - self.radius
+    
+    
+    # distances between the body of the robot and the nearest obstacle for a batch of positions
+    def ObstacleDistanceBatch(self, currX, currY):
+        """
+        Inputs:
+        
+        currX - array of x-positions of the robot.
+        currY - array of y-positions of the robot.
+        
+        Outputs:
+        
+        Array of the lower bounds of ObstacleDistance.
+        """
+        
+        if(self.signedDistance == None):
+            self.signedDistance = SignedDistanceField.Build(self.obstacleMap, self.resolution)
+        return self.signedDistance.DistanceBatch(currX, currY) - self.radius
+    
+    
+    # checks for an obstacle in the given map by testing the nearby obstacles
+    def IsObstacleAnalytic(self, row, col):
+        """
+        Inputs:
+        
+        row - the current x-position of the robot.
+        col - the current y-posiiton of the robot.
+        
+        Outputs:
+        
+        True / False depending on whether the nodes lies within obstacle or not.
+        """
+        
+        return self.obstacleMap.IsObstacle(row, col, self.clearance, self.radius)
+    
+    
+    # animate path and show the nodes on map, see turtlebot_astar.visualization
+    def animate(self, exploredStates, backtrackStates, obstacles="image"):
+        """
+        Inputs:
+        
+        exploredStates: list of explored states when going from start to  goal node.
+        backtrackStates: list of states to go from start to goal node.
+        obstacles: "image" (the rasterized obstacle space) or "patches" (one shape per obstacle).
+        """
+        
+        # matplotlib is only needed for plotting, import it lazily
+        from turtlebot_astar.visualization import animate
+        animate(self, exploredStates, backtrackStates, obstacles)
+    
+    
+    # return updated position by taking into account non-holonomic constraint of robot
+    def GetNewPositionOfRobot(self, currentNode, leftRPM, rightRPM):
+        """
+        Inputs:
+        
+        currentNode: the current node, tupe of type (x, y, theta)
+        leftRPM: the value of RPM of left wheel
+        rightRPM: the value of RPM of right wheel
+        
+        Outputs:
+        
+        x: Updated x-coordinate
+        y: Updated y-coordinate
+        theta: Updated angle value
+        cost: Net cost to move from (currentNode, (x, y))
+        dvx: linear velocity along x-direction to move from (currentNode, (x, y))
+        dvy: linear velocity along y-direction to move from (currentNode, (x, y))
+        w: angle threshold during each time step dt
+        flag: determines whether it is possible to move from (currentNode, (x, y))
+        """
+        
+        # calculate angular valocity of left wheel and right wheel and initialise vairables
+        leftAngularVelocity = leftRPM * 2 * np.pi / 60.0
+        rightAngularVelocity = rightRPM * 2 * np.pi / 60.0
+        velocity = self.wheelRadius * 0.5 * (leftAngularVelocity + rightAngularVelocity)
+        w = (self.wheelRadius / self.wheelDistance) * (rightAngularVelocity - leftAngularVelocity)
+        
+        # get updated node after moving along the arc for 1 s, sampled at frequency points for collision checking
+        (offsetX, offsetY) = arc_offsets([velocity], [w], currentNode[2], self.frequency)
+        sampleX = currentNode[0] + offsetX[0]
+        sampleY = currentNode[1] + offsetY[0]
+        flag = not np.any(~self.IsValidBatch(sampleX, sampleY) | self.IsObstacleBatch(sampleX, sampleY))
+        x = float(sampleX[-1])
+        y = float(sampleY[-1])
+        theta = currentNode[2] + w
+        cost = abs(velocity)
+        lastTheta = currentNode[2] + w * (self.frequency - 1) / self.frequency
+        dvx = velocity * math.cos(lastTheta)
+        dvy = velocity * math.sin(lastTheta)
+                
+        # pruning
+        if(flag != False and self.lattice.closed[self.lattice.Index(x, y, theta)]):
+            flag = False
+            
+        # return updated location
+        return (x, y, theta, cost, dvx, dvy, w, flag)
+
+    
+    # return updated positions for all the 8 actions of the robot at once
+    def RolloutPrimitives(self, currentNode, stats=None):
+        """
+        Inputs:
+        
+        currentNode: the current node, tupe of type (x, y, theta)
+        stats: optional SearchStats object, the rollout and collision checking times are added to it
+        
+        Outputs:
+        
+        newX: list of updated x-coordinates, one per action
+        newY: list of updated y-coordinates, one per action
+        newTheta: list of updated angle values, one per action
+        cost: list of net costs to move from (currentNode, (newX, newY))
+        dvx: list of linear velocities along x-direction, one per action
+        dvy: list of linear velocities along y-direction, one per action
+        dw: list of angular velocities, one per action
+        flag: list of True/ False, if possible to move to the updated node without hitting an obstacle
+        """
+        
+        # samples along every arc, the intermediate points are only used for collision checking
+        if(stats != None):
+            startTime = time.perf_counter()
+        (offsetX, offsetY, dvx, dvy) = self.primitives.Rotated(currentNode[2])
+        sampleX = currentNode[0] + offsetX
+        sampleY = currentNode[1] + offsetY
+        newTheta = currentNode[2] + self.primitives.angularVelocity
+        if(stats != None):
+            rolloutTime = time.perf_counter()
+            stats.rolloutTime += rolloutTime - startTime
+        if(self.collisionCheck == "swept"):
+            flag = self.IsSweptFree(currentNode, sampleX, sampleY)
+        else:
+            flag = ~np.any(~self.IsValidBatch(sampleX, sampleY) | self.IsObstacleBatch(sampleX, sampleY), axis=1)
+        if(stats != None):
+            stats.collisionTime += time.perf_counter() - rolloutTime
+        return (sampleX[:, -1].tolist(), sampleY[:, -1].tolist(), newTheta.tolist(), self.primitives.cost.tolist(), dvx.tolist(), dvy.tolist(), self.primitives.angularVelocity.tolist(), flag.tolist())
+    
+    
+    # conservative advancement along the arcs of the 8 primitives
+    def IsSweptFree(self, currentNode, sampleX, sampleY, minimumSkip=8):
+        """
+        Inputs:
+        
+        currentNode - the current node, tupe of type (x, y, theta), where every arc starts.
+        sampleX - array of shape (arcs, frequency), x-positions of the samples along every arc.
+        sampleY - array of shape (arcs, frequency), y-positions of the samples along every arc.
+        minimumSkip - when fewer samples than this can be skipped, the rest of the arc is checked sample by sample.
+        
+        Outputs:
+        
+        Array of True / False, one per arc, the same answers as checking all the samples against the signed
+        distance field. No sample can get closer to an obstacle than its distance along the arc from a checked
+        position, so all the samples within the clearance left at that position are skipped. The clearance left
+        is taken less three times the cell slack: the cell center of a skipped sample may be the distance along
+        the arc plus twice the slack away from the cell center looked up, and the sample is rejected at a distance
+        of margin plus one slack, so every skipped sample would pass the lookup as well. In open space the distance at the node covers every arc.
+        The corridor, when one is set, is not part of the distance field and is checked at every sample.
+        """
+        
+        # constants, the distances are looked up like SignedDistanceField.Distance
+        field = self.signedDistance
+        lookup = np.asarray(field.distance).item
+        margin = self.clearance + self.radius
+        limit = margin + field.slack
+        guard = margin + 3.0 * field.slack + 0.001
+        (arcs, frequency) = sampleX.shape
+        
+        # clearance left at the node, shared by all the arcs
+        (x, y) = (currentNode[0], currentNode[1])
+        border = min(x + self.xLength, self.xLength - x, y + self.yLength, self.yLength - y) - margin
+        safe = -1.0
+        if(border >= 0):
+            safe = min(lookup(int((x + self.xLength) / field.resolution), int((y + self.yLength) / field.resolution)) - guard, border)
+        
+        flags = np.ones(arcs, dtype=bool)
+        if(self.corridor != None):
+            flags = np.all(self.corridor.ContainsBatch(sampleX, sampleY), axis=1)
+        dense = np.zeros((arcs, frequency), dtype=bool)
+        for (arc, step) in enumerate((self.primitives.cost / frequency).tolist()):
+            if(flags[arc] == False):
+                continue
+            if(step == 0):
+                sample = frequency if safe >= 0 else 0
+            else:
+                sample = int(max(safe, 0.0) / step)
+            while(sample < frequency):
+                
+                # the sample itself, against the borders of the map and the obstacles
+                x = sampleX.item(arc, sample)
+                y = sampleY.item(arc, sample)
+                border = min(x + self.xLength, self.xLength - x, y + self.yLength, self.yLength - y) - margin
+                if(border < 0):
+                    flags[arc] = False
+                    break
+                distance = lookup(int((x + self.xLength) / field.resolution), int((y + self.yLength) / field.resolution))
+                if(distance <= limit):
+                    flags[arc] = False
+                    break
+                if(step == 0):
+                    break
+                
+                # skip the samples that can not get closer than that, close to obstacles check the rest of the arc
+                skip = int(max(min(distance - guard, border), 0.0) / step)
+                if(skip < minimumSkip):
+                    dense[arc, sample + 1:] = True
+                    break
+                sample += 1 + skip
+        
+        # the samples close to obstacles, checked together
+        if(dense.any()):
+            flags &= ~np.any(dense & (~self.IsValidBatch(sampleX, sampleY) | self.IsObstacleBatch(sampleX, sampleY)), axis=1)
+        return flags
+    
+    
+    # action move
+    def ActionMoveRobot(self, currentNode, leftRPM, rightRPM):
+        """
+        currentNode: the current node, tupe of type (x, y, theta)
+        leftRPM: the value of RPM of left wheel
+        rightRPM: the value of RPM of right wheel
+        
+        Outputs:
+        
+        flag: True/ False, if possible to move to the updated node
+        newX: Updated x-coordinate
+        newY: Updated y-coordinate
+        newTheta: Updated angle value
+        dvx: linear velocity along x-direction to move from (currentNode, (newX, newY))
+        dvy: linear velocity along y-direction to move from (currentNode, (newX, newY))
+        dw: angle threshold during each time step dt
+        cost: Net cost to move from (currentNode, (x, y))
+        """
+        
+        # update position
+        (newX, newY, newTheta, cost, dvx, dvy, dw, flag) = self.GetNewPositionOfRobot(currentNode, leftRPM, rightRPM)
+        
+        # check obstacle
+        if(flag == True and self.IsValid(newX, newY) and self.IsObstacle(newX, newY) == False):
+            return (True, newX, newY, newTheta, dvx, dvy, dw, cost)
+        return (False, newX, newY, newTheta, dvx, dvy, dw, cost)
+
+    
+    # update action
+    def UpdateAction(self, currentIndex, weight, newX, newY, newTheta, action, cost):
+        """
+        Inputs:
+        
+        currentIndex: the lattice index of the current node
+        weight: cost to move from (currentNode,(newX, newY))
+        newX: Updated x-coordinate
+        newY: Updated y-coordinate
+        newTheta: Updated angle value
+        action: the index of the motion primitive used
+        cost: the additional cost to move from (currentNode, (newX, newY))
+        
+        Outputs:
+        
+        The lattice index of the updated node if an optimal node found, otherwise None
+        """
+        
+        newIndex = self.lattice.Index(newX, newY, newTheta)
+        if(self.lattice.closed[newIndex]):
+            return None
+        
+        newCostToCome = self.lattice.costToCome[currentIndex] + weight
+        newCostToGo = self.Heuristic(newX, newY)
+        newDistance = newCostToCome + newCostToGo + cost
+        if(self.lattice.distance[newIndex] > newDistance):
+            self.lattice.Update(newIndex, newX, newY, newTheta, newCostToCome, newDistance, currentIndex, action)
+            return newIndex
+        return None
+        
+        
+    # eucledian heuristic (becomes weighted a-star when weight made greater than 1.0)
+    def euc_heuristic(self, currX, currY, weight = None):
+        """
+        Inputs:
+        
+        currX - the current x-position of the robot.
+        currY - the current y-posiiton of the robot.
+        weight - the weight used for A-star algorithm (defaults to self.weight)
+        
+        Output:
+        
+        Returns the eucledian distance between goal node and the current node(currX, currY), or the distance to the
+        region of the nearest target when targets are set
+        """
+        
+        if(weight == None):
+            weight = self.weight
+        if(self.targets is not None):
+            return weight * max(float(np.min(np.hypot(self.targets[:, 0] - currX, self.targets[:, 1] - currY) - self.targets[:, 2])), 0.0)
+        return weight * math.sqrt(((self.goal[0] - currX) ** 2) + ((self.goal[1] - currY) ** 2))
+    
+    
+    # heuristic used by the search
+    def Heuristic(self, currX, currY, weight = None):
+        """
+        Inputs:
+        
+        currX - the current x-position of the robot.
+        currY - the current y-posiiton of the robot.
+        weight - the weight used for A-star algorithm (defaults to self.weight)
+        
+        Output:
+        
+        Returns the eucledian distance to the goal, or the distance around the obstacles when a distance field is used
+        (the field only guides the search towards self.goal, so it is not used when targets are set)
+        """
+        
+        if(self.distanceField == None or self.targets is not None):
+            return self.euc_heuristic(currX, currY, weight)
+        if(weight == None):
+            weight = self.weight
+        return weight * max(math.sqrt(((self.goal[0] - currX) ** 2) + ((self.goal[1] - currY) ** 2)), self.distanceField.Distance(currX, currY))
+    
+    
+    # heuristic of a batch of positions
+    def HeuristicBatch(self, currX, currY, weight = None):
+        """
+        Inputs:
+        
+        currX - array of x-positions of the robot.
+        currY - array of y-positions of the robot.
+        weight - the weight used for A-star algorithm (defaults to self.weight)
+        
+        Output:
+        
+        Array of the values of Heuristic at the positions
+        """
+        
+        if(weight == None):
+            weight = self.weight
+        if(self.targets is not None):
+            distance = np.hypot(np.asarray(currX)[..., None] - self.targets[:, 0], np.asarray(currY)[..., None] - self.targets[:, 1])
+            return weight * np.maximum(np.min(distance - self.targets[:, 2], axis=-1), 0.0)
+        distance = np.sqrt((self.goal[0] - currX) ** 2 + (self.goal[1] - currY) ** 2)
+        if(self.distanceField != None):
+            distance = np.maximum(distance, self.distanceField.DistanceBatch(currX, currY))
+        return weight * distance
+    
+    
+    # goal reached or not
+    def IsGoal(self, currX, currY):
+        """
+        Inputs:
+        
+        currX - the current x-position of the robot.
+        currY - the current y-posiiton of the robot.
+        
+        Outputs:
+        
+        True / False depending on whether the node is close enough to the goal node.
+        """
+        
+        return ((currX - self.goal[0]) ** 2 + (currY - self.goal[1]) ** 2) < self.goalThreshold
+    
+    
+    # analytic connection from a node to the goal: a pivot turn on one wheel, then a straight line
+    def GoalShot(self, currentNode):
+        """
+        Inputs:
+        
+        currentNode: the node the connection starts from, tuple of form (x, y, theta).
+        
+        Outputs:
+        
+        (states, actions, cost) of the connection, or None if it leaves the map, hits an obstacle or the goal lies
+        inside both turning circles. The robot turns about the wheel on the inside of the turn (the turning circle of
+        the primitives with one wheel stopped) until it faces the goal and drives straight to it. The turn and the
+        line are split into 1 s actions no faster than the larger RPM allows, and each action costs like a primitive
+        with the same wheel speeds.
+        """
+        
+        (currX, currY, currTheta) = currentNode
+        turningRadius = 0.5 * self.wheelDistance
+        wheelVelocity = self.wheelRadius * max(self.wheelRPM) * 2 * np.pi / 60.0
+        best = None
+        for side in (1.0, -1.0):
+            
+            # turning circle on this side and the point where the line to the goal leaves it
+            centerX = currX - side * turningRadius * math.sin(currTheta)
+            centerY = currY + side * turningRadius * math.cos(currTheta)
+            distance = math.hypot(self.goal[0] - centerX, self.goal[1] - centerY)
+            if(distance <= turningRadius):
+                continue
+            leave = math.atan2(self.goal[1] - centerY, self.goal[0] - centerX) - side * math.acos(turningRadius / distance)
+            turn = side * ((side * (leave - (currTheta - side * 0.5 * np.pi))) % (2 * np.pi))
+            length = math.sqrt(distance * distance - turningRadius * turningRadius)
+            
+            # 1 s actions of (velocity, angular velocity), the turn at most at the pivot speed of the larger RPM
+            segments = []
+            turnActions = int(math.ceil(abs(turn) * turningRadius / (0.5 * wheelVelocity) - 1e-9))
+            for _ in range(0, turnActions):
+                segments.append((abs(turn) * turningRadius / turnActions, turn / turnActions))
+            lineActions = int(math.ceil(length / wheelVelocity - 1e-9))
+            for _ in range(0, lineActions):
+                segments.append((length / lineActions, 0.0))
+            cost = 0.0
+            for (velocity, angularVelocity) in segments:
+                cost += math.hypot(velocity - 0.5 * angularVelocity * self.wheelDistance, velocity + 0.5 * angularVelocity * self.wheelDistance) * 60.0 / (2 * np.pi * self.wheelRadius)
+            if(best != None and best[2] <= cost):
+                continue
+            
+            # collision check the samples of every action, like the primitives
+            actions = []
+            theta = currTheta
+            for (velocity, angularVelocity) in segments:
+                lastTheta = theta + angularVelocity * (self.frequency - 1) / self.frequency
+                actions.append((velocity * math.cos(lastTheta), velocity * math.sin(lastTheta), angularVelocity))
+                theta += angularVelocity
+            states = self.FollowActions(currentNode, actions)
+            if(states != None and self.IsGoal(states[-1][0], states[-1][1])):
+                best = (states, actions, cost)
+        return best
+    
+    
+    # follow a list of actions from a pose
+    def FollowActions(self, start, actions):
+        """
+        Inputs:
+        
+        start: the pose the actions start from, tuple of form (x, y, theta).
+        actions: list of (dvx, dvy, dw) values, each followed for 1 s.
+        
+        Outputs:
+        
+        List of the states reached after every action (starting with start), None if an arc leaves the map or hits an obstacle.
+        """
+        
+        states = [tuple(start)]
+        (currX, currY, currTheta) = start
+        for (dvx, dvy, dw) in actions:
+            (offsetX, offsetY) = arc_offsets([math.sqrt(dvx * dvx + dvy * dvy)], [dw], currTheta, self.frequency)
+            sampleX = currX + offsetX[0]
+            sampleY = currY + offsetY[0]
+            if(np.any(~self.IsValidBatch(sampleX, sampleY) | self.IsObstacleBatch(sampleX, sampleY))):
+                return None
+            (currX, currY, currTheta) = (float(sampleX[-1]), float(sampleY[-1]), currTheta + dw)
+            states.append((currX, currY, currTheta))
+        return states
+    
+    
+    # cost of a path followed from the start, the quantity the searches return for it
+    def PathCost(self, states, actions, costToCome=False):
+        """
+        Inputs:
+        
+        states: the states of the path (as returned by FollowActions).
+        actions: list of (dvx, dvy, dw) values of the path, each followed for 1 s.
+        costToCome: return the cost to come of the path (the cost of search_anytime) instead of the distance of search.
+        
+        Outputs:
+        
+        The cost to come of the path, plus the weighted heuristic of its last state and the length of its last arc
+        (the key of its last state in the lattice) unless costToCome is set. An action costs the weight of the primitive
+        with the same wheel speeds, and an action that is not one of the primitives the norm of its wheel speeds (in RPM).
+        """
+        
+        cost = 0.0
+        for (dvx, dvy, dw) in actions:
+            velocity = math.sqrt(dvx * dvx + dvy * dvy)
+            leftRPM = (velocity - 0.5 * dw * self.wheelDistance) * 60.0 / (2 * np.pi * self.wheelRadius)
+            rightRPM = (velocity + 0.5 * dw * self.wheelDistance) * 60.0 / (2 * np.pi * self.wheelRadius)
+            weight = math.hypot(leftRPM, rightRPM)
+            for (action, primitiveWeight) in zip(self.primitives.actions, self.primitives.weights.tolist()):
+                if(abs(action[0] - leftRPM) < 1e-6 and abs(action[1] - rightRPM) < 1e-6):
+                    weight = primitiveWeight
+                    break
+            cost += weight
+        if(costToCome or len(actions) == 0):
+            return cost
+        (dvx, dvy, _) = actions[-1]
+        return cost + self.Heuristic(states[-1][0], states[-1][1]) + math.hypot(dvx, dvy)
+    
+    
+    # backtrack the path from the start node to a node of the lattice
+    def Backtrack(self, index, version=None, parentVersion=None):
+        """
+        Inputs:
+        
+        index: the lattice index of the last node of the path.
+        version: optional array counting the updates of every lattice cell.
+        parentVersion: optional array with the version of the parent of every cell when it was linked to it.
+        
+        Outputs:
+        
+        backtrackStates: the path from start node to the node.
+        actions: list containing the (dvx, dvy, dw) values to move between consecutive states.
+        None is returned instead if versions are given and a cell on the path changed after its child was linked to it.
+        """
+        
+        backtrackStates = []
+        actions = []
+        while(self.lattice.parent[index] != -1):
+            parentIndex = self.lattice.parent[index]
+            if(version is not None and parentVersion[index] != version[parentIndex]):
+                return None
+            backtrackStates.append(self.lattice.State(index))
+            actions.append(self.primitives.Command(float(self.lattice.theta[parentIndex]), self.lattice.action[index]))
+            index = parentIndex
+        backtrackStates.append(self.start)
+        backtrackStates = list(reversed(backtrackStates))
+        actions = list(reversed(actions))
+        return (backtrackStates, actions)
+    
+    
+    # anytime search, see turtlebot_astar.anytime
+    def search_anytime(self, timeLimit, initialWeight=3.0, finalWeight=1.0, weightStep=0.5, callback=None, stop=None):
+        """
+        Inputs:
+        
+        timeLimit: the wall-clock budget of the search (in seconds).
+        initialWeight: the heuristic weight of the first (fast) search.
+        finalWeight: the heuristic weight of the last search.
+        weightStep: the decrease of the weight between two searches.
+        callback: optional function called with every improved solution.
+        stop: optional threading.Event which ends the search early.
+        
+        Outputs:
+        
+        Dictionary describing the best solution found (see turtlebot_astar.anytime.anytime_search).
+        """
+        
+        from turtlebot_astar.anytime import anytime_search
+        return anytime_search(self, timeLimit, initialWeight, finalWeight, weightStep, callback, stop)
+    
+    
+    # one search to several goals, see turtlebot_astar.multi_goal
+    def search_goals(self, goals, thresholds=None, count=None, stats=None, callback=None):
+        """
+        Inputs:
+        
+        goals: list of (x, y) goals.
+        thresholds: optional list with the goalThreshold of every goal (defaults to self.goalThreshold).
+        count: the number of goals after which the search stops (defaults to every goal).
+        stats: optional SearchStats object filled with counters and timers while searching.
+        callback: optional function called with the result of every goal as soon as it is reached.
+        
+        Outputs:
+        
+        List with a dictionary for every goal reached (see turtlebot_astar.multi_goal.multi_goal_search).
+        """
+        
+        from turtlebot_astar.multi_goal import multi_goal_search
+        return multi_goal_search(self, goals, thresholds, count, stats, callback)
+    
+    
+    # expand the nodes of an open list until a goal node is popped
+    def Expand(self, queue, stats=None, callback=None, callbackInterval=1000, goalTest=None):
+        """
+        Inputs:
+        
+        queue: the open list (see turtlebot_astar.priority_queue), holding lattice indices keyed by their distance.
+        stats: optional SearchStats object filled with counters and timers.
+        callback: optional function called with the SearchStats object every callbackInterval expansions.
+        callbackInterval: the number of expansions between two calls of callback.
+        goalTest: optional function of (index, state) used instead of IsGoal.
+        
+        Outputs:
+        
+        exploredStates: NodeStore of the nodes expanded (sampled by recordExplored, exploredStates.expanded counts them all).
+        backtrackIndex: the lattice index of the goal node reached, None if no goal node was reached.
+        """
+        
+        exploredStates = NodeStore(self.recordExplored)
+        backtrackIndex = None
+        steps = 0
+        weights = self.primitives.weights.tolist()
+        
+        # run A-star
+        while(len(queue) > 0):
+            
+            # get current node, skipping nodes that were already expanded
+            if(stats != None):
+                heapTime = time.perf_counter()
+                _, _, currentIndex = queue.Pop()
+                stats.heapTime += time.perf_counter() - heapTime
+                stats.heapPops += 1
+                if(self.lattice.closed[currentIndex]):
+                    stats.stalePops += 1
+                    continue
+                stats.expanded += 1
+                if(callback != None and stats.expanded % callbackInterval == 0):
+                    callback(stats)
+            else:
+                _, _, currentIndex = queue.Pop()
+                if(self.lattice.closed[currentIndex]):
+                    continue
+            self.lattice.closed[currentIndex] = True
+            currentNode = self.lattice.State(currentIndex)
+            exploredStates.Record(currentNode[0], currentNode[1], currentNode[2], self.lattice.costToCome[currentIndex], self.lattice.parent[currentIndex], self.lattice.action[currentIndex])
+            steps = steps + 1
+            
+            # if goal node then break, using the distance formula (or the given goal test)
+            if(self.IsGoal(currentNode[0], currentNode[1]) if goalTest == None else goalTest(currentIndex, currentNode)):
+                backtrackIndex = currentIndex
+                break
+               
+            # break if steps greater than maxSteps (exit when no path exists)
+            if(steps > self.maxSteps):
+                break
+
+            # traverse the edges, all the actions are rolled out together
+            (newXs, newYs, newThetas, costs, dvxs, dvys, dws, flags) = self.RolloutPrimitives(currentNode, stats)
+            for index in range(0, len(flags)):
+                if(flags[index]):
+                    newIndex = self.UpdateAction(currentIndex, weights[index], newXs[index], newYs[index], newThetas[index], index, costs[index])
+                    if(newIndex != None):
+                        if(stats != None):
+                            heapTime = time.perf_counter()
+                            queue.Push(newIndex, float(self.lattice.distance[newIndex]), float(self.lattice.costToCome[newIndex]))
+                            stats.heapTime += time.perf_counter() - heapTime
+                            stats.heapPushes += 1
+                        else:
+                            queue.Push(newIndex, float(self.lattice.distance[newIndex]), float(self.lattice.costToCome[newIndex]))
+                    elif(stats != None):
+                        stats.rejectedDuplicate += 1
+                elif(stats != None):
+                    stats.rejectedCollision += 1
+            if(stats != None):
+                stats.generated += len(flags)
+        return (exploredStates, backtrackIndex)
+    
+    
+    # expand the best batchSize nodes of an open list together until a goal node is popped first
+    def ExpandBatch(self, queue, stats=None, callback=None, callbackInterval=1000, goalTest=None, links=None):
+        """
+        Inputs:
+        
+        queue: the open list (see turtlebot_astar.priority_queue), holding lattice indices keyed by their distance.
+        stats: optional SearchStats object filled with counters and timers.
+        callback: optional function called with the SearchStats object every callbackInterval expansions.
+        callbackInterval: the number of expansions between two calls of callback.
+        goalTest: optional function of (index, state) used instead of IsGoal.
+        links: optional (version, linked) pair of dictionaries kept by the caller, so a search continued by
+               another call still skips the links made stale by the earlier calls.
+        
+        Outputs:
+        
+        exploredStates: NodeStore of the nodes expanded (sampled by recordExplored, exploredStates.expanded counts them all).
+        backtrackIndex: the lattice index of the goal node reached, None if no goal node was reached.
+        
+        Every step pops up to batchSize nodes, rolls out and collision checks their 8 arcs as one array and merges
+        the improved successors into the lattice in bulk. A goal node is only accepted when it is popped first,
+        i.e. when no open node has a smaller key; a goal popped later in a batch is pushed back. A node of the
+        batch may be expanded before a cheaper path to it is found by another node of the same batch, so a
+        closed node whose cost to come improves is reopened. With both rules the path keeps the guarantee of
+        Expand: its cost is at most weight times the cost of the best path on the lattice (plus the arc term
+        of the keys), so batches trade a few extra (re)expansions for far fewer Python calls, not path quality.
+        A reopened cell moves to the pose of its new path, so the successors linked to its old pose are skipped
+        when popped and a goal reached through them is dropped until it is reached again.
+        """
+        
+        lattice = self.lattice
+        primitives = self.primitives
+        exploredStates = NodeStore(self.recordExplored)
+        backtrackIndex = None
+        steps = 0
+        arcs = len(primitives.actions)
+        weights = primitives.weights
+        arcCosts = primitives.cost
+        
+        # version - updates of the reopened cells, linked - version of the parent when a cell was linked to a reopened cell
+        (version, linked) = links if links != None else ({}, {})
+        
+        # whether the link from a cell to its parent (or every link up to the start) still holds
+        def consistent(index, chain=False):
+            while(True):
+                parent = int(lattice.parent[index])
+                if(parent == -1):
+                    return True
+                if(linked.get(index, 0) != version.get(parent, 0)):
+                    return False
+                if(chain == False):
+                    return True
+                index = parent
+        
+        # run A-star
+        while(len(queue) > 0 and steps <= self.maxSteps):
+            
+            # pop the batch, skipping closed nodes and entries left behind by an improvement
+            if(stats != None):
+                heapTime = time.perf_counter()
+            batch = []
+            while(len(batch) < self.batchSize and len(queue) > 0):
+                (key, costToCome, currentIndex) = queue.Pop()
+                if(stats != None):
+                    stats.heapPops += 1
+                if(lattice.closed[currentIndex] or key > lattice.distance[currentIndex] or (len(version) > 0 and consistent(currentIndex) == False)):
+                    if(stats != None):
+                        stats.stalePops += 1
+                    continue
+                currentNode = lattice.State(currentIndex)
+                if(self.IsGoal(currentNode[0], currentNode[1]) if goalTest == None else goalTest(currentIndex, currentNode)):
+                    if(len(batch) > 0):
+                        queue.Push(currentIndex, key, costToCome)
+                        break
+                    if(len(version) == 0 or consistent(currentIndex, True)):
+                        backtrackIndex = currentIndex
+                        break
+                    
+                    # the path to the goal runs through a moved cell, forget the goal until it is reached again
+                    lattice.distance[currentIndex] = np.inf
+                    lattice.costToCome[currentIndex] = np.inf
+                    continue
+                lattice.closed[currentIndex] = True
+                batch.append(currentIndex)
+                exploredStates.Record(currentNode[0], currentNode[1], currentNode[2], lattice.costToCome[currentIndex], lattice.parent[currentIndex], lattice.action[currentIndex])
+            if(stats != None):
+                stats.heapTime += time.perf_counter() - heapTime
+                if(callback != None and stats.expanded // callbackInterval != (stats.expanded + len(batch)) // callbackInterval):
+                    callback(stats)
+                stats.expanded += len(batch)
+            if(backtrackIndex != None):
+                lattice.closed[backtrackIndex] = True
+                exploredStates.Record(currentNode[0], currentNode[1], currentNode[2], lattice.costToCome[backtrackIndex], lattice.parent[backtrackIndex], lattice.action[backtrackIndex])
+                if(stats != None):
+                    stats.expanded += 1
+                break
+            if(len(batch) == 0):
+                continue
+            steps = steps + len(batch)
+            
+            # roll out the arcs of every node of the batch, shape (nodes, arcs, samples)
+            if(stats != None):
+                startTime = time.perf_counter()
+            parents = np.array(batch, dtype=np.int64)
+            currX = lattice.x[parents].astype(np.float64)
+            currY = lattice.y[parents].astype(np.float64)
+            currTheta = lattice.theta[parents].astype(np.float64)
+            rotated = [primitives.Rotated(theta) for theta in currTheta.tolist()]
+            sampleX = currX[:, None, None] + np.stack([primitive[0] for primitive in rotated])
+            sampleY = currY[:, None, None] + np.stack([primitive[1] for primitive in rotated])
+            if(stats != None):
+                rolloutTime = time.perf_counter()
+                stats.rolloutTime += rolloutTime - startTime
+            if(self.collisionCheck == "swept"):
+                flags = np.stack([self.IsSweptFree((currX[row], currY[row], currTheta[row]), sampleX[row], sampleY[row]) for row in range(0, len(batch))])
+            else:
+                flags = ~np.any(~self.IsValidBatch(sampleX, sampleY) | self.IsObstacleBatch(sampleX, sampleY), axis=2)
+            if(stats != None):
+                stats.collisionTime += time.perf_counter() - rolloutTime
+                stats.generated += flags.size
+                stats.rejectedCollision += int(flags.size - np.count_nonzero(flags))
+            
+            # successors that are free, keyed like UpdateAction
+            (rows, actions) = np.nonzero(flags)
+            newX = sampleX[rows, actions, -1]
+            newY = sampleY[rows, actions, -1]
+            newTheta = currTheta[rows] + primitives.angularVelocity[actions]
+            newIndex = lattice.IndexBatch(newX, newY, newTheta)
+            newCostToCome = lattice.costToCome[parents[rows]] + weights[actions]
+            newDistance = newCostToCome + self.HeuristicBatch(newX, newY) + arcCosts[actions]
+            
+            # keep the best successor of every cell, then the ones improving an open cell or the cost to come of a closed cell
+            order = np.lexsort((newDistance, newIndex))
+            first = np.ones(len(order), dtype=bool)
+            first[1:] = newIndex[order][1:] != newIndex[order][:-1]
+            best = order[first]
+            cells = newIndex[best]
+            improved = np.where(lattice.closed[cells], newCostToCome[best] < lattice.costToCome[cells] - 1e-9, newDistance[best] < lattice.distance[cells])
+            best = best[improved]
+            cells = cells[improved]
+            if(stats != None):
+                stats.rejectedDuplicate += len(rows) - len(best)
+            
+            # merge the improvements into the lattice and reopen the closed cells among them
+            lattice.x[cells] = newX[best]
+            lattice.y[cells] = newY[best]
+            lattice.theta[cells] = newTheta[best]
+            lattice.costToCome[cells] = newCostToCome[best]
+            lattice.distance[cells] = newDistance[best]
+            lattice.parent[cells] = parents[rows[best]]
+            lattice.action[cells] = actions[best]
+            reopened = cells[lattice.closed[cells]].tolist()
+            lattice.closed[cells] = False
+            
+            # a reopened cell moves to a new pose, the links of its old successors go stale
+            for cell in reopened:
+                version[cell] = version.get(cell, 0) + 1
+            if(len(version) > 0):
+                for (cell, parent) in zip(cells.tolist(), lattice.parent[cells].tolist()):
+                    if(parent in version):
+                        linked[cell] = version[parent]
+                    else:
+                        linked.pop(cell, None)
+            if(stats != None):
+                heapTime = time.perf_counter()
+            for (cell, distance, costToCome) in zip(cells.tolist(), newDistance[best].tolist(), newCostToCome[best].tolist()):
+                queue.Push(cell, distance, costToCome)
+            if(stats != None):
+                stats.heapTime += time.perf_counter() - heapTime
+                stats.heapPushes += len(cells)
+        return (exploredStates, backtrackIndex)
+    
+    
+    # a-star algo
+    def search(self, stats=None, callback=None, callbackInterval=1000):
+        """
+        Inputs:
+        
+        stats: optional SearchStats object filled with counters and timers while searching (also kept as self.stats).
+        callback: optional function called with the SearchStats object every callbackInterval expansions.
+        callbackInterval: the number of expansions between two calls of callback.
+        
+        Outputs:
+        
+        exploredStates: NodeStore of the states explored when moving from start node to goal node (see recordExplored).
+        backtrackStates: the path from start node to goal node.
+        actions: list containing the (dvx, dvy) values for each possible node between start and goal node.
+        distance: the total distance between start node and goal node.
+        """
+        
+        # instrumentation is off unless stats or a callback are given
+        if(stats == None and callback != None):
+            stats = SearchStats()
+        self.stats = stats
+        
+        # mark source node and create a queue
+        queue = make_open_list(self.openList)
+        startIndex = self.lattice.Index(self.start[0], self.start[1], self.start[2])
+        self.lattice.Update(startIndex, self.start[0], self.start[1], self.start[2], 0, self.Heuristic(self.start[0], self.start[1]), -1, -1)
+        queue.Push(startIndex, float(self.lattice.distance[startIndex]), float(self.lattice.costToCome[startIndex]))
+        if(stats != None):
+            stats.heapPushes += 1
+        
+        # goal test with the goal shots, tried every shotInterval pops at shotRange and at every pop next to the goal
+        # a shot found for a node pushed back by ExpandBatch is kept until the node is popped again with the same pose
+        shots = {}
+        pops = [0]
+        def goalTest(index, state):
+            if(index in shots and shots[index][0] == state):
+                return True
+            shots.pop(index, None)
+            if(self.IsGoal(state[0], state[1])):
+                return True
+            distance = math.hypot(self.goal[0] - state[0], self.goal[1] - state[1])
+            if(distance > self.shotRange):
+                return False
+            pops[0] += 1
+            if(pops[0] < self.shotInterval * distance / self.shotRange):
+                return False
+            pops[0] = 0
+            if(stats != None):
+                stats.shotAttempts += 1
+            shot = self.GoalShot(state)
+            if(shot == None):
+                return False
+            shots[index] = (state, shot)
+            return True
+        
+        # run A-star
+        if(self.batchSize > 1):
+            (exploredStates, backtrackIndex) = self.ExpandBatch(queue, stats, callback, callbackInterval, goalTest if self.goalShot else None)
+        else:
+            (exploredStates, backtrackIndex) = self.Expand(queue, stats, callback, callbackInterval, goalTest if self.goalShot else None)
+        if(stats != None):
+            stats.totalTime = time.perf_counter() - stats.startTime
+        
+        # return if no optimal path
+        if(backtrackIndex == None):
+            return (exploredStates, [], [], float('inf'))
+        
+        # backtrack path
+        (backtrackStates, actions) = self.Backtrack(backtrackIndex)
+        # a path ending with a goal shot gets the key its last state would have in the lattice (cost to come,
+        # weighted heuristic and length of the last arc), the same quantity as the distance of the other paths
+        if(backtrackIndex in shots):
+            (shotStates, shotActions, shotCost) = shots[backtrackIndex][1]
+            (lastX, lastY, _) = shotStates[-1]
+            (dvx, dvy, _) = shotActions[-1]
+            distance = float(self.lattice.costToCome[backtrackIndex]) + shotCost + self.Heuristic(lastX, lastY) + math.hypot(dvx, dvy)
+            return (exploredStates, backtrackStates + shotStates[1:], actions + shotActions, distance)
+        return (exploredStates, backtrackStates, actions, float(self.lattice.distance[backtrackIndex]))
@@ -0,0 +1,152 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+# header files
+import multiprocessing
+import numpy as np
+from multiprocessing import shared_memory
+from turtlebot_astar.occupancy import OccupancyGrid
+from turtlebot_astar.query import make_planner, run_query
+
+
+# shared memory blocks attached by a worker, kept alive for the lifetime of the worker
+_attachedBlocks = []
+
+# keyword arguments passed to run_query by a worker
+_plannerOptions = {}
+
+
+# share the occupancy grids needed by a batch of queries
+def share_grids(queries, **options):
+    """
+    Inputs:
+    
+    queries: list of query dictionaries.
+    options: extra keyword arguments passed to AStar.
+    
+    Outputs:
+    
+    blocks: list of the SharedMemory blocks created (to be unlinked by the caller).
+    descriptors: list of (key, name, shape, xLength, yLength, resolution) tuples describing the shared grids.
+    """
+    
+    blocks = []
+    descriptors = []
+    builtKeys = set()
+    planners = {}
+    for query in queries:
+        
+        # one planner per clearance is enough to build every grid of the batch
+        clearance = float(query["clearance"])
+        if(clearance in planners):
+            continue
+        astar = make_planner(query, **options)
+        planners[clearance] = astar
+        # tiled grids are not copied, the workers memory map the file the parent saved
+        grid = astar.occupancyGrid
+        if(isinstance(grid, OccupancyGrid) == False):
+            continue
+        key = grid.key
+        if(key in builtKeys):
+            continue
+        builtKeys.add(key)
+        
+        # copy the grid once into shared memory
+        block = shared_memory.SharedMemory(create=True, size=max(grid.occupied.nbytes, 1))
+        shared = np.ndarray(grid.occupied.shape, dtype=grid.occupied.dtype, buffer=block.buf)
+        shared[:] = grid.occupied
+        blocks.append(block)
+        descriptors.append((key, block.name, grid.occupied.shape, grid.xLength, grid.yLength, grid.resolution))
+    return (blocks, descriptors)
+
+
+# attach the shared grids in a worker process
+def _init_worker(descriptors, options):
+    """
+    Inputs:
+    
+    descriptors: the descriptors returned by share_grids.
+    options: extra keyword arguments passed to run_query.
+    """
+    
+    _plannerOptions.update(options)
+    for (key, name, shape, xLength, yLength, resolution) in descriptors:
+        block = shared_memory.SharedMemory(name=name)
+        _attachedBlocks.append(block)
+        occupied = np.ndarray(shape, dtype=bool, buffer=block.buf)
+        occupied.flags.writeable = False
+        OccupancyGrid.cache[key] = OccupancyGrid(occupied, xLength, yLength, resolution, key)
+
+
+# plan one query in a worker process
+def _plan(task):
+    """
+    Inputs:
+    
+    task: tuple of (index, query).
+    
+    Outputs:
+    
+    The result of run_query with the index of the query added.
+    """
+    
+    (index, query) = task
+    result = run_query(query, **_plannerOptions)
+    result["index"] = index
+    return result
+
+
+# plan a batch of queries on a pool of processes
+def plan_batch(queries, processes=None, timeLimit=None, cache=None, **options):
+    """
+    Inputs:
+    
+    queries: list of query dictionaries (see turtlebot_astar.query).
+    processes: the number of worker processes (defaults to the number of cores).
+    timeLimit: optional wall-clock budget per query (in seconds), the anytime search is used when it is given.
+    cache: optional PlanCache, every worker keeps its own copy in memory (plans are shared through its sqlite file).
+    options: extra keyword arguments passed to AStar.
+    
+    Outputs:
+    
+    Generator of the results of run_query in completion order, each with the "index" of its query.
+    The inflated occupancy grids are built once and shared with the workers through shared memory.
+    """
+    
+    queries = list(queries)
+    (blocks, descriptors) = share_grids(queries, **options)
+    try:
+        pool = multiprocessing.Pool(processes, initializer=_init_worker, initargs=(descriptors, dict(options, timeLimit=timeLimit, cache=cache)))
+        try:
+            for result in pool.imap_unordered(_plan, enumerate(queries)):
+                yield result
+        finally:
+            pool.terminate()
+            pool.join()
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
@@ -0,0 +1,286 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+# header files
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+import tracemalloc
+import numpy as np
+from turtlebot_astar.query import make_planner, validate
+
+
+# catalogue of benchmark scenarios on the built-in map (ObstacleMap.Default(), queries in meters and radians)
+# settings are AStar attributes overridden before searching, a goalThreshold of 0 makes the goal unreachable
+# so the search runs until it hits maxSteps, lowered below the ~640000 nodes of the lattice around the start
+SCENARIOS = [
+    {"name": "easy_straight", "tags": ["easy"], "query": {"startX": -4.0, "startY": -4.0, "startOrientation": 0.0, "goalX": -1.0, "goalY": -4.0, "firstRPM": 50, "secondRPM": 100, "clearance": 0.1}},
+    {"name": "easy_short_turn", "tags": ["easy"], "query": {"startX": 0.0, "startY": -2.0, "startOrientation": 0.0, "goalX": 1.5, "goalY": -1.5, "firstRPM": 50, "secondRPM": 100, "clearance": 0.1}},
+    {"name": "easy_between_circles", "tags": ["easy"], "query": {"startX": 0.0, "startY": -4.0, "startOrientation": 1.57, "goalX": 0.0, "goalY": -2.0, "firstRPM": 50, "secondRPM": 100, "clearance": 0.05}},
+    {"name": "hard_around_center_circle", "tags": ["hard"], "query": {"startX": 0.0, "startY": -2.0, "startOrientation": 1.57, "goalX": 0.0, "goalY": 2.0, "firstRPM": 50, "secondRPM": 100, "clearance": 0.1}},
+    {"name": "hard_diagonal", "tags": ["hard"], "query": {"startX": -4.0, "startY": -4.0, "startOrientation": 0.0, "goalX": 4.0, "goalY": 4.0, "firstRPM": 50, "secondRPM": 100, "clearance": 0.1}},
+    {"name": "hard_past_squares", "tags": ["hard"], "query": {"startX": -4.0, "startY": 3.0, "startOrientation": 1.57, "goalX": 4.0, "goalY": -3.0, "firstRPM": 100, "secondRPM": 50, "clearance": 0.0}},
+    {"name": "rpm_slow", "tags": ["hard", "rpm"], "query": {"startX": -4.0, "startY": -4.0, "startOrientation": 0.0, "goalX": 4.0, "goalY": 4.0, "firstRPM": 30, "secondRPM": 60, "clearance": 0.05}},
+    {"name": "rpm_fast", "tags": ["hard", "rpm"], "query": {"startX": -4.0, "startY": 2.0, "startOrientation": 0.0, "goalX": 4.0, "goalY": 2.0, "firstRPM": 80, "secondRPM": 120, "clearance": 0.1}},
+    {"name": "clearance_large", "tags": ["hard", "clearance"], "query": {"startX": 0.0, "startY": -4.0, "startOrientation": 1.57, "goalX": 0.0, "goalY": 4.0, "firstRPM": 50, "secondRPM": 100, "clearance": 0.3}},
+    {"name": "unreachable_goal", "tags": ["unreachable"], "settings": {"goalThreshold": 0, "maxSteps": 50000}, "query": {"startX": -4.0, "startY": -4.0, "startOrientation": 0.0, "goalX": -1.0, "goalY": -4.0, "firstRPM": 50, "secondRPM": 100, "clearance": 0.1}},
+]
+
+# metrics where a larger value is a regression, and where a smaller value is a regression
+LARGER_IS_WORSE = ("wall_time", "peak_memory", "cost")
+SMALLER_IS_WORSE = ("expansions_per_second",)
+
+
+# search once for a scenario
+def _search(scenario, options):
+    """
+    Inputs:
+    
+    scenario: the scenario dictionary.
+    options: extra keyword arguments passed to AStar.
+    
+    Outputs:
+    
+    exploredStates, backtrackStates, actions and distance returned by AStar.search, the search time (in seconds)
+    and the maxSteps of the search.
+    """
+    
+    astar = make_planner(scenario["query"], **options)
+    status = validate(astar)
+    if(status != None):
+        raise ValueError("scenario " + scenario["name"] + " can not be planned: " + status)
+    for (name, value) in scenario.get("settings", {}).items():
+        setattr(astar, name, value)
+    
+    startTime = time.perf_counter()
+    (exploredStates, backtrackStates, actions, distance) = astar.search()
+    return (exploredStates, backtrackStates, actions, distance, time.perf_counter() - startTime, astar.maxSteps)
+
+
+# run a benchmark scenario
+def run_scenario(scenario, repeat=3, memory=True, **options):
+    """
+    Inputs:
+    
+    scenario: the scenario dictionary (see SCENARIOS).
+    repeat: the number of timed searches, the fastest one is reported.
+    memory: whether to run one more search under tracemalloc to measure the peak memory.
+    options: extra keyword arguments passed to AStar.
+    
+    Outputs:
+    
+    Dictionary with the wall time (in seconds), the expanded nodes, the expansions per second, the peak
+    memory (in bytes, None when not measured), the path cost and the path length (in cms, None without a path),
+    and whether the search stopped at maxSteps without a path.
+    """
+    
+    times = []
+    for index in range(0, repeat):
+        (exploredStates, backtrackStates, actions, distance, searchTime, maxSteps) = _search(scenario, options)
+        times.append(searchTime)
+    wallTime = min(times)
+    
+    peakMemory = None
+    if(memory):
+        tracemalloc.start()
+        try:
+            _search(scenario, options)
+            peakMemory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    
+    # every action is followed for 1 s, so its length is the magnitude of its velocity
+    found = len(backtrackStates) > 0
+    pathLength = sum(math.sqrt(dvx * dvx + dvy * dvy) for (dvx, dvy, dw) in actions) if found else None
+    return {
+        "wall_time": wallTime,
+        "expanded": exploredStates.expanded,
+        "expansions_per_second": exploredStates.expanded / wallTime if wallTime > 0 else float("inf"),
+        "peak_memory": peakMemory,
+        "cost": distance if found else None,
+        "path_length": pathLength,
+        "path_states": len(backtrackStates),
+        "max_steps_hit": found == False and exploredStates.expanded >= maxSteps,
+    }
+
+
+# run a set of scenarios
+def run_suite(scenarios=None, repeat=3, memory=True, report=None, **options):
+    """
+    Inputs:
+    
+    scenarios: list of scenario dictionaries (defaults to SCENARIOS).
+    repeat: the number of timed searches per scenario.
+    memory: whether to measure the peak memory.
+    report: optional function called with (name, metrics) after every scenario.
+    options: extra keyword arguments passed to AStar.
+    
+    Outputs:
+    
+    Dictionary of the metrics of every scenario keyed by its name.
+    """
+    
+    results = {}
+    for scenario in (SCENARIOS if scenarios == None else scenarios):
+        results[scenario["name"]] = run_scenario(scenario, repeat, memory, **options)
+        if(report != None):
+            report(scenario["name"], results[scenario["name"]])
+    return results
+
+
+# compare results with a baseline
+def compare(results, baseline, threshold=0.2):
+    """
+    Inputs:
+    
+    results: the metrics returned by run_suite.
+    baseline: the metrics of the baseline, keyed by scenario name.
+    threshold: the relative change beyond which a metric is flagged (0.2 means 20%).
+    
+    Outputs:
+    
+    List of (scenario, metric, baseline value, new value) tuples for every regression.
+    """
+    
+    regressions = []
+    for (name, metrics) in results.items():
+        if(name not in baseline):
+            continue
+        for (metric, value) in metrics.items():
+            base = baseline[name].get(metric)
+            if(base == None or value == None):
+                continue
+            if(metric in LARGER_IS_WORSE and value > base * (1.0 + threshold)):
+                regressions.append((name, metric, base, value))
+            elif(metric in SMALLER_IS_WORSE and value < base * (1.0 - threshold)):
+                regressions.append((name, metric, base, value))
+        if(metrics["cost"] == None and baseline[name].get("cost") != None):
+            regressions.append((name, "cost", baseline[name]["cost"], None))
+    return regressions
+
+
+# save results as a baseline file
+def save_baseline(results, path):
+    """
+    Inputs:
+    
+    results: the metrics returned by run_suite.
+    path: the path of the JSON baseline file.
+    """
+    
+    baseline = {
+        "environment": {"python": platform.python_version(), "numpy": np.__version__, "machine": platform.machine(), "platform": platform.platform()},
+        "scenarios": results,
+    }
+    with open(path, "w") as baselineFile:
+        json.dump(baseline, baselineFile, indent=2, sort_keys=True)
+        baselineFile.write("\n")
+
+
+# load a baseline file
+def load_baseline(path):
+    """
+    Inputs:
+    
+    path: the path of the JSON baseline file.
+    
+    Outputs:
+    
+    The metrics of the baseline, keyed by scenario name.
+    """
+    
+    with open(path) as baselineFile:
+        return json.load(baselineFile)["scenarios"]
+
+
+# command line entry point, "python -m turtlebot_astar.benchmark"
+def main(argv=None):
+    """
+    Inputs:
+    
+    argv: list of command line arguments (defaults to sys.argv[1:]).
+    
+    Outputs:
+    
+    The exit code: 1 if a regression was found, 0 otherwise.
+    """
+    
+    parser = argparse.ArgumentParser(prog="turtlebot_astar.benchmark", description="Benchmark AStar.search on a fixed set of scenarios.")
+    parser.add_argument("--scenarios", nargs="+", help="names of the scenarios to run (defaults to all)")
+    parser.add_argument("--tags", nargs="+", help="only run the scenarios with one of these tags (easy, hard, rpm, clearance, unreachable)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed searches per scenario, the fastest one is reported")
+    parser.add_argument("--no-memory", action="store_true", help="skip the peak memory measurement")
+    parser.add_argument("--baseline", default="benchmark_baseline.json", help="the baseline file")
+    parser.add_argument("--save-baseline", action="store_true", help="write the results to the baseline file")
+    parser.add_argument("--threshold", type=float, default=0.2, help="relative change flagged as a regression")
+    parser.add_argument("--open-list", choices=("heapq", "indexed"), default="heapq", help="the open list used by AStar.search")
+    parser.add_argument("--collision-check", choices=("grid", "analytic", "distance", "swept", "tiled"), default="grid", help="the collision checks used by AStar.search")
+    parser.add_argument("--heuristic", choices=("euclidean", "distance_field"), default="euclidean", help="the heuristic used by AStar.search")
+    parser.add_argument("--batch-size", type=int, default=1, help="the number of open nodes AStar.search expands together")
+    parser.add_argument("--goal-shot", action="store_true", help="let AStar.search end with an analytic connection to the goal")
+    args = parser.parse_args(argv)
+    
+    scenarios = SCENARIOS
+    if(args.scenarios != None):
+        unknown = set(args.scenarios) - set(scenario["name"] for scenario in SCENARIOS)
+        if(len(unknown) > 0):
+            parser.error("unknown scenarios: " + ", ".join(sorted(unknown)))
+        scenarios = [scenario for scenario in scenarios if scenario["name"] in args.scenarios]
+    if(args.tags != None):
+        scenarios = [scenario for scenario in scenarios if len(set(scenario["tags"]) & set(args.tags)) > 0]
+    
+    # print the metrics of a scenario as soon as it finishes
+    def report(name, metrics):
+        memory = "-" if metrics["peak_memory"] == None else "%.1f MB" % (metrics["peak_memory"] / 1e6)
+        cost = ("max steps" if metrics["max_steps_hit"] else "no path") if metrics["cost"] == None else "%.1f" % metrics["cost"]
+        length = "-" if metrics["path_length"] == None else "%.1f cm" % metrics["path_length"]
+        print("%-28s %9.3f s %8d expanded %10.0f exp/s %10s  cost %-9s length %s" % (name, metrics["wall_time"], metrics["expanded"], metrics["expansions_per_second"], memory, cost, length))
+        sys.stdout.flush()
+    
+    results = run_suite(scenarios, args.repeat, not args.no_memory, report, openList=args.open_list, heuristic=args.heuristic, collisionCheck=args.collision_check, batchSize=args.batch_size, goalShot=args.goal_shot)
+    if(args.save_baseline):
+        save_baseline(results, args.baseline)
+        print("\nBaseline saved to " + args.baseline)
+        return 0
+    
+    try:
+        baseline = load_baseline(args.baseline)
+    except IOError:
+        print("\nNo baseline at " + args.baseline + ", run with --save-baseline to create one.")
+        return 0
+    regressions = compare(results, baseline, args.threshold)
+    for (name, metric, base, value) in regressions:
+        print("REGRESSION %s %s: %s -> %s" % (name, metric, base, value))
+    if(len(regressions) == 0):
+        print("\nNo regressions beyond %.0f%% of the baseline." % (args.threshold * 100))
+    return 1 if len(regressions) > 0 else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,119 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+# header files
+import argparse
+import json
+import sys
+from turtlebot_astar.batch import plan_batch
+from turtlebot_astar.obstacles import load_map
+from turtlebot_astar.plan_cache import PlanCache
+from turtlebot_astar.query import QUERY_FIELDS, load_queries, run_query
+
+
+# parse the command line arguments
+def parse_args(argv=None):
+    """
+    Inputs:
+    
+    argv: list of command line arguments (defaults to sys.argv[1:]).
+    
+    Outputs:
+    
+    The parsed arguments.
+    """
+    
+    parser = argparse.ArgumentParser(prog="turtlebot_astar", description="Plan paths for the turtlebot with A-star without ROS.")
+    parser.add_argument("--start", nargs=3, type=float, metavar=("X", "Y", "THETA"), help="start node (in m, m, rad)")
+    parser.add_argument("--goal", nargs=2, type=float, metavar=("X", "Y"), help="goal node (in m)")
+    parser.add_argument("--rpm", nargs=2, type=float, metavar=("FIRST", "SECOND"), help="the two values of RPM of the wheels")
+    parser.add_argument("--clearance", type=float, default=0.0, help="clearance of the robot (in m)")
+    parser.add_argument("--queries", help="JSON, JSON lines or CSV file of queries with the fields " + ", ".join(QUERY_FIELDS))
+    parser.add_argument("--output", help="file the results are written to (defaults to stdout)")
+    parser.add_argument("--time-limit", type=float, help="wall-clock budget per query (in seconds), uses the anytime search")
+    parser.add_argument("--processes", type=int, default=1, help="number of worker processes, results are then written in completion order")
+    parser.add_argument("--map", help="gazebo world (.world, .sdf), JSON or YAML file of the obstacles (defaults to the built-in map of the original project, the obstacles of world/map.json)")
+    parser.add_argument("--cache", help="sqlite file of the plans already found, looked up before searching")
+    parser.add_argument("--heuristic", choices=("euclidean", "distance_field"), default="euclidean", help="the heuristic used by the search")
+    parser.add_argument("--batch-size", type=int, default=1, help="the number of open nodes expanded together by the search")
+    parser.add_argument("--goal-shot", action="store_true", help="end the search with a turn and a straight line to the goal once one is collision free")
+    parser.add_argument("--format", choices=("jsonl", "json"), default="jsonl", help="one JSON object per line or a single JSON list")
+    args = parser.parse_args(argv)
+    if(args.queries == None and (args.start == None or args.goal == None or args.rpm == None)):
+        parser.error("either --queries or all of --start, --goal and --rpm are required")
+    return args
+
+
+# command line entry point
+def main(argv=None):
+    """
+    Inputs:
+    
+    argv: list of command line arguments (defaults to sys.argv[1:]).
+    
+    Outputs:
+    
+    The exit code: 0 if a path was found for every query, 1 otherwise.
+    """
+    
+    args = parse_args(argv)
+    if(args.queries != None):
+        queries = load_queries(args.queries)
+    else:
+        queries = [dict(zip(QUERY_FIELDS, args.start + args.goal + args.rpm + [args.clearance]))]
+    
+    options = {"heuristic": args.heuristic}
+    if(args.batch_size > 1):
+        options["batchSize"] = args.batch_size
+    if(args.goal_shot):
+        options["goalShot"] = True
+    if(args.map != None):
+        options["obstacleMap"] = load_map(args.map)
+    if(args.cache != None):
+        options["cache"] = PlanCache(path=args.cache)
+    
+    output = sys.stdout if args.output == None else open(args.output, "w")
+    results = []
+    allFound = True
+    try:
+        if(args.processes > 1):
+            planned = plan_batch(queries, args.processes, timeLimit=args.time_limit, **options)
+        else:
+            planned = (run_query(query, args.time_limit, **options) for query in queries)
+        for result in planned:
+            allFound = allFound and result["status"] == "found"
+            if(args.format == "jsonl"):
+                output.write(json.dumps(result) + "\n")
+                output.flush()
+            else:
+                results.append(result)
+        if(args.format == "json"):
+            json.dump(results, output, indent=2)
+            output.write("\n")
+    finally:
+        if(output != sys.stdout):
+            output.close()
+    return 0 if allFound else 1
@@ -0,0 +1,206 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+
+
+# header files
+import math
+import time
+import threading
+
+
+# merge consecutive actions with the same linear and angular velocity into longer commands
+def coalesce_actions(actions, actionDuration=1.0, tolerance=1e-6):
+    """
+    Inputs:
+    
+    actions: list containing the (dvx, dvy, dw) values of the actions of a path.
+    actionDuration: the time (in seconds) during which one action is applied.
+    tolerance: the largest velocity difference of two actions merged into one command.
+    
+    Outputs:
+    
+    List of (velocity, angularVelocity, duration, count) commands, count is the number of actions merged
+    """
+    
+    commands = []
+    for (dvx, dvy, dw) in actions:
+        velocity = math.sqrt(dvx * dvx + dvy * dvy)
+        if(len(commands) > 0 and abs(commands[-1][0] - velocity) <= tolerance and abs(commands[-1][1] - dw) <= tolerance):
+            (lastVelocity, lastAngularVelocity, duration, count) = commands[-1]
+            commands[-1] = (lastVelocity, lastAngularVelocity, duration + actionDuration, count + 1)
+        else:
+            commands.append((velocity, dw, actionDuration, 1))
+    return commands
+
+
+# in-process stand-in for the ROS publisher, records the commands instead of driving a robot
+class RecordingPublisher(object):
+    
+    # init function
+    def __init__(self, realTime=False):
+        """
+        Inputs:
+        
+        realTime: sleep for the duration of every command, like the robot would take to drive it.
+        """
+        
+        self.realTime = realTime
+        self.commands = []
+        self.stopped = False
+    
+    # record a velocity command
+    def Send(self, velocity, angularVelocity, duration):
+        self.commands.append((velocity, angularVelocity, duration))
+        if(self.realTime):
+            time.sleep(duration)
+    
+    # record the stop of the robot
+    def Stop(self):
+        self.stopped = True
+
+
+# drive the robot along the path of an anytime search while the search keeps running
+class Executor(object):
+    
+    # init function
+    def __init__(self, astar, publisher, timeLimit, allowPartial=False, actionDuration=1.0, **options):
+        """
+        Inputs:
+        
+        astar: the AStar object (its lattice must not have been searched yet).
+        publisher: object with Send(velocity, angularVelocity, duration) and Stop() methods (RosPublisher or RecordingPublisher).
+        timeLimit: the wall-clock budget of the search (in seconds).
+        allowPartial: drive along the path towards the node closest to the goal when no path was found.
+        actionDuration: the time (in seconds) during which one action is applied.
+        options: keyword arguments of AStar.search_anytime (initialWeight, finalWeight, weightStep).
+        """
+        
+        self.astar = astar
+        self.publisher = publisher
+        self.timeLimit = timeLimit
+        self.allowPartial = allowPartial
+        self.actionDuration = actionDuration
+        self.options = options
+        self.condition = threading.Condition()
+        self.stop = threading.Event()
+        self.solution = None
+        self.result = None
+    
+    # planner thread, publish every improved solution to the driving thread
+    def Plan(self):
+        try:
+            self.result = self.astar.search_anytime(self.timeLimit, callback=self.Improve, stop=self.stop, **self.options)
+        finally:
+            with self.condition:
+                if(self.result == None):
+                    self.result = {"states": [], "actions": [], "cost": float("inf"), "partial": False}
+                self.condition.notify_all()
+    
+    # callback of the anytime search
+    def Improve(self, solution):
+        with self.condition:
+            self.solution = solution
+            self.condition.notify_all()
+    
+    # true if the actions of a solution start with the actions already driven
+    @staticmethod
+    def Follows(actions, executed, tolerance=1e-6):
+        if(len(actions) < len(executed)):
+            return False
+        for (action, done) in zip(actions, executed):
+            if(max(abs(action[0] - done[0]), abs(action[1] - done[1]), abs(action[2] - done[2])) > tolerance):
+                return False
+        return True
+    
+    # plan and drive
+    def Run(self):
+        """
+        Outputs:
+        
+        Dictionary with
+            status: "done" (goal reached), "partial" (drove towards the goal without a path), "timeout" (no path was
+                    found before the deadline) or "no_path" (the search proved that there is no path).
+            actions: list containing the (dvx, dvy, dw) values of the actions driven.
+            commands: the number of commands sent to the publisher.
+            cost: the cost of the solution that was driven (inf for a partial path).
+            bound: the suboptimality bound of that solution.
+            timeToFirstMotion: the time (in seconds) between the start of the search and the first command (None if the robot never moved).
+            missionTime: the time (in seconds) between the start of the search and the end of the last command.
+        
+        The search runs in a background thread. As soon as it finds its first path the robot starts driving it,
+        one coalesced command at a time; before every command the executor switches to the newest solution if it
+        begins with the actions already driven, so the committed prefix is never undone. The search is stopped
+        once the robot reaches the goal.
+        """
+        
+        startTime = time.perf_counter()
+        planner = threading.Thread(target=self.Plan)
+        planner.daemon = True
+        planner.start()
+        
+        executed = []
+        current = None
+        commands = 0
+        timeToFirstMotion = None
+        status = "no_path"
+        try:
+            while(True):
+                
+                # wait for a path, or for the planner to give up
+                with self.condition:
+                    while(self.solution == None and self.result == None):
+                        self.condition.wait()
+                    latest = self.solution
+                    if(latest == None and self.allowPartial and len(self.result["actions"]) > 0):
+                        latest = self.result
+                if(latest == None):
+                    
+                    # a search stopped by its deadline has not proved that there is no path
+                    if(self.result.get("partial", False)):
+                        status = "timeout"
+                    break
+                
+                # follow the newest solution if it keeps the committed prefix
+                if(current == None or (latest is not current and self.Follows(latest["actions"], executed))):
+                    current = latest
+                remaining = current["actions"][len(executed):]
+                if(len(remaining) == 0):
+                    status = "partial" if current.get("partial", False) else "done"
+                    break
+                
+                # drive the next run of identical actions as one command
+                (velocity, angularVelocity, duration, count) = coalesce_actions(remaining, self.actionDuration)[0]
+                if(timeToFirstMotion == None):
+                    timeToFirstMotion = time.perf_counter() - startTime
+                self.publisher.Send(velocity, angularVelocity, duration)
+                executed.extend(remaining[:count])
+                commands = commands + 1
+        finally:
+            self.stop.set()
+            self.publisher.Stop()
+        
+        return {"status": status, "actions": executed, "commands": commands, "cost": current["cost"] if current != None and status == "done" else float("inf"), "bound": current.get("bound", float("inf")) if current != None else float("inf"), "timeToFirstMotion": timeToFirstMotion, "missionTime": time.perf_counter() - startTime}
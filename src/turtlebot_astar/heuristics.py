@@ -0,0 +1,158 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+# header files
+import math
+import numpy as np
+from heapq import heappush, heappop
+
+
+# class for the distance to the goal around the obstacles, computed once per goal
+class DistanceField(object):
+    
+    # fields already computed, keyed by (grid key, goal cell, resolution)
+    cache = {}
+    
+    # maximum number of cached fields
+    cacheSize = 64
+    
+    # init function
+    def __init__(self, distance, xLength, yLength, resolution):
+        """
+        Inputs:
+        
+        distance: numpy array of shape (nx, ny), the length of the shortest obstacle free path from every cell to the goal (inf when unreachable).
+        xLength: half of the map size along x-direction (map spans -xLength to xLength).
+        yLength: half of the map size along y-direction (map spans -yLength to yLength).
+        resolution: the side of a cell (in cms).
+        """
+        
+        self.distance = distance
+        self.xLength = xLength
+        self.yLength = yLength
+        self.resolution = float(resolution)
+        (self.xCells, self.yCells) = distance.shape
+        
+        # slack - the largest distance between a point and the center of its cell, subtracted to never overestimate
+        self.slack = 0.7072 * self.resolution
+    
+    
+    # build (or fetch from cache) the field of a goal
+    @classmethod
+    def Build(cls, grid, goal, resolution=5.0):
+        """
+        Inputs:
+        
+        grid: the OccupancyGrid of the inflated obstacle space.
+        goal: the goal coordinate, tuple of form (x, y).
+        resolution: the side of a cell of the field (in cms).
+        
+        Outputs:
+        
+        DistanceField object. A cell of the field is free if any cell of the grid inside it is free, and the
+        distances are found with dijkstra over the 8-connected cells starting from the cell of the goal.
+        """
+        
+        xCells = int(math.ceil(2.0 * grid.xLength / resolution))
+        yCells = int(math.ceil(2.0 * grid.yLength / resolution))
+        goalX = min(max(int((goal[0] + grid.xLength) // resolution), 0), xCells - 1)
+        goalY = min(max(int((goal[1] + grid.yLength) // resolution), 0), yCells - 1)
+        key = (grid.key if grid.key != None else id(grid), goalX, goalY, resolution)
+        field = cls.cache.get(key)
+        if(field != None):
+            return field
+        
+        # coarse free space, optimistic so that the field never blocks a path of the robot
+        factor = max(int(round(resolution / grid.resolution)), 1)
+        padX = xCells * factor - grid.xCells
+        padY = yCells * factor - grid.yCells
+        occupied = np.pad(grid.occupied, ((0, max(padX, 0)), (0, max(padY, 0))), constant_values=True)[:xCells * factor, :yCells * factor]
+        free = ~occupied.reshape(xCells, factor, yCells, factor).all(axis=(1, 3))
+        
+        # dijkstra from the goal cell
+        distance = np.full((xCells, yCells), np.inf)
+        distanceList = distance.tolist()
+        freeList = free.tolist()
+        distanceList[goalX][goalY] = 0.0
+        queue = [(0.0, goalX, goalY)]
+        steps = [(1, 0, resolution), (-1, 0, resolution), (0, 1, resolution), (0, -1, resolution),
+                 (1, 1, 1.4142 * resolution), (1, -1, 1.4142 * resolution), (-1, 1, 1.4142 * resolution), (-1, -1, 1.4142 * resolution)]
+        while(len(queue) > 0):
+            (cost, cellX, cellY) = heappop(queue)
+            if(cost > distanceList[cellX][cellY]):
+                continue
+            for (stepX, stepY, stepCost) in steps:
+                nextX = cellX + stepX
+                nextY = cellY + stepY
+                if(nextX < 0 or nextY < 0 or nextX >= xCells or nextY >= yCells or freeList[nextX][nextY] == False):
+                    continue
+                nextCost = cost + stepCost
+                if(nextCost < distanceList[nextX][nextY]):
+                    distanceList[nextX][nextY] = nextCost
+                    heappush(queue, (nextCost, nextX, nextY))
+        distance = np.array(distanceList)
+        
+        field = cls(distance, grid.xLength, grid.yLength, resolution)
+        if(len(cls.cache) >= cls.cacheSize):
+            cls.cache.pop(next(iter(cls.cache)))
+        cls.cache[key] = field
+        return field
+    
+    
+    # distance from a position to the goal around the obstacles
+    def Distance(self, x, y):
+        """
+        Inputs:
+        
+        x: the x-position.
+        y: the y-position.
+        
+        Outputs:
+        
+        The distance to the goal of the cell holding the position, reduced by the slack of the cell (inf when unreachable).
+        """
+        
+        indexX = min(max(int((x + self.xLength) // self.resolution), 0), self.xCells - 1)
+        indexY = min(max(int((y + self.yLength) // self.resolution), 0), self.yCells - 1)
+        return self.distance[indexX, indexY] - self.slack
+    
+    
+    # distances from a batch of positions to the goal around the obstacles
+    def DistanceBatch(self, x, y):
+        """
+        Inputs:
+        
+        x: array of x-positions.
+        y: array of y-positions.
+        
+        Outputs:
+        
+        Array of the distances to the goal of the cells holding the positions, reduced by the slack of the cells.
+        """
+        
+        indexX = np.clip(((np.asarray(x) + self.xLength) // self.resolution).astype(np.int64), 0, self.xCells - 1)
+        indexY = np.clip(((np.asarray(y) + self.yLength) // self.resolution).astype(np.int64), 0, self.yCells - 1)
+        return self.distance[indexX, indexY] - self.slack
@@ -0,0 +1,305 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+
+
+# header files
+import math
+import numpy as np
+from heapq import heappush, heappop
+from turtlebot_astar.heuristics import DistanceField
+from turtlebot_astar.occupancy import OccupancyGrid
+
+
+# region of the map the fine search is kept in, a mask over the cells of a coarse grid
+class Corridor(object):
+    
+    # init function
+    def __init__(self, inside, xLength, yLength, resolution):
+        """
+        Inputs:
+        
+        inside: boolean numpy array of shape (xCells, yCells), True for the cells of the corridor.
+        xLength: half of the map size along x-direction (map spans -xLength to xLength).
+        yLength: half of the map size along y-direction (map spans -yLength to yLength).
+        resolution: the side of a cell (in cms).
+        """
+        
+        self.inside = inside
+        self.xLength = xLength
+        self.yLength = yLength
+        self.resolution = float(resolution)
+        (self.xCells, self.yCells) = inside.shape
+    
+    
+    # corridor made of the cells within width of a path of cells
+    @classmethod
+    def Around(cls, cells, grid, width):
+        """
+        Inputs:
+        
+        cells: list of (indexX, indexY) cells of the path.
+        grid: the coarse OccupancyGrid the cells belong to.
+        width: the half width of the corridor (in cms).
+        
+        Outputs:
+        
+        Corridor object holding every cell within width of a cell of the path (square neighborhoods).
+        """
+        
+        inside = np.zeros((grid.xCells, grid.yCells), dtype=bool)
+        reach = int(math.ceil(width / grid.resolution))
+        for (indexX, indexY) in cells:
+            inside[max(indexX - reach, 0):indexX + reach + 1, max(indexY - reach, 0):indexY + reach + 1] = True
+        return cls(inside, grid.xLength, grid.yLength, grid.resolution)
+    
+    
+    # whether a position lies in the corridor
+    def Contains(self, x, y):
+        indexX = int(math.floor((x + self.xLength) / self.resolution))
+        indexY = int(math.floor((y + self.yLength) / self.resolution))
+        if(indexX < 0 or indexY < 0 or indexX >= self.xCells or indexY >= self.yCells):
+            return False
+        return bool(self.inside[indexX, indexY])
+    
+    
+    # whether a batch of positions lie in the corridor
+    def ContainsBatch(self, x, y):
+        indexX = np.floor((np.asarray(x) + self.xLength) / self.resolution).astype(np.int64)
+        indexY = np.floor((np.asarray(y) + self.yLength) / self.resolution).astype(np.int64)
+        inGrid = (indexX >= 0) & (indexY >= 0) & (indexX < self.xCells) & (indexY < self.yCells)
+        flat = np.clip(indexX, 0, self.xCells - 1) * self.yCells + np.clip(indexY, 0, self.yCells - 1)
+        return np.take(self.inside.reshape(-1), flat) & inGrid
+    
+    
+    # area of the corridor (in square cms)
+    def Area(self):
+        return float(np.count_nonzero(self.inside)) * self.resolution * self.resolution
+
+
+# coarse 2D grid of a map, a cell is blocked when its center lies in the inflated obstacle space
+def coarse_grid(obstacleMap, clearance, radius, resolution=20.0):
+    """
+    Inputs:
+    
+    obstacleMap: the ObstacleMap of the planner.
+    clearance: the clearance that the robot needs to have with the obstacles.
+    radius: the radius of the robot.
+    resolution: the side of a cell (in cms).
+    
+    Outputs:
+    
+    OccupancyGrid object. Unlike OccupancyGrid.Build the cells are tested at their centers only, so passages
+    narrower than a cell are not closed by the coarse grid.
+    """
+    
+    xCells = int(math.ceil(2.0 * obstacleMap.xLength / resolution))
+    yCells = int(math.ceil(2.0 * obstacleMap.yLength / resolution))
+    occupied = obstacleMap.Rasterize(xCells, yCells, resolution, clearance, radius)
+    return OccupancyGrid(occupied, obstacleMap.xLength, obstacleMap.yLength, resolution)
+
+
+# shortest 8-connected path between two positions over the free cells of a coarse grid
+def coarse_path(grid, start, goal):
+    """
+    Inputs:
+    
+    grid: the coarse OccupancyGrid.
+    start: the start position (x, y).
+    goal: the goal position (x, y).
+    
+    Outputs:
+    
+    List of the (indexX, indexY) cells from the start to the goal (the cells of the start and the goal count as
+    free), None if the goal cannot be reached.
+    """
+    
+    def cell(position):
+        return (min(max(int((position[0] + grid.xLength) // grid.resolution), 0), grid.xCells - 1),
+                min(max(int((position[1] + grid.yLength) // grid.resolution), 0), grid.yCells - 1))
+    
+    (startCell, goalCell) = (cell(start), cell(goal))
+    occupied = grid.occupied
+    steps = [(1, 0, 1.0), (-1, 0, 1.0), (0, 1, 1.0), (0, -1, 1.0), (1, 1, 1.4142), (1, -1, 1.4142), (-1, 1, 1.4142), (-1, -1, 1.4142)]
+    
+    # a-star over the cells with the octile distance as heuristic
+    def heuristic(indexX, indexY):
+        dx = abs(indexX - goalCell[0])
+        dy = abs(indexY - goalCell[1])
+        return max(dx, dy) + 0.4142 * min(dx, dy)
+    
+    costs = {startCell: 0.0}
+    parents = {startCell: None}
+    queue = [(heuristic(*startCell), 0.0, startCell)]
+    while(len(queue) > 0):
+        (_, cost, current) = heappop(queue)
+        if(current == goalCell):
+            path = []
+            while(current != None):
+                path.append(current)
+                current = parents[current]
+            return list(reversed(path))
+        if(cost > costs[current]):
+            continue
+        for (stepX, stepY, stepCost) in steps:
+            nextX = current[0] + stepX
+            nextY = current[1] + stepY
+            if(nextX < 0 or nextY < 0 or nextX >= grid.xCells or nextY >= grid.yCells):
+                continue
+            if(occupied[nextX, nextY] and (nextX, nextY) != goalCell):
+                continue
+            nextCost = cost + stepCost
+            if(nextCost < costs.get((nextX, nextY), float("inf"))):
+                costs[(nextX, nextY)] = nextCost
+                parents[(nextX, nextY)] = current
+                heappush(queue, (nextCost + heuristic(nextX, nextY), nextCost, (nextX, nextY)))
+    return None
+
+
+# distance to the goal through the cells of a corridor, used as the heuristic of the search in the corridor
+def corridor_field(corridor, goal):
+    """
+    Inputs:
+    
+    corridor: the Corridor object.
+    goal: the goal position (x, y).
+    
+    Outputs:
+    
+    DistanceField object holding the length of the shortest 8-connected path from every cell of the corridor to
+    the cell of the goal (inf outside the corridor). The obstacles inside the corridor are ignored, so the field
+    never blocks a state the search may reach, and dijkstra only visits the cells of the corridor.
+    """
+    
+    resolution = corridor.resolution
+    goalX = min(max(int((goal[0] + corridor.xLength) // resolution), 0), corridor.xCells - 1)
+    goalY = min(max(int((goal[1] + corridor.yLength) // resolution), 0), corridor.yCells - 1)
+    distance = np.full((corridor.xCells, corridor.yCells), np.inf)
+    inside = corridor.inside
+    steps = [(1, 0, resolution), (-1, 0, resolution), (0, 1, resolution), (0, -1, resolution),
+             (1, 1, 1.4142 * resolution), (1, -1, 1.4142 * resolution), (-1, 1, 1.4142 * resolution), (-1, -1, 1.4142 * resolution)]
+    
+    # dijkstra from the goal cell, the distances of the visited cells are kept in a dictionary
+    costs = {(goalX, goalY): 0.0}
+    queue = [(0.0, goalX, goalY)]
+    while(len(queue) > 0):
+        (cost, cellX, cellY) = heappop(queue)
+        if(cost > costs[(cellX, cellY)]):
+            continue
+        distance[cellX, cellY] = cost
+        for (stepX, stepY, stepCost) in steps:
+            nextX = cellX + stepX
+            nextY = cellY + stepY
+            if(nextX < 0 or nextY < 0 or nextX >= corridor.xCells or nextY >= corridor.yCells or inside[nextX, nextY] == False):
+                continue
+            nextCost = cost + stepCost
+            if(nextCost < costs.get((nextX, nextY), float("inf"))):
+                costs[(nextX, nextY)] = nextCost
+                heappush(queue, (nextCost, nextX, nextY))
+    return DistanceField(distance, corridor.xLength, corridor.yLength, resolution)
+
+
+# two level planner: a coarse grid path gives a corridor, the search of an AStar object is kept inside it
+class HierarchicalPlanner(object):
+    
+    # init function
+    def __init__(self, astar, coarseResolution=20.0, corridorWidth=60.0, widening=2.0, attempts=3):
+        """
+        Inputs:
+        
+        astar: the AStar object (latticeStorage="sparse" keeps the memory proportional to the corridor).
+        coarseResolution: the side of a cell (in cms) of the coarse grid.
+        corridorWidth: the half width (in cms) of the first corridor around the coarse path.
+        widening: the factor the half width is multiplied by after a search fails in the corridor.
+        attempts: the number of corridors tried before the whole map is searched.
+        """
+        
+        self.astar = astar
+        self.coarseResolution = coarseResolution
+        self.corridorWidth = corridorWidth
+        self.widening = widening
+        self.attempts = attempts
+        self.width = corridorWidth
+        
+        # grid - the coarse grid of the map, corridor - the corridor of the last search
+        self.grid = coarse_grid(astar.obstacleMap, astar.clearance, astar.radius, coarseResolution)
+        self.corridor = None
+        
+        # history - one dictionary (width, area, expanded, found) per search run by the last call of search
+        self.history = []
+    
+    
+    # search once, in a corridor or (corridor None) on the whole map
+    def Search(self, corridor, stats=None):
+        astar = self.astar
+        lattice = astar.lattice
+        astar.lattice = type(lattice)(lattice.xLength, lattice.yLength, lattice.resolution, lattice.thetaBins)
+        distanceField = astar.distanceField
+        astar.corridor = corridor
+        if(corridor != None):
+            astar.distanceField = corridor_field(corridor, astar.goal)
+        try:
+            result = astar.search(stats)
+        finally:
+            astar.corridor = None
+            astar.distanceField = distanceField
+        self.history.append({"width": None if corridor == None else self.width, "area": None if corridor == None else corridor.Area(), "expanded": result[0].expanded, "found": len(result[1]) > 0})
+        return result
+    
+    
+    # coarse-to-fine search
+    def search(self, stats=None):
+        """
+        Inputs:
+        
+        stats: optional SearchStats object, filled by every search run.
+        
+        Outputs:
+        
+        The same (exploredStates, backtrackStates, actions, distance) as AStar.search, exploredStates is the one
+        of the last search run.
+        
+        The coarse path is found by an 8-connected a-star over the coarse grid, then the search of the AStar object
+        only expands states inside the corridor around it, guided by the distance to the goal through the
+        corridor (see corridor_field) instead of its own heuristic. When no path is found in the corridor, the corridor
+        is widened and the search repeated; after attempts corridors (or without a coarse path) the whole map is
+        searched, so a path is never missed because of the coarse grid. The expansions and the memory of a
+        search in a corridor grow with the length of the path rather than the area of the map.
+        """
+        
+        astar = self.astar
+        self.history = []
+        cells = coarse_path(self.grid, astar.start, astar.goal)
+        if(cells != None):
+            self.width = self.corridorWidth
+            for attempt in range(0, self.attempts):
+                self.corridor = Corridor.Around(cells, self.grid, self.width)
+                result = self.Search(self.corridor, stats)
+                if(len(result[1]) > 0):
+                    return result
+                self.width = self.width * self.widening
+        self.corridor = None
+        return self.Search(None, stats)
@@ -0,0 +1,219 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+# header files
+import numpy as np
+import math
+
+
+# class for the discretized (x, y, theta) state lattice holding the search data
+class StateLattice(object):
+    
+    # init function
+    def __init__(self, xLength, yLength, resolution=5.0, thetaBins=16):
+        """
+        Inputs:
+        
+        xLength: half of the map size along x-direction (map spans -xLength to xLength).
+        yLength: half of the map size along y-direction (map spans -yLength to yLength).
+        resolution: the side of a lattice cell along x and y (in cms).
+        thetaBins: the number of bins the orientation is divided into.
+        """
+        
+        self.xLength = xLength
+        self.yLength = yLength
+        self.resolution = float(resolution)
+        self.thetaBins = thetaBins
+        self.xCells = int(math.ceil(2.0 * xLength / resolution))
+        self.yCells = int(math.ceil(2.0 * yLength / resolution))
+        size = self.xCells * self.yCells * thetaBins
+        
+        # distance - net distance of the node from the start and the goal
+        self.distance = np.full(size, np.inf)
+        
+        # costToCome - distance of the node from the start node
+        self.costToCome = np.full(size, np.inf)
+        
+        # closed - the nodes that have already been expanded
+        self.closed = np.zeros(size, dtype=bool)
+        
+        # parent - index of the node it was reached from (-1 for the start node), used for backtracking
+        self.parent = np.full(size, -1, dtype=np.int32)
+        
+        # action - index of the motion primitive used to reach the node from its parent
+        self.action = np.full(size, -1, dtype=np.int8)
+        
+        # x, y, theta - the exact (continuous) state stored in every cell
+        self.x = np.zeros(size, dtype=np.float32)
+        self.y = np.zeros(size, dtype=np.float32)
+        self.theta = np.zeros(size, dtype=np.float32)
+    
+    
+    # index of the cell holding a state
+    def Index(self, x, y, theta):
+        """
+        Inputs:
+        
+        x: the x-coordinate of the state.
+        y: the y-coordinate of the state.
+        theta: the orientation of the state.
+        
+        Outputs:
+        
+        The flat index of the lattice cell.
+        """
+        
+        indexX = min(max(int((x + self.xLength) // self.resolution), 0), self.xCells - 1)
+        indexY = min(max(int((y + self.yLength) // self.resolution), 0), self.yCells - 1)
+        indexTheta = int((theta % (2 * np.pi)) // (2 * np.pi / self.thetaBins)) % self.thetaBins
+        return (indexX * self.yCells + indexY) * self.thetaBins + indexTheta
+    
+    
+    # indices of the cells holding a batch of states
+    def IndexBatch(self, x, y, theta):
+        """
+        Inputs:
+        
+        x: array of x-coordinates.
+        y: array of y-coordinates.
+        theta: array of orientations.
+        
+        Outputs:
+        
+        Array of flat indices of the lattice cells.
+        """
+        
+        indexX = np.clip(((np.asarray(x) + self.xLength) // self.resolution).astype(np.int64), 0, self.xCells - 1)
+        indexY = np.clip(((np.asarray(y) + self.yLength) // self.resolution).astype(np.int64), 0, self.yCells - 1)
+        indexTheta = ((np.asarray(theta) % (2 * np.pi)) // (2 * np.pi / self.thetaBins)).astype(np.int64) % self.thetaBins
+        return (indexX * self.yCells + indexY) * self.thetaBins + indexTheta
+    
+    
+    # state stored in a cell
+    def State(self, index):
+        """
+        Inputs:
+        
+        index: the flat index of the lattice cell.
+        
+        Outputs:
+        
+        The state (x, y, theta) stored in the cell.
+        """
+        
+        return (float(self.x[index]), float(self.y[index]), float(self.theta[index]))
+    
+    
+    # store a state in a cell
+    def Update(self, index, x, y, theta, costToCome, distance, parent, action):
+        """
+        Inputs:
+        
+        index: the flat index of the lattice cell.
+        x, y, theta: the state reached.
+        costToCome: the distance of the state from the start node.
+        distance: the net distance of the state from the start and the goal.
+        parent: the index of the cell it was reached from.
+        action: the index of the motion primitive used.
+        """
+        
+        self.x[index] = x
+        self.y[index] = y
+        self.theta[index] = theta
+        self.costToCome[index] = costToCome
+        self.distance[index] = distance
+        self.parent[index] = parent
+        self.action[index] = action
+
+
+# state lattice storing only the cells the search touches, for maps too large for one dense array per cell
+class SparseLattice(StateLattice):
+    
+    # init function
+    def __init__(self, xLength, yLength, resolution=5.0, thetaBins=16, capacity=4096):
+        """
+        Inputs:
+        
+        xLength: half of the map size along x-direction (map spans -xLength to xLength).
+        yLength: half of the map size along y-direction (map spans -yLength to yLength).
+        resolution: the side of a lattice cell along x and y (in cms).
+        thetaBins: the number of bins the orientation is divided into.
+        capacity: the initial number of cells the arrays hold, doubled whenever they are full.
+        
+        Index and IndexBatch return slots of compact arrays instead of dense cell indices, so the arrays of
+        StateLattice (distance, costToCome, closed, parent, action, x, y, theta) are used the same way.
+        """
+        
+        self.xLength = xLength
+        self.yLength = yLength
+        self.resolution = float(resolution)
+        self.thetaBins = thetaBins
+        self.xCells = int(math.ceil(2.0 * xLength / resolution))
+        self.yCells = int(math.ceil(2.0 * yLength / resolution))
+        
+        # slots - slot of every dense cell index touched so far, size - the number of slots used
+        self.slots = {}
+        self.size = 0
+        self.distance = np.full(capacity, np.inf)
+        self.costToCome = np.full(capacity, np.inf)
+        self.closed = np.zeros(capacity, dtype=bool)
+        self.parent = np.full(capacity, -1, dtype=np.int32)
+        self.action = np.full(capacity, -1, dtype=np.int8)
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.theta = np.zeros(capacity, dtype=np.float32)
+    
+    
+    # slot of a dense cell index, a new slot is taken on the first visit
+    def Slot(self, cell):
+        slot = self.slots.get(cell)
+        if(slot == None):
+            if(self.size == len(self.distance)):
+                self.Grow(2 * len(self.distance))
+            slot = self.size
+            self.slots[cell] = slot
+            self.size = slot + 1
+        return slot
+    
+    
+    # double the arrays, the new slots start unreached
+    def Grow(self, capacity):
+        for (name, fill) in (("distance", np.inf), ("costToCome", np.inf), ("closed", False), ("parent", -1), ("action", -1), ("x", 0), ("y", 0), ("theta", 0)):
+            old = getattr(self, name)
+            new = np.full(capacity, fill, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+    
+    
+    # slot of the cell holding a state
+    def Index(self, x, y, theta):
+        return self.Slot(StateLattice.Index(self, x, y, theta))
+    
+    
+    # slots of the cells holding a batch of states
+    def IndexBatch(self, x, y, theta):
+        cells = StateLattice.IndexBatch(self, x, y, theta)
+        return np.array([self.Slot(cell) for cell in cells.tolist()], dtype=np.int64)
@@ -0,0 +1,143 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+
+
+# header files
+import math
+import time
+import numpy as np
+from turtlebot_astar.priority_queue import make_open_list
+
+
+# one search from the start of an AStar object to several goals
+def multi_goal_search(astar, goals, thresholds=None, count=None, stats=None, callback=None):
+    """
+    Inputs:
+    
+    astar: the AStar object (its lattice must not have been searched yet), astar.goal is not used.
+    goals: list of (x, y) goals.
+    thresholds: optional list with the goalThreshold of every goal (squared distance, defaults to astar.goalThreshold).
+    count: the number of goals after which the search stops (defaults to every goal).
+    stats: optional SearchStats object filled with counters and timers while searching.
+    callback: optional function called with the result dictionary of every goal as soon as it is reached.
+    
+    Outputs:
+    
+    List with a dictionary for every goal reached, in the order they were reached:
+        goal: the index of the goal in goals.
+        states: the path from start node to the goal.
+        actions: list containing the (dvx, dvy, dw) values for each state of the path.
+        cost: the cost to come of the last state of the path.
+        expanded: the number of nodes expanded when the goal was reached.
+    
+    The heuristic is the distance to the region of the nearest goal left, so the search grows from the start
+    towards all the goals at once. When a goal is reached its path is published, the goal is dropped and the open
+    nodes are re-keyed for the goals left, and the same search tree goes on towards them. Goals outside the map
+    or in the obstacle space are never reached and are left out. astar.maxSteps bounds the whole search.
+    """
+    
+    if(thresholds == None):
+        thresholds = [astar.goalThreshold] * len(goals)
+    if(len(thresholds) != len(goals)):
+        raise ValueError("thresholds must have one value per goal")
+    if(count == None):
+        count = len(goals)
+    lattice = astar.lattice
+    
+    # goals outside the map or in the obstacle space would only make the search exhaust the map
+    remaining = [index for (index, goal) in enumerate(goals) if(astar.IsValid(goal[0], goal[1]) and astar.IsObstacle(goal[0], goal[1]) == False)]
+    if(len(remaining) == 0):
+        return []
+    
+    # targets of the heuristic, the reach of a goal is the radius of its region
+    def targets():
+        return np.array([(goals[index][0], goals[index][1], math.sqrt(thresholds[index])) for index in remaining], dtype=np.float64).reshape(-1, 3)
+    
+    # goals whose region holds a position
+    def reached(currX, currY):
+        return [index for index in remaining if(((currX - goals[index][0]) ** 2 + (currY - goals[index][1]) ** 2) < thresholds[index])]
+    
+    def goalTest(index, state):
+        return len(reached(state[0], state[1])) > 0
+    
+    results = []
+    expanded = 0
+    maxSteps = astar.maxSteps
+    links = ({}, {})
+    astar.stats = stats
+    try:
+        
+        # mark source node and create a queue
+        astar.targets = targets()
+        queue = make_open_list(astar.openList)
+        startIndex = lattice.Index(astar.start[0], astar.start[1], astar.start[2])
+        lattice.Update(startIndex, astar.start[0], astar.start[1], astar.start[2], 0, astar.Heuristic(astar.start[0], astar.start[1]), -1, -1)
+        queue.Push(startIndex, float(lattice.distance[startIndex]), float(lattice.costToCome[startIndex]))
+        if(stats != None):
+            stats.heapPushes += 1
+        
+        while(len(remaining) > 0 and len(results) < count):
+            
+            # run A-star until a goal node is popped
+            astar.maxSteps = maxSteps - expanded
+            if(astar.batchSize > 1):
+                (exploredStates, goalIndex) = astar.ExpandBatch(queue, stats, goalTest=goalTest, links=links)
+            else:
+                (exploredStates, goalIndex) = astar.Expand(queue, stats, goalTest=goalTest)
+            expanded += exploredStates.expanded
+            if(goalIndex == None):
+                break
+            
+            # publish the path to every goal the node reached
+            (currX, currY, _) = lattice.State(goalIndex)
+            (backtrackStates, actions) = astar.Backtrack(goalIndex)
+            for index in reached(currX, currY):
+                remaining.remove(index)
+                result = {"goal": index, "states": backtrackStates, "actions": actions, "cost": float(lattice.costToCome[goalIndex]), "expanded": expanded}
+                results.append(result)
+                if(callback != None):
+                    callback(dict(result))
+            if(len(remaining) == 0 or len(results) >= count):
+                break
+            
+            # re-key the open nodes for the goals left, the goal node is opened again so paths can go on through it
+            lattice.closed[goalIndex] = False
+            cells = np.nonzero(np.isfinite(lattice.costToCome) & ~lattice.closed)[0]
+            oldHeuristic = astar.HeuristicBatch(lattice.x[cells], lattice.y[cells])
+            astar.targets = targets()
+            lattice.distance[cells] += astar.HeuristicBatch(lattice.x[cells], lattice.y[cells]) - oldHeuristic
+            queue = make_open_list(astar.openList)
+            for (cell, distance, costToCome) in zip(cells.tolist(), lattice.distance[cells].tolist(), lattice.costToCome[cells].tolist()):
+                queue.Push(cell, distance, costToCome)
+            if(stats != None):
+                stats.heapPushes += len(cells)
+    finally:
+        astar.targets = None
+        astar.maxSteps = maxSteps
+    if(stats != None):
+        stats.totalTime = time.perf_counter() - stats.startTime
+    return results
@@ -0,0 +1,176 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+
+
+# header files
+import numpy as np
+
+
+# view of one node of a NodeStore, iterates and indexes like the (x, y, theta) tuple of the state
+class Node(object):
+    
+    __slots__ = ("x", "y", "theta", "costToCome", "parent", "action")
+    
+    # init function
+    def __init__(self, x, y, theta, costToCome, parent, action):
+        self.x = x
+        self.y = y
+        self.theta = theta
+        self.costToCome = costToCome
+        self.parent = parent
+        self.action = action
+    
+    def __iter__(self):
+        return iter((self.x, self.y, self.theta))
+    
+    def __len__(self):
+        return 3
+    
+    def __getitem__(self, index):
+        return (self.x, self.y, self.theta)[index]
+    
+    def __repr__(self):
+        return "Node(x=%.2f, y=%.2f, theta=%.3f, costToCome=%.2f, parent=%d, action=%d)" % (self.x, self.y, self.theta, self.costToCome, self.parent, self.action)
+
+
+# growable struct of typed arrays holding the expanded nodes of a search
+class NodeStore(object):
+    
+    # init function
+    def __init__(self, sample=1, capacity=1024):
+        """
+        Inputs:
+        
+        sample: record every sample-th node offered to Record (1 records every node, 0 records none).
+        capacity: the initial number of nodes the arrays hold, doubled whenever they are full.
+        """
+        
+        self.sample = int(sample)
+        
+        # expanded - the number of nodes offered to Record, size - the number of nodes stored
+        self.expanded = 0
+        self.size = 0
+        
+        # x, y, theta - the state, costToCome - its distance from the start node
+        # parent - lattice index of the node it was reached from (-1 for the start node), action - the motion primitive used
+        capacity = max(int(capacity), 1) if self.sample > 0 else 0
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.theta = np.zeros(capacity, dtype=np.float32)
+        self.costToCome = np.zeros(capacity, dtype=np.float64)
+        self.parent = np.zeros(capacity, dtype=np.int32)
+        self.action = np.zeros(capacity, dtype=np.int8)
+    
+    
+    # number of nodes stored
+    def __len__(self):
+        return self.size
+    
+    
+    # view of a stored node
+    def __getitem__(self, index):
+        if(index < 0):
+            index = index + self.size
+        if(index < 0 or index >= self.size):
+            raise IndexError("node index out of range")
+        return Node(float(self.x[index]), float(self.y[index]), float(self.theta[index]), float(self.costToCome[index]), int(self.parent[index]), int(self.action[index]))
+    
+    
+    # iterate over views of the stored nodes
+    def __iter__(self):
+        for index in range(0, self.size):
+            yield self[index]
+    
+    
+    # the stored states as an array, so np.asarray works like on a list of (x, y, theta) tuples
+    def __array__(self, dtype=None, copy=None):
+        states = self.States()
+        return states if dtype == None else states.astype(dtype)
+    
+    
+    # offer an expanded node, stored if it falls on the sampling interval
+    def Record(self, x, y, theta, costToCome, parent, action):
+        """
+        Inputs:
+        
+        x, y, theta: the state of the node.
+        costToCome: the distance of the node from the start node.
+        parent: the lattice index of the node it was reached from.
+        action: the index of the motion primitive used.
+        """
+        
+        self.expanded += 1
+        if(self.sample > 0 and (self.expanded - 1) % self.sample == 0):
+            self.Append(x, y, theta, costToCome, parent, action)
+    
+    
+    # store a node
+    def Append(self, x, y, theta, costToCome, parent, action):
+        """
+        Inputs:
+        
+        x, y, theta: the state of the node.
+        costToCome: the distance of the node from the start node.
+        parent: the lattice index of the node it was reached from.
+        action: the index of the motion primitive used.
+        """
+        
+        if(self.size == len(self.x)):
+            self.Grow(max(2 * len(self.x), 1))
+        index = self.size
+        self.x[index] = x
+        self.y[index] = y
+        self.theta[index] = theta
+        self.costToCome[index] = costToCome
+        self.parent[index] = parent
+        self.action[index] = action
+        self.size = index + 1
+    
+    
+    # resize the arrays to a new capacity
+    def Grow(self, capacity):
+        for name in ("x", "y", "theta", "costToCome", "parent", "action"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self.size] = old[:self.size]
+            setattr(self, name, new)
+    
+    
+    # the stored states
+    def States(self):
+        """
+        Outputs:
+        
+        Numpy array of shape (size, 3) with the (x, y, theta) of the stored nodes.
+        """
+        
+        return np.stack([self.x[:self.size], self.y[:self.size], self.theta[:self.size]], axis=1).astype(np.float64)
+    
+    
+    # memory held by the arrays
+    def Bytes(self):
+        return sum(getattr(self, name).nbytes for name in ("x", "y", "theta", "costToCome", "parent", "action"))
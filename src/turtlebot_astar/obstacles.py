@@ -0,0 +1,588 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+
+# header files
+import hashlib
+import json
+import math
+import os
+import xml.etree.ElementTree as ElementTree
+import numpy as np
+
+
+# circular obstacle (cylinders and spheres of the world)
+class Circle(object):
+    
+    # init function
+    def __init__(self, x, y, radius):
+        """
+        Inputs:
+        
+        x: the x-coordinate of the center (in cms).
+        y: the y-coordinate of the center (in cms).
+        radius: the radius of the circle (in cms).
+        """
+        
+        self.x = float(x)
+        self.y = float(y)
+        self.radius = float(radius)
+        self.key = ("circle", round(self.x, 6), round(self.y, 6), round(self.radius, 6))
+    
+    
+    # axis-aligned bounds of the inflated circle
+    def Bounds(self, margin, padding=0.0):
+        """
+        Inputs:
+        
+        margin: the sum of the clearance and the radius of the robot.
+        padding: extra inflation added to the obstacle.
+        
+        Outputs:
+        
+        Tuple of form (minX, minY, maxX, maxY).
+        """
+        
+        reach = self.radius + margin + padding
+        return (self.x - reach, self.y - reach, self.x + reach, self.y + reach)
+    
+    
+    # checks which positions lie within the inflated circle
+    def Contains(self, rows, cols, margin, padding=0.0):
+        """
+        Inputs:
+        
+        rows: x-positions (scalar or array).
+        cols: y-positions (scalar or array).
+        margin: the sum of the clearance and the radius of the robot.
+        padding: extra inflation added to the obstacle.
+        
+        Outputs:
+        
+        True / False (or boolean array) depending on whether the positions lie within the obstacle space.
+        """
+        
+        reach = self.radius + margin + padding
+        return ((rows - self.x) ** 2 + (cols - self.y) ** 2) <= reach * reach
+    
+    
+    # signed euclidean distance from positions to the circle
+    def Distance(self, rows, cols):
+        """
+        Inputs:
+        
+        rows: x-positions (scalar or array).
+        cols: y-positions (scalar or array).
+        
+        Outputs:
+        
+        The distance to the boundary of the circle, negative inside it.
+        """
+        
+        return np.sqrt((rows - self.x) ** 2 + (cols - self.y) ** 2) - self.radius
+
+
+# rectangular obstacle (boxes of the world), possibly rotated by yaw
+class Box(object):
+    
+    # init function
+    def __init__(self, x, y, width, height, yaw=0.0):
+        """
+        Inputs:
+        
+        x: the x-coordinate of the center (in cms).
+        y: the y-coordinate of the center (in cms).
+        width: the side of the box along its own x-axis (in cms).
+        height: the side of the box along its own y-axis (in cms).
+        yaw: the rotation of the box (in radians).
+        """
+        
+        self.x = float(x)
+        self.y = float(y)
+        self.width = float(width)
+        self.height = float(height)
+        self.yaw = float(yaw)
+        self.cos = math.cos(self.yaw)
+        self.sin = math.sin(self.yaw)
+        self.key = ("box", round(self.x, 6), round(self.y, 6), round(self.width, 6), round(self.height, 6), round(self.yaw, 6))
+    
+    
+    # inflation of the box, every side is pushed out by 1.4142 * margin like the squares of the original map
+    def Inflation(self, margin, padding=0.0):
+        """
+        Inputs:
+        
+        margin: the sum of the clearance and the radius of the robot.
+        padding: extra inflation added to the obstacle.
+        
+        Outputs:
+        
+        The distance every side of the box is pushed out by.
+        """
+        
+        return 1.4142 * margin + padding
+    
+    
+    # axis-aligned bounds of the inflated box
+    def Bounds(self, margin, padding=0.0):
+        """
+        Inputs:
+        
+        margin: the sum of the clearance and the radius of the robot.
+        padding: extra inflation added to the obstacle.
+        
+        Outputs:
+        
+        Tuple of form (minX, minY, maxX, maxY).
+        """
+        
+        halfWidth = 0.5 * self.width + self.Inflation(margin, padding)
+        halfHeight = 0.5 * self.height + self.Inflation(margin, padding)
+        reachX = abs(halfWidth * self.cos) + abs(halfHeight * self.sin)
+        reachY = abs(halfWidth * self.sin) + abs(halfHeight * self.cos)
+        return (self.x - reachX, self.y - reachY, self.x + reachX, self.y + reachY)
+    
+    
+    # checks which positions lie within the inflated box
+    def Contains(self, rows, cols, margin, padding=0.0):
+        """
+        Inputs:
+        
+        rows: x-positions (scalar or array).
+        cols: y-positions (scalar or array).
+        margin: the sum of the clearance and the radius of the robot.
+        padding: extra inflation added to the obstacle.
+        
+        Outputs:
+        
+        True / False (or boolean array) depending on whether the positions lie within the obstacle space.
+        """
+        
+        # positions in the frame of the box
+        dx = rows - self.x
+        dy = cols - self.y
+        localX = self.cos * dx + self.sin * dy
+        localY = self.cos * dy - self.sin * dx
+        inflation = self.Inflation(margin, padding)
+        return (abs(localX) <= 0.5 * self.width + inflation) & (abs(localY) <= 0.5 * self.height + inflation)
+    
+    
+    # signed euclidean distance from positions to the box
+    def Distance(self, rows, cols):
+        """
+        Inputs:
+        
+        rows: x-positions (scalar or array).
+        cols: y-positions (scalar or array).
+        
+        Outputs:
+        
+        The distance to the boundary of the box, negative inside it.
+        """
+        
+        # distances beyond the sides of the box, in the frame of the box
+        dx = rows - self.x
+        dy = cols - self.y
+        outsideX = np.abs(self.cos * dx + self.sin * dy) - 0.5 * self.width
+        outsideY = np.abs(self.cos * dy - self.sin * dx) - 0.5 * self.height
+        outside = np.sqrt(np.maximum(outsideX, 0.0) ** 2 + np.maximum(outsideY, 0.0) ** 2)
+        return outside + np.minimum(np.maximum(outsideX, outsideY), 0.0)
+
+
+# class for the obstacles of a map, bucketed on a uniform grid so a query only tests the nearby obstacles
+class ObstacleMap(object):
+    
+    # the map of the original project, built once
+    default = None
+    
+    # init function
+    def __init__(self, obstacles, xLength, yLength, bucketSize=100.0):
+        """
+        Inputs:
+        
+        obstacles: list of Circle and Box objects (in cms).
+        xLength: half of the map size along x-direction (map spans -xLength to xLength).
+        yLength: half of the map size along y-direction (map spans -yLength to yLength).
+        bucketSize: the side of a bucket of the spatial index (in cms).
+        """
+        
+        self.obstacles = list(obstacles)
+        self.xLength = xLength
+        self.yLength = yLength
+        self.bucketSize = float(bucketSize)
+        
+        # key - fingerprint of the map, used to cache what is built from it
+        description = repr((xLength, yLength, sorted(obstacle.key for obstacle in self.obstacles)))
+        self.key = hashlib.sha1(description.encode("utf-8")).hexdigest()[:16]
+        
+        # buckets - spatial index of the inflated obstacles, keyed by (margin, padding)
+        self.buckets = {}
+    
+    
+    # the map of the original project (4 circles and 3 squares)
+    @classmethod
+    def Default(cls):
+        """
+        Outputs:
+        
+        ObstacleMap object of the built-in map of the original project, the map spans -500 to 500 cms. It has the
+        obstacles of world/map.json; world/map.world also has walls and a slightly larger map.
+        """
+        
+        if(cls.default == None):
+            obstacles = [Circle(200.0, 300.0, 100.0), Circle(200.0, -300.0, 100.0), Circle(-200.0, -300.0, 100.0), Circle(0.0, 0.0, 100.0),
+                         Box(400.0, 0.0, 150.0, 150.0), Box(-400.0, 0.0, 150.0, 150.0), Box(-200.0, 300.0, 150.0, 150.0)]
+            cls.default = cls(obstacles, 500, 500)
+        return cls.default
+    
+    
+    # range of buckets covering the given bounds
+    def BucketRange(self, minX, minY, maxX, maxY):
+        """
+        Inputs:
+        
+        minX, minY, maxX, maxY: the bounds (in cms).
+        
+        Outputs:
+        
+        Tuple of form (firstX, firstY, lastX, lastY) of bucket indices (inclusive).
+        """
+        
+        return (int(math.floor(minX / self.bucketSize)), int(math.floor(minY / self.bucketSize)), int(math.floor(maxX / self.bucketSize)), int(math.floor(maxY / self.bucketSize)))
+    
+    
+    # spatial index of the obstacles inflated by margin and padding
+    def Buckets(self, margin, padding=0.0):
+        """
+        Inputs:
+        
+        margin: the sum of the clearance and the radius of the robot.
+        padding: extra inflation added to every obstacle.
+        
+        Outputs:
+        
+        Dictionary mapping a bucket (bx, by) to the list of obstacles whose inflated bounds overlap it.
+        """
+        
+        key = (margin, padding)
+        buckets = self.buckets.get(key)
+        if(buckets == None):
+            buckets = {}
+            for obstacle in self.obstacles:
+                (firstX, firstY, lastX, lastY) = self.BucketRange(*obstacle.Bounds(margin, padding))
+                for bucketX in range(firstX, lastX + 1):
+                    for bucketY in range(firstY, lastY + 1):
+                        buckets.setdefault((bucketX, bucketY), []).append(obstacle)
+            self.buckets[key] = buckets
+        return buckets
+    
+    
+    # obstacles that may contain a position in the given bounds
+    def Nearby(self, minX, minY, maxX, maxY, margin, padding=0.0):
+        """
+        Inputs:
+        
+        minX, minY, maxX, maxY: the bounds (in cms).
+        margin: the sum of the clearance and the radius of the robot.
+        padding: extra inflation added to every obstacle.
+        
+        Outputs:
+        
+        List of the obstacles whose inflated bounds overlap the buckets of the given bounds.
+        """
+        
+        buckets = self.Buckets(margin, padding)
+        (firstX, firstY, lastX, lastY) = self.BucketRange(minX, minY, maxX, maxY)
+        if(firstX == lastX and firstY == lastY):
+            return buckets.get((firstX, firstY), [])
+        nearby = []
+        seen = set()
+        for bucketX in range(firstX, lastX + 1):
+            for bucketY in range(firstY, lastY + 1):
+                for obstacle in buckets.get((bucketX, bucketY), ()):
+                    if(id(obstacle) not in seen):
+                        seen.add(id(obstacle))
+                        nearby.append(obstacle)
+        return nearby
+    
+    
+    # checks for an obstacle at the given position
+    def IsObstacle(self, row, col, clearance, radius, padding=0.0):
+        """
+        Inputs:
+        
+        row - the x-position of the robot.
+        col - the y-position of the robot.
+        clearance - the clearance that the robot needs to have with the obstacles.
+        radius - the radius of the robot.
+        padding - extra inflation added to every obstacle.
+        
+        Outputs:
+        
+        True / False depending on whether the position lies within the inflated obstacle space or not.
+        """
+        
+        margin = clearance + radius
+        bucket = (int(math.floor(row / self.bucketSize)), int(math.floor(col / self.bucketSize)))
+        for obstacle in self.Buckets(margin, padding).get(bucket, ()):
+            if(obstacle.Contains(row, col, margin, padding)):
+                return True
+        return False
+    
+    
+    # checks for obstacles at a batch of positions
+    def IsObstacleBatch(self, rows, cols, clearance, radius, padding=0.0):
+        """
+        Inputs:
+        
+        rows - array of x-positions of the robot.
+        cols - array of y-positions of the robot.
+        clearance - the clearance that the robot needs to have with the obstacles.
+        radius - the radius of the robot.
+        padding - extra inflation added to every obstacle.
+        
+        Outputs:
+        
+        Boolean array, True wherever the position lies within the inflated obstacle space.
+        """
+        
+        (rows, cols) = np.broadcast_arrays(np.asarray(rows, dtype=np.float64), np.asarray(cols, dtype=np.float64))
+        obstacle = np.zeros(rows.shape, dtype=bool)
+        if(rows.size == 0):
+            return obstacle
+        margin = clearance + radius
+        for nearby in self.Nearby(rows.min(), cols.min(), rows.max(), cols.max(), margin, padding):
+            obstacle |= nearby.Contains(rows, cols, margin, padding)
+        return obstacle
+    
+    
+    # rasterize the inflated obstacle space on a grid
+    def Rasterize(self, xCells, yCells, resolution, clearance, radius, padding=0.0, firstCellX=0, firstCellY=0):
+        """
+        Inputs:
+        
+        xCells: the number of cells along x-direction.
+        yCells: the number of cells along y-direction.
+        resolution: the side of a cell (in cms).
+        clearance - the clearance that the robot needs to have with the obstacles.
+        radius - the radius of the robot.
+        padding - extra inflation added to every obstacle.
+        firstCellX, firstCellY - the first cell of the window rasterized, counted from (-xLength, -yLength).
+        
+        Outputs:
+        
+        Boolean numpy array of shape (xCells, yCells), True for the cells whose center lies within the inflated obstacle space.
+        Only the obstacles near the window are visited, and each of them only visits the cells inside its own bounds.
+        """
+        
+        occupied = np.zeros((xCells, yCells), dtype=bool)
+        margin = clearance + radius
+        originX = -self.xLength + firstCellX * resolution
+        originY = -self.yLength + firstCellY * resolution
+        for obstacle in self.Nearby(originX, originY, originX + xCells * resolution, originY + yCells * resolution, margin, padding):
+            (minX, minY, maxX, maxY) = obstacle.Bounds(margin, padding)
+            firstX = max(int(math.floor((minX - originX) / resolution - 0.5)), 0)
+            firstY = max(int(math.floor((minY - originY) / resolution - 0.5)), 0)
+            lastX = min(int(math.ceil((maxX - originX) / resolution - 0.5)) + 1, xCells)
+            lastY = min(int(math.ceil((maxY - originY) / resolution - 0.5)) + 1, yCells)
+            if(firstX >= lastX or firstY >= lastY):
+                continue
+            centerX = originX + (np.arange(firstX, lastX) + 0.5) * resolution
+            centerY = originY + (np.arange(firstY, lastY) + 0.5) * resolution
+            occupied[firstX:lastX, firstY:lastY] |= obstacle.Contains(centerX[:, None], centerY[None, :], margin, padding)
+        return occupied
+
+
+# parse a pose element of SDF, only the planar part is used
+def _parse_pose(element):
+    """
+    Inputs:
+    
+    element: the pose element (or None).
+    
+    Outputs:
+    
+    Tuple of form (x, y, yaw) in meters and radians.
+    """
+    
+    if(element == None or element.text == None):
+        return (0.0, 0.0, 0.0)
+    values = [float(value) for value in element.text.split()]
+    values += [0.0] * (6 - len(values))
+    return (values[0], values[1], values[5])
+
+
+# compose two planar poses
+def _compose(first, second):
+    """
+    Inputs:
+    
+    first: the pose of a frame, tuple of form (x, y, yaw).
+    second: a pose expressed in that frame.
+    
+    Outputs:
+    
+    The second pose expressed in the parent frame of the first one.
+    """
+    
+    (x, y, yaw) = first
+    return (x + math.cos(yaw) * second[0] - math.sin(yaw) * second[1], y + math.sin(yaw) * second[0] + math.cos(yaw) * second[1], yaw + second[2])
+
+
+# bounds of a list of obstacles, used when the map does not give its size
+def _bounds(obstacles):
+    """
+    Inputs:
+    
+    obstacles: list of Circle and Box objects.
+    
+    Outputs:
+    
+    Tuple of form (xLength, yLength), the smallest map centered on the origin holding every obstacle (in whole cms).
+    """
+    
+    xLength = 0
+    yLength = 0
+    for obstacle in obstacles:
+        (minX, minY, maxX, maxY) = obstacle.Bounds(0.0)
+        xLength = max(xLength, int(math.ceil(max(-minX, maxX))))
+        yLength = max(yLength, int(math.ceil(max(-minY, maxY))))
+    return (xLength, yLength)
+
+
+# load the obstacles of a gazebo world (SDF) file
+def parse_sdf(path, xLength=None, yLength=None):
+    """
+    Inputs:
+    
+    path: the world file.
+    xLength: half of the map size along x-direction (in cms), defaults to the extent of the obstacles.
+    yLength: half of the map size along y-direction (in cms), defaults to the extent of the obstacles.
+    
+    Outputs:
+    
+    ObstacleMap object. The cylinders, spheres and boxes of the collision elements become Circle and Box obstacles,
+    placed at the poses saved in the state of the world when there is one. Planes and meshes are skipped.
+    """
+    
+    world = ElementTree.parse(path).getroot()
+    if(world.tag != "world"):
+        world = world.find("world")
+    
+    # poses saved in the state of the world (link poses there are in the world frame)
+    modelPoses = {}
+    linkPoses = {}
+    scales = {}
+    state = world.find("state")
+    if(state != None):
+        for model in state.findall("model"):
+            name = model.get("name")
+            modelPoses[name] = _parse_pose(model.find("pose"))
+            if(model.find("scale") != None):
+                scales[name] = [float(value) for value in model.find("scale").text.split()]
+            for link in model.findall("link"):
+                if(link.find("pose") != None):
+                    linkPoses[(name, link.get("name"))] = _parse_pose(link.find("pose"))
+    
+    obstacles = []
+    for model in world.findall("model"):
+        name = model.get("name")
+        modelPose = modelPoses.get(name, _parse_pose(model.find("pose")))
+        (scaleX, scaleY) = scales.get(name, [1.0, 1.0, 1.0])[:2]
+        for link in model.findall("link"):
+            linkPose = linkPoses.get((name, link.get("name")))
+            if(linkPose == None):
+                linkPose = _compose(modelPose, _parse_pose(link.find("pose")))
+            for collision in link.findall("collision"):
+                (x, y, yaw) = _compose(linkPose, _parse_pose(collision.find("pose")))
+                geometry = collision.find("geometry")
+                if(geometry == None):
+                    continue
+                cylinder = geometry.find("cylinder")
+                if(cylinder == None):
+                    cylinder = geometry.find("sphere")
+                box = geometry.find("box")
+                if(cylinder != None):
+                    obstacles.append(Circle(100.0 * x, 100.0 * y, 100.0 * max(scaleX, scaleY) * float(cylinder.find("radius").text)))
+                elif(box != None):
+                    size = [float(value) for value in box.find("size").text.split()]
+                    obstacles.append(Box(100.0 * x, 100.0 * y, 100.0 * scaleX * size[0], 100.0 * scaleY * size[1], yaw))
+    
+    (boundX, boundY) = _bounds(obstacles)
+    return ObstacleMap(obstacles, boundX if xLength == None else xLength, boundY if yLength == None else yLength)
+
+
+# build a map from its dictionary form (the content of a JSON or YAML map file)
+def parse_map(data):
+    """
+    Inputs:
+    
+    data: dictionary with an "obstacles" list and optionally the "xLength" and "yLength" of the map, in meters.
+          A circle is {"type": "circle", "x": .., "y": .., "radius": ..} and a box is
+          {"type": "box", "x": .., "y": .., "width": .., "height": .., "yaw": ..} (yaw in radians, optional).
+    
+    Outputs:
+    
+    ObstacleMap object (in cms).
+    """
+    
+    obstacles = []
+    for obstacle in data.get("obstacles", []):
+        kind = obstacle.get("type")
+        if(kind == "circle"):
+            obstacles.append(Circle(100.0 * float(obstacle["x"]), 100.0 * float(obstacle["y"]), 100.0 * float(obstacle["radius"])))
+        elif(kind == "box"):
+            obstacles.append(Box(100.0 * float(obstacle["x"]), 100.0 * float(obstacle["y"]), 100.0 * float(obstacle["width"]), 100.0 * float(obstacle["height"]), float(obstacle.get("yaw", 0.0))))
+        else:
+            raise ValueError("unknown obstacle type: " + str(kind))
+    
+    (boundX, boundY) = _bounds(obstacles)
+    xLength = boundX if data.get("xLength") == None else int(round(100.0 * float(data["xLength"])))
+    yLength = boundY if data.get("yLength") == None else int(round(100.0 * float(data["yLength"])))
+    return ObstacleMap(obstacles, xLength, yLength)
+
+
+# load a map file
+def load_map(path):
+    """
+    Inputs:
+    
+    path: a gazebo world (.world or .sdf), JSON (.json) or YAML (.yaml or .yml) map file.
+    
+    Outputs:
+    
+    ObstacleMap object.
+    """
+    
+    extension = os.path.splitext(path)[1].lower()
+    if(extension in (".world", ".sdf")):
+        return parse_sdf(path)
+    with open(path) as mapFile:
+        if(extension in (".yaml", ".yml")):
+            # PyYAML is only needed for YAML maps, import it lazily
+            import yaml
+            return parse_map(yaml.safe_load(mapFile))
+        return parse_map(json.load(mapFile))
@@ -0,0 +1,148 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+# header files
+import numpy as np
+import math
+from turtlebot_astar.obstacles import ObstacleMap
+
+
+# vectorised obstacle check of a map (the map of the original project by default)
+def obstacle_space(row, col, clearance, radius, padding=0.0, obstacleMap=None):
+    """
+    Inputs:
+    
+    row - array of x-positions of the robot.
+    col - array of y-positions of the robot.
+    clearance - the clearance that the robot needs to have with the obstacles.
+    radius - the radius of the robot.
+    padding - extra inflation added to every obstacle (used to make rasterized grids conservative).
+    obstacleMap - the ObstacleMap checked (defaults to ObstacleMap.Default()).
+    
+    Outputs:
+    
+    Boolean array, True wherever the position lies within the inflated obstacle space.
+    """
+    
+    if(obstacleMap == None):
+        obstacleMap = ObstacleMap.Default()
+    return obstacleMap.IsObstacleBatch(row, col, clearance, radius, padding)
+
+
+# class for the rasterized (clearance inflated) obstacle space
+class OccupancyGrid(object):
+    
+    # grids already built, keyed by (map key, clearance, radius, resolution)
+    cache = {}
+    
+    # init function
+    def __init__(self, occupied, xLength, yLength, resolution, key=None):
+        """
+        Inputs:
+        
+        occupied: boolean numpy array of shape (nx, ny), True for the cells lying in the obstacle space.
+        xLength: half of the map size along x-direction (map spans -xLength to xLength).
+        yLength: half of the map size along y-direction (map spans -yLength to yLength).
+        resolution: the side of a grid cell (in cms).
+        key: the key of the grid in the cache, None for grids that are not cached.
+        """
+        
+        self.occupied = occupied
+        self.key = key
+        self.xLength = xLength
+        self.yLength = yLength
+        self.resolution = float(resolution)
+        (self.xCells, self.yCells) = occupied.shape
+    
+    
+    # build (or fetch from cache) the grid of a map for a given clearance and radius
+    @classmethod
+    def Build(cls, obstacleMap, clearance, radius, resolution=1.0):
+        """
+        Inputs:
+        
+        obstacleMap: the ObstacleMap rasterized.
+        clearance: the clearance that the robot needs to have with the obstacles.
+        radius: the radius of the robot.
+        resolution: the side of a grid cell (in cms).
+        
+        Outputs:
+        
+        OccupancyGrid object. A cell is marked occupied if any point inside it lies in the obstacle space,
+        so a free cell is guaranteed to be free for the analytic check as well.
+        """
+        
+        key = (obstacleMap.key, clearance, radius, resolution)
+        grid = cls.cache.get(key)
+        if(grid == None):
+            xCells = int(math.ceil(2.0 * obstacleMap.xLength / resolution))
+            yCells = int(math.ceil(2.0 * obstacleMap.yLength / resolution))
+            occupied = obstacleMap.Rasterize(xCells, yCells, resolution, clearance, radius, padding=0.7072 * resolution)
+            grid = cls(occupied, obstacleMap.xLength, obstacleMap.yLength, resolution, key)
+            cls.cache[key] = grid
+        return grid
+    
+    
+    # checks for an obstacle at the given position
+    def IsObstacle(self, row, col):
+        """
+        Inputs:
+        
+        row - the current x-position of the robot.
+        col - the current y-posiiton of the robot.
+        
+        Outputs:
+        
+        True / False depending on whether the nodes lies within obstacle or not (outside the grid counts as obstacle).
+        """
+        
+        indexX = int(math.floor((row + self.xLength) / self.resolution))
+        indexY = int(math.floor((col + self.yLength) / self.resolution))
+        if(indexX < 0 or indexY < 0 or indexX >= self.xCells or indexY >= self.yCells):
+            return True
+        return bool(self.occupied[indexX, indexY])
+    
+    
+    # checks for obstacles at a batch of positions
+    def IsObstacleBatch(self, rows, cols):
+        """
+        Inputs:
+        
+        rows - array of x-positions.
+        cols - array of y-positions.
+        
+        Outputs:
+        
+        Boolean array of the same shape, True for the positions lying within obstacle (or outside the grid).
+        """
+        
+        indexX = np.floor((np.asarray(rows) + self.xLength) / self.resolution).astype(np.int64)
+        indexY = np.floor((np.asarray(cols) + self.yLength) / self.resolution).astype(np.int64)
+        inside = (indexX >= 0) & (indexY >= 0) & (indexX < self.xCells) & (indexY < self.yCells)
+        
+        # one gather of clipped flat indices is cheaper than masking the positions inside the grid
+        flat = np.clip(indexX, 0, self.xCells - 1) * self.yCells + np.clip(indexY, 0, self.yCells - 1)
+        return np.take(self.occupied.reshape(-1), flat) | ~inside
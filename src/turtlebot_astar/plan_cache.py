@@ -0,0 +1,218 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+
+# header files
+import json
+import math
+import sqlite3
+import time
+from collections import OrderedDict
+from turtlebot_astar.obstacles import ObstacleMap
+
+
+# class for the plans already found, looked up by their quantized query before searching
+class PlanCache(object):
+    
+    # init function
+    def __init__(self, capacity=1024, path=None, positionStep=0.01, angleStep=0.01):
+        """
+        Inputs:
+        
+        capacity: the number of plans kept in memory, the least recently used plan is evicted first.
+        path: optional sqlite file the plans are also written to, so they survive restarts.
+        positionStep: the quantization of the start and goal positions (in m).
+        angleStep: the quantization of the start orientation (in radians).
+        """
+        
+        self.capacity = capacity
+        self.path = path
+        self.positionStep = positionStep
+        self.angleStep = angleStep
+        
+        # plans - key to cached result, ordered from the least to the most recently used
+        self.plans = OrderedDict()
+        self.connection = None
+        
+        # counters
+        self.hits = 0
+        self.diskHits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.rejected = 0
+    
+    
+    # the connection is not pickled, a worker process opens its own
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["connection"] = None
+        return state
+    
+    
+    # the sqlite store, created when first needed
+    def Connection(self):
+        if(self.connection == None and self.path != None):
+            self.connection = sqlite3.connect(self.path, timeout=30.0)
+            self.connection.execute("CREATE TABLE IF NOT EXISTS plans (key TEXT PRIMARY KEY, plan TEXT NOT NULL, created REAL NOT NULL)")
+            self.connection.commit()
+        return self.connection
+    
+    
+    # key of a query
+    def Key(self, query, **options):
+        """
+        Inputs:
+        
+        query: dictionary with the fields of QUERY_FIELDS (in meters and radians).
+        options: extra keyword arguments passed to AStar.
+        
+        Outputs:
+        
+        The key (a string) of the quantized start, goal, RPM, clearance, the fingerprint of the map and the other options.
+        """
+        
+        obstacleMap = options.get("obstacleMap")
+        if(obstacleMap == None):
+            obstacleMap = ObstacleMap.Default()
+        others = sorted((name, repr(value)) for (name, value) in options.items() if name != "obstacleMap")
+        key = [int(round(float(query["startX"]) / self.positionStep)), int(round(float(query["startY"]) / self.positionStep)),
+               int(round((float(query["startOrientation"]) % (2 * math.pi)) / self.angleStep)) % int(round(2 * math.pi / self.angleStep)),
+               int(round(float(query["goalX"]) / self.positionStep)), int(round(float(query["goalY"]) / self.positionStep)),
+               float(query["firstRPM"]), float(query["secondRPM"]), float(query["clearance"]), obstacleMap.key, others]
+        return json.dumps(key)
+    
+    
+    # look up the plan of a query
+    def Get(self, key):
+        """
+        Inputs:
+        
+        key: the key returned by Key.
+        
+        Outputs:
+        
+        Dictionary with the "path" (in meters), "actions" and "cost" of the cached plan, None if the query was not cached.
+        """
+        
+        plan = self.plans.get(key)
+        if(plan != None):
+            self.plans.move_to_end(key)
+            return plan
+        connection = self.Connection()
+        if(connection != None):
+            row = connection.execute("SELECT plan FROM plans WHERE key = ?", (key,)).fetchone()
+            if(row != None):
+                plan = json.loads(row[0])
+                self.diskHits += 1
+                self.Store(key, plan)
+                return plan
+        return None
+    
+    
+    # look up the plan of a query and check it against the planner of the query
+    def Lookup(self, key, astar, costToCome=False):
+        """
+        Inputs:
+        
+        key: the key returned by Key.
+        astar: the AStar object of the query (its start, goal, map and clearance).
+        costToCome: return the cost to come of the plan (the cost of the anytime search) instead of the distance of AStar.search.
+        
+        Outputs:
+        
+        Dictionary with the "path" (in meters), "actions" and "cost" of the plan, None on a miss. The actions are
+        followed from the exact start of the query, a plan whose arcs hit an obstacle of the current map or that
+        does not end in the goal region is discarded. The cost is computed again for the query (see AStar.PathCost),
+        the plan may have been found for a slightly different start and goal, or by the other search.
+        """
+        
+        plan = self.Get(key)
+        if(plan != None):
+            states = astar.FollowActions(astar.start, plan["actions"])
+            if(states == None or astar.IsGoal(states[-1][0], states[-1][1]) == False):
+                self.Discard(key)
+                plan = None
+            else:
+                plan = dict(plan, path=[(state[0] / 100.0, state[1] / 100.0, state[2]) for state in states], cost=astar.PathCost(states, plan["actions"], costToCome))
+        if(plan == None):
+            self.misses += 1
+        else:
+            self.hits += 1
+        return plan
+    
+    
+    # keep a plan in memory, evicting the least recently used one when full
+    def Store(self, key, plan):
+        self.plans[key] = plan
+        self.plans.move_to_end(key)
+        while(len(self.plans) > self.capacity):
+            self.plans.popitem(last=False)
+            self.evictions += 1
+    
+    
+    # add the plan of a query
+    def Put(self, key, plan):
+        """
+        Inputs:
+        
+        key: the key returned by Key.
+        plan: dictionary with the "path" (in meters), "actions" and "cost" of the plan.
+        """
+        
+        self.Store(key, plan)
+        connection = self.Connection()
+        if(connection != None):
+            connection.execute("INSERT OR REPLACE INTO plans (key, plan, created) VALUES (?, ?, ?)", (key, json.dumps(plan), time.time()))
+            connection.commit()
+    
+    
+    # forget a plan that failed validation
+    def Discard(self, key):
+        self.plans.pop(key, None)
+        self.rejected += 1
+        connection = self.Connection()
+        if(connection != None):
+            connection.execute("DELETE FROM plans WHERE key = ?", (key,))
+            connection.commit()
+    
+    
+    # the counters as a dictionary
+    def AsDict(self):
+        """
+        Outputs:
+        
+        Dictionary with the hits (and the hits read from disk), misses, evictions, plans rejected by validation,
+        the hit rate and the number of plans in memory.
+        """
+        
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "diskHits": self.diskHits, "misses": self.misses, "evictions": self.evictions, "rejected": self.rejected,
+                "hitRate": self.hits / lookups if lookups > 0 else 0.0, "size": len(self.plans)}
+    
+    
+    # print friendly form of the counters
+    def __repr__(self):
+        return "PlanCache(" + ", ".join(name + "=" + str(value) for (name, value) in self.AsDict().items()) + ")"
@@ -0,0 +1,143 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+# header files
+import numpy as np
+import math
+from collections import OrderedDict
+
+
+# sample points along the exact arcs of a differential drive robot
+def arc_offsets(velocity, angularVelocity, theta, frequency):
+    """
+    Inputs:
+    
+    velocity: array of linear velocities (in cm/s), one per arc.
+    angularVelocity: array of angular velocities (in rad/s), one per arc.
+    theta: the starting orientation of the robot.
+    frequency: the number of samples taken along each arc (the arc is followed for 1 s).
+    
+    Outputs:
+    
+    offsetX: array of shape (arcs, frequency), x-offsets of the samples from the starting position.
+    offsetY: array of shape (arcs, frequency), y-offsets of the samples from the starting position.
+    """
+    
+    velocity = np.asarray(velocity, dtype=np.float64)[:, None]
+    angularVelocity = np.asarray(angularVelocity, dtype=np.float64)[:, None]
+    t = np.arange(1, frequency + 1, dtype=np.float64)[None, :] / frequency
+    
+    # closed form of the arc (straight line when the angular velocity is zero)
+    turning = np.abs(angularVelocity) > 1e-12
+    safeW = np.where(turning, angularVelocity, 1.0)
+    offsetX = np.where(turning, velocity / safeW * (np.sin(theta + safeW * t) - math.sin(theta)), velocity * t * math.cos(theta))
+    offsetY = np.where(turning, velocity / safeW * (math.cos(theta) - np.cos(theta + safeW * t)), velocity * t * math.sin(theta))
+    return (offsetX, offsetY)
+
+
+# class for the 8 motion primitives of the robot built from wheelRPM
+class MotionPrimitives(object):
+    
+    # init function
+    def __init__(self, wheelRPM, wheelRadius, wheelDistance, frequency, cacheSize=1024):
+        """
+        Inputs:
+        
+        wheelRPM: the values of RPM of the wheels. It is of form (leftRPM, rightRPM).
+        wheelRadius: the radius of the wheels.
+        wheelDistance: the distance between wheels.
+        frequency: the number of samples taken along each arc for collision checking.
+        cacheSize: the maximum number of headings whose rotated primitives are kept.
+        """
+        
+        # actions - (leftRPM, rightRPM) of each primitive, in the order used by AStar.search
+        (first, second) = wheelRPM
+        self.actions = [(0, first), (first, 0), (first, first), (0, second), (second, 0), (second, second), (first, second), (second, first)]
+        
+        # weights - the cost to come added by each primitive
+        self.weights = np.array([first, first, first * 1.4142, second, second, second * 1.4142, max(first * 1.4142, second * 1.4142), max(first * 1.4142, second * 1.4142)])
+        
+        # linear and angular velocities of each primitive
+        leftAngularVelocity = np.array([action[0] for action in self.actions], dtype=np.float64) * 2 * np.pi / 60.0
+        rightAngularVelocity = np.array([action[1] for action in self.actions], dtype=np.float64) * 2 * np.pi / 60.0
+        self.velocity = wheelRadius * 0.5 * (leftAngularVelocity + rightAngularVelocity)
+        self.angularVelocity = (wheelRadius / wheelDistance) * (rightAngularVelocity - leftAngularVelocity)
+        
+        # cost - the length of each arc
+        self.cost = np.abs(self.velocity)
+        self.frequency = frequency
+        
+        # cache - rotated samples keyed by heading (in [0, 2*pi)), least recently used first, the primitives are translation invariant
+        self.cacheSize = cacheSize
+        self.cache = OrderedDict()
+    
+    
+    # samples of all the primitives for a given heading
+    def Rotated(self, theta):
+        """
+        Inputs:
+        
+        theta: the orientation of the robot.
+        
+        Outputs:
+        
+        offsetX: array of shape (8, frequency), x-offsets of the samples along every primitive.
+        offsetY: array of shape (8, frequency), y-offsets of the samples along every primitive.
+        dvx: array of linear velocities along x-direction during the last time step of every primitive.
+        dvy: array of linear velocities along y-direction during the last time step of every primitive.
+        """
+        
+        # the headings of the search are sums of the turns of the primitives, so the same few hundred headings
+        # (modulo a full turn) come back again and again, and the least recently used ones are dropped
+        key = round(theta % (2 * np.pi), 9)
+        primitive = self.cache.get(key)
+        if(primitive == None):
+            (offsetX, offsetY) = arc_offsets(self.velocity, self.angularVelocity, theta, self.frequency)
+            lastTheta = theta + self.angularVelocity * (self.frequency - 1) / self.frequency
+            primitive = (offsetX, offsetY, self.velocity * np.cos(lastTheta), self.velocity * np.sin(lastTheta))
+            self.cache[key] = primitive
+            if(len(self.cache) > self.cacheSize):
+                self.cache.popitem(last=False)
+        else:
+            self.cache.move_to_end(key)
+        return primitive
+    
+    
+    # velocities published to move along a primitive
+    def Command(self, theta, action):
+        """
+        Inputs:
+        
+        theta: the orientation of the robot at the start of the primitive.
+        action: the index of the primitive.
+        
+        Outputs:
+        
+        (dvx, dvy, dw) values of the primitive.
+        """
+        
+        lastTheta = theta + self.angularVelocity[action] * (self.frequency - 1) / self.frequency
+        return (float(self.velocity[action] * math.cos(lastTheta)), float(self.velocity[action] * math.sin(lastTheta)), float(self.angularVelocity[action]))
@@ -0,0 +1,188 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+# header files
+from heapq import heappush, heappop
+
+
+# class for the open list using heapq, an improved node is pushed again and the old entry goes stale
+class LazyHeap(object):
+    
+    # init function
+    def __init__(self):
+        self.heap = []
+    
+    
+    # number of entries (stale ones included)
+    def __len__(self):
+        return len(self.heap)
+    
+    
+    # add a node
+    def Push(self, key, priority, tieBreak=0):
+        """
+        Inputs:
+        
+        key: the key of the node (lattice index).
+        priority: the priority of the node, smaller is popped first.
+        tieBreak: compared when the priorities are equal, smaller is popped first.
+        """
+        
+        heappush(self.heap, (priority, tieBreak, key))
+    
+    
+    # remove the node with the smallest priority
+    def Pop(self):
+        """
+        Outputs:
+        
+        (priority, tieBreak, key) of the popped node.
+        """
+        
+        return heappop(self.heap)
+
+
+# class for the open list as an indexed binary heap, an improved node has its priority decreased in place
+class IndexedHeap(object):
+    
+    # init function
+    def __init__(self):
+        
+        # heap - list of (priority, tieBreak, key) entries
+        self.heap = []
+        
+        # position - index of every key in the heap
+        self.position = {}
+    
+    
+    # number of nodes
+    def __len__(self):
+        return len(self.heap)
+    
+    
+    # whether a node is in the heap
+    def __contains__(self, key):
+        return key in self.position
+    
+    
+    # add a node, or update its priority if it is already in the heap
+    def Push(self, key, priority, tieBreak=0):
+        """
+        Inputs:
+        
+        key: the key of the node (lattice index).
+        priority: the priority of the node, smaller is popped first.
+        tieBreak: compared when the priorities are equal, smaller is popped first.
+        """
+        
+        entry = (priority, tieBreak, key)
+        index = self.position.get(key)
+        if(index == None):
+            self.heap.append(entry)
+            self.position[key] = len(self.heap) - 1
+            self._SiftUp(len(self.heap) - 1)
+        elif(entry < self.heap[index]):
+            self.heap[index] = entry
+            self._SiftUp(index)
+        else:
+            self.heap[index] = entry
+            self._SiftDown(index)
+    
+    
+    # remove the node with the smallest priority
+    def Pop(self):
+        """
+        Outputs:
+        
+        (priority, tieBreak, key) of the popped node.
+        """
+        
+        heap = self.heap
+        entry = heap[0]
+        last = heap.pop()
+        del self.position[entry[2]]
+        if(len(heap) > 0):
+            heap[0] = last
+            self.position[last[2]] = 0
+            self._SiftDown(0)
+        return entry
+    
+    
+    # move an entry towards the root until the heap property holds
+    def _SiftUp(self, index):
+        heap = self.heap
+        position = self.position
+        entry = heap[index]
+        while(index > 0):
+            parent = (index - 1) >> 1
+            if(entry < heap[parent]):
+                heap[index] = heap[parent]
+                position[heap[index][2]] = index
+                index = parent
+            else:
+                break
+        heap[index] = entry
+        position[entry[2]] = index
+    
+    
+    # move an entry towards the leaves until the heap property holds
+    def _SiftDown(self, index):
+        heap = self.heap
+        position = self.position
+        size = len(heap)
+        entry = heap[index]
+        child = 2 * index + 1
+        while(child < size):
+            if(child + 1 < size and heap[child + 1] < heap[child]):
+                child = child + 1
+            if(heap[child] < entry):
+                heap[index] = heap[child]
+                position[heap[index][2]] = index
+                index = child
+                child = 2 * index + 1
+            else:
+                break
+        heap[index] = entry
+        position[entry[2]] = index
+
+
+# create an open list by name
+def make_open_list(kind):
+    """
+    Inputs:
+    
+    kind: "indexed" (IndexedHeap with decrease-key) or "heapq" (LazyHeap with stale entries).
+    
+    Outputs:
+    
+    The open list object.
+    """
+    
+    if(kind == "indexed"):
+        return IndexedHeap()
+    if(kind == "heapq"):
+        return LazyHeap()
+    raise ValueError("openList must be 'indexed' or 'heapq'")
@@ -0,0 +1,173 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+# header files
+import csv
+import json
+import time
+from turtlebot_astar.astar import AStar
+
+
+# names of the fields of a query, same units as the prompts of scripts/turtlebot_astar_node.py (meters and radians)
+QUERY_FIELDS = ("startX", "startY", "startOrientation", "goalX", "goalY", "firstRPM", "secondRPM", "clearance")
+
+# messages for the queries that can not be planned
+STATUS_MESSAGES = {
+    "start_outside_map": "The entered start node is outside the map ",
+    "goal_outside_map": "The entered goal node outside the map ",
+    "start_in_obstacle": "The entered start node is an obstacle ",
+    "goal_in_obstacle": "The entered goal node is an obstacle ",
+}
+
+
+# create the planner for a query
+def make_planner(query, **options):
+    """
+    Inputs:
+    
+    query: dictionary with the fields of QUERY_FIELDS (in meters and radians).
+    options: extra keyword arguments passed to AStar.
+    
+    Outputs:
+    
+    AStar object working in cms.
+    """
+    
+    start = (float(query["startX"]) * 100.0, float(query["startY"]) * 100.0, float(query["startOrientation"]))
+    goal = (float(query["goalX"]) * 100.0, float(query["goalY"]) * 100.0)
+    wheelRPM = (float(query["firstRPM"]), float(query["secondRPM"]))
+    return AStar(start, goal, wheelRPM, float(query["clearance"]) * 100.0, **options)
+
+
+# checks that the start and the goal of a planner lie in the free space
+def validate(astar):
+    """
+    Inputs:
+    
+    astar: the AStar object.
+    
+    Outputs:
+    
+    None if the query can be planned, otherwise the key of STATUS_MESSAGES describing the problem.
+    """
+    
+    if(astar.IsValid(astar.start[0], astar.start[1]) == False):
+        return "start_outside_map"
+    if(astar.IsValid(astar.goal[0], astar.goal[1]) == False):
+        return "goal_outside_map"
+    if(astar.IsObstacle(astar.start[0], astar.start[1])):
+        return "start_in_obstacle"
+    if(astar.IsObstacle(astar.goal[0], astar.goal[1])):
+        return "goal_in_obstacle"
+    return None
+
+
+# plan a single query
+def run_query(query, timeLimit=None, cache=None, **options):
+    """
+    Inputs:
+    
+    query: dictionary with the fields of QUERY_FIELDS (in meters and radians).
+    timeLimit: optional wall-clock budget (in seconds), the anytime search is used when it is given.
+    cache: optional PlanCache looked up before searching, the paths found are added to it.
+    options: extra keyword arguments passed to AStar (the expanded states are only counted unless recordExplored is given).
+    
+    Outputs:
+    
+    Dictionary with the query, the status ("found", "no_path" or a key of STATUS_MESSAGES), the cost,
+    the path (list of (x, y, theta) in meters), the actions (list of (dvx, dvy, dw)), the number of
+    explored states and the planning time (in seconds). With a timeLimit the explored states are not counted,
+    the suboptimality bound of the cost is added and the status is "partial" if the goal was not reached in time.
+    With a cache, "cached" tells whether the path came from it.
+    """
+    
+    startTime = time.time()
+    astar = make_planner(query, **dict({"recordExplored": 0}, **options))
+    result = {"query": query, "status": validate(astar), "cost": None, "path": [], "actions": [], "explored": 0}
+    
+    # plans already found for a nearby query
+    key = None
+    if(cache != None and result["status"] == None):
+        key = cache.Key(query, **options)
+        plan = cache.Lookup(key, astar, costToCome=timeLimit != None)
+        result["cached"] = plan != None
+        if(plan != None):
+            result.update(status="found", cost=plan["cost"], path=plan["path"], actions=[tuple(action) for action in plan["actions"]])
+    
+    if(result["status"] == None and timeLimit != None):
+        solution = astar.search_anytime(timeLimit)
+        result["status"] = "found" if len(solution["states"]) > 0 and solution["partial"] == False else ("partial" if solution["partial"] else "no_path")
+        result["cost"] = solution["cost"] if result["status"] == "found" else None
+        result["bound"] = solution["bound"] if result["status"] == "found" else None
+        result["path"] = [(state[0] / 100.0, state[1] / 100.0, state[2]) for state in solution["states"]]
+        result["actions"] = [tuple(action) for action in solution["actions"]]
+    elif(result["status"] == None):
+        (exploredStates, backtrackStates, actions, distance) = astar.search()
+        result["explored"] = exploredStates.expanded
+        if(len(backtrackStates) > 0):
+            result["status"] = "found"
+            result["cost"] = distance
+            result["path"] = [(state[0] / 100.0, state[1] / 100.0, state[2]) for state in backtrackStates]
+            result["actions"] = [tuple(action) for action in actions]
+        else:
+            result["status"] = "no_path"
+    if(key != None and result["status"] == "found" and result["cached"] == False):
+        cache.Put(key, {"cost": result["cost"], "actions": result["actions"]})
+    result["time"] = time.time() - startTime
+    return result
+
+
+# read the queries from a JSON, JSON lines or CSV file
+def load_queries(path):
+    """
+    Inputs:
+    
+    path: the path of the file. CSV files need a header row with the names of QUERY_FIELDS, JSON files
+          hold a list of objects (or an object with a "queries" list) and .jsonl files hold one object per line.
+          Extra fields (e.g. an "id") are kept as they are.
+    
+    Outputs:
+    
+    List of query dictionaries.
+    """
+    
+    with open(path) as queryFile:
+        if(path.endswith(".csv")):
+            queries = list(csv.DictReader(queryFile))
+        elif(path.endswith(".jsonl")):
+            queries = [json.loads(line) for line in queryFile if line.strip()]
+        else:
+            queries = json.load(queryFile)
+            if(isinstance(queries, dict)):
+                queries = queries["queries"]
+    
+    for query in queries:
+        missing = [field for field in QUERY_FIELDS if field not in query]
+        if(len(missing) > 0):
+            raise ValueError("query " + str(query) + " is missing the fields " + ", ".join(missing))
+        for field in QUERY_FIELDS:
+            query[field] = float(query[field])
+    return queries
@@ -0,0 +1,383 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+
+# header files
+import copy
+import math
+import numpy as np
+from turtlebot_astar.heuristics import DistanceField
+from turtlebot_astar.lattice import SparseLattice, StateLattice
+from turtlebot_astar.occupancy import OccupancyGrid
+from turtlebot_astar.priority_queue import make_open_list
+from turtlebot_astar.signed_distance import SignedDistanceField
+from turtlebot_astar.tiles import TiledOccupancy
+
+
+# class for incremental replanning, the search tree of an AStar object is kept between queries
+class Replanner(object):
+    
+    # init function
+    def __init__(self, astar, repairSteps=5000):
+        """
+        Inputs:
+        
+        astar: the AStar object, its lattice holds the search tree (rooted at astar.start) between queries.
+        repairSteps: the number of expansions allowed to reconnect a drifted start to the last path.
+        """
+        
+        if(isinstance(astar.lattice, SparseLattice)):
+            raise ValueError("the Replanner needs a dense lattice (latticeStorage='dense')")
+        self.astar = astar
+        self.repairSteps = repairSteps
+        
+        # start - the pose of the robot, the root of the tree until the robot drifts away from the path
+        self.start = astar.start
+        
+        # queue - the open list of the tree, None until the first search
+        self.queue = None
+        
+        # result - the last (exploredStates, backtrackStates, actions, distance), returned again while nothing changes
+        self.result = None
+        
+        # pathIndices, pathCosts - the lattice cells and the costs to come of the states of the last path
+        self.pathIndices = []
+        self.pathCosts = []
+        
+        # goalIndex - the lattice cell of the last goal, closed by Expand without generating its successors
+        self.goalIndex = None
+    
+    
+    # whether the robot is still in the cell the tree is rooted at
+    def Rooted(self):
+        lattice = self.astar.lattice
+        return lattice.Index(self.start[0], self.start[1], self.start[2]) == lattice.Index(self.astar.start[0], self.astar.start[1], self.astar.start[2])
+    
+    
+    # drop the tree and root a new one at the pose of the robot
+    def Reset(self):
+        lattice = self.astar.lattice
+        self.astar.start = self.start
+        self.astar.lattice = StateLattice(lattice.xLength, lattice.yLength, lattice.resolution, lattice.thetaBins)
+        self.queue = make_open_list(self.astar.openList)
+        self.goalIndex = None
+        startIndex = self.astar.lattice.Index(self.start[0], self.start[1], self.start[2])
+        self.astar.lattice.Update(startIndex, self.start[0], self.start[1], self.start[2], 0, self.astar.Heuristic(self.start[0], self.start[1]), -1, -1)
+        self.queue.Push(startIndex, float(self.astar.lattice.distance[startIndex]), 0.0)
+        self.result = None
+    
+    
+    # plan from the pose of the robot to the goal, continuing the search tree
+    def Plan(self, stats=None):
+        """
+        Inputs:
+        
+        stats: optional SearchStats object filled with counters and timers.
+        
+        Outputs:
+        
+        The same (exploredStates, backtrackStates, actions, distance) as AStar.search, exploredStates only holds
+        the states expanded by this call.
+        """
+        
+        if(self.result != None):
+            return self.result
+        if(self.queue == None):
+            self.Reset()
+        
+        (exploredStates, goalIndex) = self.astar.Expand(self.queue, stats)
+        self.goalIndex = goalIndex
+        if(goalIndex == None):
+            self.pathIndices = []
+            self.pathCosts = []
+            self.result = (exploredStates, [], [], float('inf'))
+            return self.result
+        
+        lattice = self.astar.lattice
+        (backtrackStates, actions) = self.astar.Backtrack(goalIndex)
+        self.pathIndices = self.Branch(lattice, goalIndex)
+        self.pathCosts = [float(lattice.costToCome[index]) for index in self.pathIndices]
+        self.result = (exploredStates, backtrackStates, actions, float(lattice.distance[goalIndex]))
+        return self.result
+    
+    
+    # lattice cells from the root of a tree to a cell
+    @staticmethod
+    def Branch(lattice, index):
+        """
+        Inputs:
+        
+        lattice: the StateLattice holding the tree.
+        index: the lattice index of the last cell.
+        
+        Outputs:
+        
+        List of the lattice indices from the root to the cell.
+        """
+        
+        branch = [index]
+        while(lattice.parent[index] != -1):
+            index = int(lattice.parent[index])
+            branch.append(index)
+        return list(reversed(branch))
+    
+    
+    # heuristic of a batch of lattice cells
+    def Heuristics(self, indices):
+        """
+        Inputs:
+        
+        indices: array of lattice indices.
+        
+        Outputs:
+        
+        Array of the heuristic of every cell for the current goal.
+        """
+        
+        lattice = self.astar.lattice
+        if(self.astar.distanceField == None):
+            return self.astar.weight * np.sqrt((lattice.x[indices] - self.astar.goal[0]) ** 2 + (lattice.y[indices] - self.astar.goal[1]) ** 2)
+        return np.array([self.astar.Heuristic(float(lattice.x[index]), float(lattice.y[index])) for index in indices])
+    
+    
+    # rebuild the open list from the cells reached but not expanded (and the closed cells lying in the goal region)
+    def Reopen(self):
+        lattice = self.astar.lattice
+        goalRegion = ((lattice.x - self.astar.goal[0]) ** 2 + (lattice.y - self.astar.goal[1]) ** 2) < self.astar.goalThreshold
+        lattice.closed &= ~goalRegion
+        
+        # the last goal cell was closed without being expanded, paths through or past it need its successors
+        if(self.goalIndex != None):
+            lattice.closed[self.goalIndex] = False
+            self.goalIndex = None
+        self.queue = make_open_list(self.astar.openList)
+        for index in np.nonzero(np.isfinite(lattice.costToCome) & ~lattice.closed)[0].tolist():
+            self.queue.Push(index, float(lattice.distance[index]), float(lattice.costToCome[index]))
+        self.result = None
+    
+    
+    # move the goal, the tree from the start does not depend on it
+    def SetGoal(self, goal):
+        """
+        Inputs:
+        
+        goal: the new goal coordinate, tuple of form (x, y).
+        
+        The keys of the open cells are updated for the new heuristic, and the closed cells already lying in the
+        new goal region are put back in the open list, so the search continues where it stopped.
+        """
+        
+        astar = self.astar
+        lattice = astar.lattice
+        reached = np.nonzero(np.isfinite(lattice.costToCome))[0]
+        oldHeuristic = self.Heuristics(reached) if self.queue != None else None
+        astar.goal = goal
+        if(astar.distanceField != None):
+            grid = astar.occupancyGrid
+            if(isinstance(grid, OccupancyGrid) == False):
+                grid = OccupancyGrid.Build(astar.obstacleMap, astar.clearance, astar.radius, astar.resolution)
+            astar.distanceField = DistanceField.Build(grid, goal, astar.distanceField.resolution)
+        if(self.queue == None or self.Rooted() == False):
+            self.queue = None
+            self.result = None
+            return
+        lattice.distance[reached] += self.Heuristics(reached) - oldHeuristic
+        self.Reopen()
+    
+    
+    # follow actions from the pose of the robot, None unless they stay collision free and end in the goal region
+    def Replay(self, actions):
+        """
+        Inputs:
+        
+        actions: list of (dvx, dvy, dw) values, each followed for 1 s.
+        
+        Outputs:
+        
+        List of the states reached after every action (starting with the pose of the robot), or None.
+        """
+        
+        states = self.astar.FollowActions(self.start, actions)
+        if(states == None or self.astar.IsGoal(states[-1][0], states[-1][1]) == False):
+            return None
+        return states
+    
+    
+    # move the robot, a drifted start is reconnected to the last path by a small search
+    def SetStart(self, start):
+        """
+        Inputs:
+        
+        start: the pose of the robot, tuple of form (x, y, theta).
+        
+        Outputs:
+        
+        True if the last path was reused (from the same lattice cell or through a repair search),
+        False if the next Plan searches from scratch. A reused path is replayed from the pose of the robot
+        and only kept if it is collision free and ends in the goal region.
+        """
+        
+        astar = self.astar
+        lattice = astar.lattice
+        self.start = start
+        if(self.result == None or len(self.pathIndices) == 0):
+            self.queue = None
+            self.result = None
+            return False
+        
+        # still in the first cell of the path
+        startIndex = lattice.Index(start[0], start[1], start[2])
+        (exploredStates, backtrackStates, actions, distance) = self.result
+        if(startIndex == self.pathIndices[0]):
+            states = self.Replay(actions)
+            if(states == None):
+                self.queue = None
+                self.result = None
+                return False
+            self.result = (exploredStates, states, actions, distance)
+            return True
+        
+        # join the path at or after its state closest to the robot
+        closest = min(range(len(backtrackStates)), key=lambda position: (backtrackStates[position][0] - start[0]) ** 2 + (backtrackStates[position][1] - start[1]) ** 2)
+        positions = dict((index, position) for (position, index) in enumerate(self.pathIndices) if position >= closest)
+        repair = copy.copy(astar)
+        repair.start = start
+        repair.goal = backtrackStates[min(closest + 1, len(backtrackStates) - 1)][:2]
+        repair.distanceField = None
+        repair.maxSteps = self.repairSteps
+        repair.lattice = StateLattice(lattice.xLength, lattice.yLength, lattice.resolution, lattice.thetaBins)
+        queue = make_open_list(astar.openList)
+        repair.lattice.Update(startIndex, start[0], start[1], start[2], 0, repair.Heuristic(start[0], start[1]), -1, -1)
+        queue.Push(startIndex, float(repair.lattice.distance[startIndex]), 0.0)
+        (repairStates, joinIndex) = repair.Expand(queue, goalTest=lambda index, state: index in positions)
+        if(joinIndex == None):
+            self.queue = None
+            self.result = None
+            return False
+        
+        # the repair reaches the join cell at another pose, so the primitives of the rest of the last path
+        # are rolled out again from that pose and the whole path is checked before it is kept
+        join = positions[joinIndex]
+        (joinStates, joinActions) = repair.Backtrack(joinIndex)
+        theta = float(repair.lattice.theta[joinIndex])
+        for index in self.pathIndices[join + 1:]:
+            action = int(lattice.action[index])
+            joinActions.append(astar.primitives.Command(theta, action))
+            theta += float(astar.primitives.angularVelocity[action])
+        states = self.Replay(joinActions)
+        if(states == None):
+            self.queue = None
+            self.result = None
+            return False
+        
+        # splice the repair path with the rest of the last path
+        joinIndices = self.Branch(repair.lattice, joinIndex)
+        offset = float(repair.lattice.costToCome[joinIndex]) - self.pathCosts[join]
+        self.pathIndices = joinIndices + self.pathIndices[join + 1:]
+        self.pathCosts = [float(repair.lattice.costToCome[index]) for index in joinIndices] + [cost + offset for cost in self.pathCosts[join + 1:]]
+        self.result = (repairStates, states, joinActions, distance + offset)
+        return True
+    
+    
+    # change the obstacles in a region of the map, only the part of the tree near the region is searched again
+    def UpdateMap(self, obstacleMap, region):
+        """
+        Inputs:
+        
+        obstacleMap: the new ObstacleMap (same size as the old one).
+        region: the bounds (minX, minY, maxX, maxY) of the change (in cms), covering the obstacles added and removed.
+        
+        The cells whose arc from their parent now hits an obstacle are dropped with their subtrees, and the
+        closed cells near the region or near a dropped cell are put back in the open list.
+        """
+        
+        astar = self.astar
+        lattice = astar.lattice
+        if(obstacleMap.xLength != astar.xLength or obstacleMap.yLength != astar.yLength):
+            raise ValueError("the new map must have the size of the old one")
+        astar.obstacleMap = obstacleMap
+        if(isinstance(astar.occupancyGrid, TiledOccupancy)):
+            astar.occupancyGrid = TiledOccupancy.Build(obstacleMap, astar.clearance, astar.radius, astar.occupancyGrid.resolution, astar.occupancyGrid.tileSize)
+        elif(astar.occupancyGrid != None):
+            astar.occupancyGrid = OccupancyGrid.Build(obstacleMap, astar.clearance, astar.radius, astar.occupancyGrid.resolution)
+        if(astar.signedDistance != None):
+            astar.signedDistance = SignedDistanceField.Build(obstacleMap, astar.signedDistance.resolution)
+        if(astar.distanceField != None):
+            grid = astar.occupancyGrid
+            if(isinstance(grid, OccupancyGrid) == False):
+                grid = OccupancyGrid.Build(obstacleMap, astar.clearance, astar.radius, astar.resolution)
+            astar.distanceField = DistanceField.Build(grid, astar.goal, astar.distanceField.resolution)
+        if(self.queue == None or self.Rooted() == False):
+            self.queue = None
+            self.result = None
+            return
+        
+        # an arc passing through the (inflated) region ends within the longest arc of it
+        influence = 1.4142 * (astar.clearance + astar.radius) + 2.0 * astar.resolution
+        reach = float(np.max(astar.primitives.cost)) + influence
+        reached = np.nonzero(np.isfinite(lattice.costToCome) & (lattice.parent != -1))[0]
+        nearRegion = (lattice.x[reached] >= region[0] - reach) & (lattice.x[reached] <= region[2] + reach) & (lattice.y[reached] >= region[1] - reach) & (lattice.y[reached] <= region[3] + reach)
+        candidates = reached[nearRegion]
+        
+        # check the arcs to the candidates again, one rollout per parent
+        invalid = np.zeros(lattice.distance.shape, dtype=bool)
+        parents = lattice.parent[candidates]
+        for parentIndex in np.unique(parents).tolist():
+            flags = astar.RolloutPrimitives(lattice.State(parentIndex))[7]
+            for index in candidates[parents == parentIndex].tolist():
+                if(flags[lattice.action[index]] == False):
+                    invalid[index] = True
+        
+        # the subtrees of the dropped cells go with them
+        hasParent = np.nonzero(lattice.parent != -1)[0]
+        while(True):
+            dropped = hasParent[~invalid[hasParent] & invalid[lattice.parent[hasParent]]]
+            if(len(dropped) == 0):
+                break
+            invalid[dropped] = True
+        
+        # cells of the plane (near the region or a dropped cell) whose closed cells are expanded again
+        planeCells = (lattice.xCells, lattice.yCells)
+        near = np.zeros(planeCells, dtype=bool)
+        first = lattice.IndexBatch(np.array([region[0] - influence, region[2] + influence]), np.array([region[1] - influence, region[3] + influence]), np.zeros(2)) // lattice.thetaBins
+        (firstX, firstY) = np.unravel_index(first, planeCells)
+        near[firstX[0]:firstX[1] + 1, firstY[0]:firstY[1] + 1] = True
+        droppedCells = np.nonzero(invalid)[0] // lattice.thetaBins
+        near.reshape(-1)[droppedCells] = True
+        cells = int(math.ceil(float(np.max(astar.primitives.cost)) / lattice.resolution)) + 1
+        grown = near.copy()
+        for shiftX in range(-cells, cells + 1):
+            for shiftY in range(-cells, cells + 1):
+                grown[max(shiftX, 0):planeCells[0] + min(shiftX, 0), max(shiftY, 0):planeCells[1] + min(shiftY, 0)] |= near[max(-shiftX, 0):planeCells[0] + min(-shiftX, 0), max(-shiftY, 0):planeCells[1] + min(-shiftY, 0)]
+        
+        # drop the invalid cells and reopen the closed cells around them
+        lattice.costToCome[invalid] = np.inf
+        lattice.distance[invalid] = np.inf
+        lattice.parent[invalid] = -1
+        lattice.action[invalid] = -1
+        lattice.closed[invalid] = False
+        lattice.closed &= ~np.repeat(grown.reshape(-1), lattice.thetaBins)
+        self.Reopen()
@@ -0,0 +1,87 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+# create the ROS publisher for the velocity commands of the turtlebot
+def make_publisher(topic='/mobile_base/commands/velocity'):
+    """
+    Inputs:
+    
+    topic: the ROS topic on which the velocity commands are published
+    
+    Outputs:
+    
+    The ROS publisher
+    """
+    
+    import rospy
+    from geometry_msgs.msg import Twist
+    
+    return rospy.Publisher(topic, Twist, queue_size=10)
+
+
+# publisher of coalesced velocity commands to the turtlebot (see turtlebot_astar.execution)
+class RosPublisher(object):
+    
+    # init function
+    def __init__(self, publisher=None, topic='/mobile_base/commands/velocity', rate=10.0):
+        """
+        Inputs:
+        
+        publisher: an existing ROS publisher (made with make_publisher when None).
+        topic: the ROS topic used when the publisher is made here.
+        rate: the rate (in Hz) at which a command is repeated, the base drops a command it has not heard again for ~0.5 s.
+        """
+        
+        self.publisher = publisher if publisher != None else make_publisher(topic)
+        self.rate = rate
+    
+    # publish a velocity command and hold it for its duration
+    def Send(self, velocity, angularVelocity, duration):
+        """
+        Inputs:
+        
+        velocity: linear velocity (in cm/s).
+        angularVelocity: angular velocity (in rad/s).
+        duration: the time (in seconds) during which the command is held.
+        """
+        
+        import rospy
+        from geometry_msgs.msg import Twist
+        
+        # one message, republished at the keepalive rate until the command ends
+        message = Twist()
+        message.linear.x = velocity / 100.0
+        message.angular.z = angularVelocity
+        r = rospy.Rate(self.rate)
+        endTime = rospy.Time.now() + rospy.Duration(duration)
+        while(rospy.Time.now() < endTime and rospy.is_shutdown() == False):
+            self.publisher.publish(message)
+            r.sleep()
+    
+    # stop the robot
+    def Stop(self):
+        from geometry_msgs.msg import Twist
+        self.publisher.publish(Twist())
@@ -0,0 +1,219 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+
+# header files
+import math
+import os
+import numpy as np
+
+
+# class for the euclidean distance from every cell of a map to the nearest (uninflated) obstacle
+class SignedDistanceField(object):
+    
+    # fields already computed, keyed by (map key, resolution, maxDistance)
+    cache = {}
+    
+    # init function
+    def __init__(self, distance, xLength, yLength, resolution):
+        """
+        Inputs:
+        
+        distance: numpy array of shape (nx, ny), the signed distance from the center of every cell to the nearest obstacle
+                  (negative inside obstacles).
+        xLength: half of the map size along x-direction (map spans -xLength to xLength).
+        yLength: half of the map size along y-direction (map spans -yLength to yLength).
+        resolution: the side of a cell (in cms).
+        """
+        
+        self.distance = distance
+        self.xLength = xLength
+        self.yLength = yLength
+        self.resolution = float(resolution)
+        (self.xCells, self.yCells) = distance.shape
+        
+        # slack - the largest distance between a point and the center of its cell
+        self.slack = 0.7072 * self.resolution
+    
+    
+    # directory of the fields saved on disk
+    @staticmethod
+    def CacheDirectory():
+        """
+        Outputs:
+        
+        The directory given by TURTLEBOT_ASTAR_CACHE, or ~/.cache/turtlebot_astar.
+        """
+        
+        return os.environ.get("TURTLEBOT_ASTAR_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "turtlebot_astar"))
+    
+    
+    # build (or fetch from the memory or disk cache) the field of a map
+    @classmethod
+    def Build(cls, obstacleMap, resolution=1.0, maxDistance=100.0, cacheDirectory=None):
+        """
+        Inputs:
+        
+        obstacleMap: the ObstacleMap (see turtlebot_astar.obstacles).
+        resolution: the side of a cell (in cms).
+        maxDistance: distances are only computed up to this value (in cms), farther cells hold maxDistance.
+        cacheDirectory: the directory the field is saved to and loaded from (defaults to CacheDirectory()),
+                        False to keep the field in memory only.
+        
+        Outputs:
+        
+        SignedDistanceField object. The distances are exact for the cell centers, every obstacle only visits
+        the cells within maxDistance of its bounds. Saved fields are memory mapped, so processes share them.
+        """
+        
+        key = (obstacleMap.key, resolution, maxDistance)
+        field = cls.cache.get(key)
+        if(field != None):
+            return field
+        
+        # load the field saved by an earlier run
+        if(cacheDirectory == None):
+            cacheDirectory = cls.CacheDirectory()
+        path = None
+        if(cacheDirectory != False):
+            path = os.path.join(cacheDirectory, "sdf_" + obstacleMap.key + "_" + repr(float(resolution)) + "_" + repr(float(maxDistance)) + ".npy")
+        distance = None
+        if(path != None and os.path.exists(path)):
+            try:
+                distance = np.load(path, mmap_mode="r")
+            except (OSError, ValueError):
+                distance = None
+        
+        # minimum of the exact distances to the nearby obstacles
+        if(distance is None):
+            xCells = int(math.ceil(2.0 * obstacleMap.xLength / resolution))
+            yCells = int(math.ceil(2.0 * obstacleMap.yLength / resolution))
+            distance = np.full((xCells, yCells), maxDistance, dtype=np.float32)
+            for obstacle in obstacleMap.obstacles:
+                (minX, minY, maxX, maxY) = obstacle.Bounds(0.0)
+                (minX, minY, maxX, maxY) = (minX - maxDistance, minY - maxDistance, maxX + maxDistance, maxY + maxDistance)
+                firstX = max(int(math.floor((minX + obstacleMap.xLength) / resolution - 0.5)), 0)
+                firstY = max(int(math.floor((minY + obstacleMap.yLength) / resolution - 0.5)), 0)
+                lastX = min(int(math.ceil((maxX + obstacleMap.xLength) / resolution - 0.5)) + 1, xCells)
+                lastY = min(int(math.ceil((maxY + obstacleMap.yLength) / resolution - 0.5)) + 1, yCells)
+                if(firstX >= lastX or firstY >= lastY):
+                    continue
+                centerX = -obstacleMap.xLength + (np.arange(firstX, lastX) + 0.5) * resolution
+                centerY = -obstacleMap.yLength + (np.arange(firstY, lastY) + 0.5) * resolution
+                window = distance[firstX:lastX, firstY:lastY]
+                np.minimum(window, obstacle.Distance(centerX[:, None], centerY[None, :]), out=window)
+            
+            # save it atomically, a failed save only costs the next run a rebuild
+            if(path != None):
+                try:
+                    os.makedirs(cacheDirectory, exist_ok=True)
+                    temporary = path + "." + str(os.getpid()) + ".tmp.npy"
+                    np.save(temporary, distance)
+                    os.replace(temporary, path)
+                except OSError:
+                    pass
+        
+        field = cls(distance, obstacleMap.xLength, obstacleMap.yLength, resolution)
+        cls.cache[key] = field
+        return field
+    
+    
+    # distance from a position to the nearest obstacle
+    def Distance(self, row, col):
+        """
+        Inputs:
+        
+        row - the x-position.
+        col - the y-position.
+        
+        Outputs:
+        
+        A lower bound of the distance from the position to the nearest obstacle (the distance of its cell reduced by
+        the slack of the cell), -inf outside the map.
+        """
+        
+        indexX = int(math.floor((row + self.xLength) / self.resolution))
+        indexY = int(math.floor((col + self.yLength) / self.resolution))
+        if(indexX < 0 or indexY < 0 or indexX >= self.xCells or indexY >= self.yCells):
+            return -math.inf
+        return float(self.distance[indexX, indexY]) - self.slack
+    
+    
+    # distances from a batch of positions to the nearest obstacle
+    def DistanceBatch(self, rows, cols):
+        """
+        Inputs:
+        
+        rows - array of x-positions.
+        cols - array of y-positions.
+        
+        Outputs:
+        
+        Array of the same shape with the lower bounds of Distance (-inf outside the map).
+        """
+        
+        indexX = np.floor((np.asarray(rows) + self.xLength) / self.resolution).astype(np.int64)
+        indexY = np.floor((np.asarray(cols) + self.yLength) / self.resolution).astype(np.int64)
+        inside = (indexX >= 0) & (indexY >= 0) & (indexX < self.xCells) & (indexY < self.yCells)
+        result = np.full(indexX.shape, -np.inf)
+        result[inside] = self.distance[indexX[inside], indexY[inside]] - self.slack
+        return result
+    
+    
+    # checks for an obstacle at the given position
+    def IsObstacle(self, row, col, clearance, radius):
+        """
+        Inputs:
+        
+        row - the x-position of the robot.
+        col - the y-position of the robot.
+        clearance - the clearance that the robot needs to have with the obstacles.
+        radius - the radius of the robot.
+        
+        Outputs:
+        
+        True / False depending on whether the robot may be closer than clearance to an obstacle (outside the map counts as obstacle).
+        """
+        
+        return self.Distance(row, col) <= clearance + radius
+    
+    
+    # checks for obstacles at a batch of positions
+    def IsObstacleBatch(self, rows, cols, clearance, radius):
+        """
+        Inputs:
+        
+        rows - array of x-positions of the robot.
+        cols - array of y-positions of the robot.
+        clearance - the clearance that the robot needs to have with the obstacles.
+        radius - the radius of the robot.
+        
+        Outputs:
+        
+        Boolean array of the same shape, True for the positions where the robot may be closer than clearance to an obstacle.
+        """
+        
+        return self.DistanceBatch(rows, cols) <= clearance + radius
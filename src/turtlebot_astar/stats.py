@@ -0,0 +1,85 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+# header files
+import time
+
+
+# class for the counters and timers collected by AStar.search
+class SearchStats(object):
+    
+    # fixed attributes, a stats object is updated at every expansion
+    __slots__ = ("expanded", "generated", "rejectedCollision", "rejectedDuplicate", "heapPushes", "heapPops", "stalePops",
+                 "shotAttempts", "rolloutTime", "collisionTime", "heapTime", "totalTime", "startTime")
+    
+    # init function
+    def __init__(self):
+        
+        # expanded - nodes expanded (popped and not already closed)
+        self.expanded = 0
+        
+        # generated - successors rolled out from the expanded nodes
+        self.generated = 0
+        
+        # rejectedCollision - successors leaving the map (IsValid) or hitting an obstacle (IsObstacle)
+        self.rejectedCollision = 0
+        
+        # rejectedDuplicate - successors pruned by the state lattice (cell already closed or not cheaper)
+        self.rejectedDuplicate = 0
+        
+        # heapPushes, heapPops, stalePops - operations on the open list, stale pops are nodes popped after being closed
+        self.heapPushes = 0
+        self.heapPops = 0
+        self.stalePops = 0
+        
+        # shotAttempts - analytic connections to the goal tried (AStar goalShot)
+        self.shotAttempts = 0
+        
+        # timers (in seconds)
+        self.rolloutTime = 0.0
+        self.collisionTime = 0.0
+        self.heapTime = 0.0
+        self.totalTime = 0.0
+        self.startTime = time.perf_counter()
+    
+    
+    # the stats as a dictionary
+    def AsDict(self):
+        """
+        Outputs:
+        
+        Dictionary of every counter and timer, with the expansions per second.
+        """
+        
+        stats = dict((name, getattr(self, name)) for name in self.__slots__ if name != "startTime")
+        stats["elapsedTime"] = time.perf_counter() - self.startTime if self.totalTime == 0.0 else self.totalTime
+        stats["expansionsPerSecond"] = self.expanded / stats["elapsedTime"] if stats["elapsedTime"] > 0 else 0.0
+        return stats
+    
+    
+    # print friendly form of the stats
+    def __repr__(self):
+        return "SearchStats(" + ", ".join(name + "=" + str(value) for (name, value) in sorted(self.AsDict().items())) + ")"
@@ -0,0 +1,277 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+
+
+# header files
+import math
+import os
+import numpy as np
+from collections import OrderedDict
+from turtlebot_astar.signed_distance import SignedDistanceField
+
+
+# class for the inflated obstacle space stored on disk in square tiles, read through an LRU of hot tiles
+class TiledOccupancy(object):
+    
+    # grids already opened in this process, keyed by (map key, clearance, radius, resolution, tileSize)
+    cache = {}
+    
+    # init function
+    def __init__(self, tiles, xLength, yLength, resolution, xCells, yCells, key=None, cacheTiles=256):
+        """
+        Inputs:
+        
+        tiles: boolean array of shape (tilesX, tilesY, tileSize, tileSize), usually a numpy memmap, True for the
+               cells lying in the obstacle space (and the cells of the last tiles lying outside the map).
+        xLength: half of the map size along x-direction (map spans -xLength to xLength).
+        yLength: half of the map size along y-direction (map spans -yLength to yLength).
+        resolution: the side of a cell (in cms).
+        xCells: the number of cells of the map along x-direction.
+        yCells: the number of cells of the map along y-direction.
+        key: the key of the grid in the cache, None for grids that are not cached.
+        cacheTiles: the number of tiles kept in memory.
+        """
+        
+        self.tiles = tiles
+        self.key = key
+        self.xLength = xLength
+        self.yLength = yLength
+        self.resolution = float(resolution)
+        self.xCells = xCells
+        self.yCells = yCells
+        (self.tilesX, self.tilesY, self.tileSize, _) = tiles.shape
+        
+        # hot - the tiles copied in memory, least recently used first
+        self.cacheTiles = cacheTiles
+        self.hot = OrderedDict()
+        
+        # window - the hot tiles of the last batch copied next to each other, windowBounds - (firstTileX, firstTileY, lastTileX, lastTileY)
+        self.window = None
+        self.windowBounds = None
+        
+        # pageIns - tiles read from the disk, hits - tiles served from memory
+        self.pageIns = 0
+        self.hits = 0
+    
+    
+    # build (or open from the memory or disk cache) the tiles of a map for a given clearance and radius
+    @classmethod
+    def Build(cls, obstacleMap, clearance, radius, resolution=1.0, tileSize=256, cacheDirectory=None, cacheTiles=256):
+        """
+        Inputs:
+        
+        obstacleMap: the ObstacleMap rasterized.
+        clearance: the clearance that the robot needs to have with the obstacles.
+        radius: the radius of the robot.
+        resolution: the side of a cell (in cms).
+        tileSize: the side of a tile (in cells).
+        cacheDirectory: the directory the tiles are saved to and opened from (defaults to
+                        SignedDistanceField.CacheDirectory()), False to keep them in memory only.
+        cacheTiles: the number of tiles kept in memory.
+        
+        Outputs:
+        
+        TiledOccupancy object with the same cells as OccupancyGrid.Build. The tiles are rasterized one at a time
+        into a memory mapped file, so the map is never held in memory as a whole, and later runs and worker
+        processes only read the tiles their searches touch.
+        """
+        
+        key = (obstacleMap.key, clearance, radius, resolution, tileSize)
+        grid = cls.cache.get(key)
+        if(grid != None):
+            return grid
+        
+        xCells = int(math.ceil(2.0 * obstacleMap.xLength / resolution))
+        yCells = int(math.ceil(2.0 * obstacleMap.yLength / resolution))
+        shape = ((xCells + tileSize - 1) // tileSize, (yCells + tileSize - 1) // tileSize, tileSize, tileSize)
+        if(cacheDirectory == None):
+            cacheDirectory = SignedDistanceField.CacheDirectory()
+        path = None
+        if(cacheDirectory != False):
+            path = os.path.join(cacheDirectory, "tiles_" + obstacleMap.key + "_" + "_".join(repr(float(value)) for value in (clearance, radius, resolution)) + "_" + str(tileSize) + ".npy")
+        
+        # open the tiles saved by an earlier run
+        tiles = None
+        if(path != None and os.path.exists(path)):
+            try:
+                tiles = np.load(path, mmap_mode="r")
+            except (OSError, ValueError):
+                tiles = None
+            if(tiles is not None and tiles.shape != shape):
+                tiles = None
+        
+        # rasterize tile by tile, straight into the file when there is one
+        if(tiles is None):
+            target = None
+            if(path != None):
+                try:
+                    os.makedirs(cacheDirectory, exist_ok=True)
+                    temporary = path + "." + str(os.getpid()) + ".tmp.npy"
+                    target = np.lib.format.open_memmap(temporary, mode="w+", dtype=bool, shape=shape)
+                except OSError:
+                    target = None
+            if(target is None):
+                target = np.zeros(shape, dtype=bool)
+            for tileX in range(0, shape[0]):
+                for tileY in range(0, shape[1]):
+                    tile = obstacleMap.Rasterize(tileSize, tileSize, resolution, clearance, radius, 0.7072 * resolution, tileX * tileSize, tileY * tileSize)
+                    tile[max(xCells - tileX * tileSize, 0):, :] = True
+                    tile[:, max(yCells - tileY * tileSize, 0):] = True
+                    target[tileX, tileY] = tile
+            tiles = target
+            
+            # publish the file atomically, a failed save only costs the next run a rebuild
+            if(isinstance(target, np.memmap)):
+                try:
+                    target.flush()
+                    del target
+                    os.replace(temporary, path)
+                    tiles = np.load(path, mmap_mode="r")
+                except OSError:
+                    pass
+        
+        grid = cls(tiles, obstacleMap.xLength, obstacleMap.yLength, resolution, xCells, yCells, key, cacheTiles)
+        cls.cache[key] = grid
+        return grid
+    
+    
+    # a tile, from the hot tiles or read from the disk
+    def Tile(self, tileX, tileY):
+        """
+        Inputs:
+        
+        tileX: the index of the tile along x-direction.
+        tileY: the index of the tile along y-direction.
+        
+        Outputs:
+        
+        Boolean numpy array of shape (tileSize, tileSize), the cells of the tile.
+        """
+        
+        tile = self.hot.get((tileX, tileY))
+        if(tile is not None):
+            self.hot.move_to_end((tileX, tileY))
+            self.hits += 1
+            return tile
+        tile = np.array(self.tiles[tileX, tileY])
+        self.pageIns += 1
+        self.hot[(tileX, tileY)] = tile
+        if(len(self.hot) > self.cacheTiles):
+            self.hot.popitem(last=False)
+        return tile
+    
+    
+    # copy the tiles of a rectangle of tiles next to each other
+    def Window(self, firstTileX, firstTileY, lastTileX, lastTileY):
+        """
+        Inputs:
+        
+        firstTileX, firstTileY: the first tile of the rectangle.
+        lastTileX, lastTileY: the last tile of the rectangle (included).
+        
+        Outputs:
+        
+        Boolean numpy array holding the cells of the rectangle. The window of the last call is reused while
+        the rectangles asked for lie inside it.
+        """
+        
+        bounds = self.windowBounds
+        if(bounds != None and bounds[0] <= firstTileX and bounds[1] <= firstTileY and lastTileX <= bounds[2] and lastTileY <= bounds[3]):
+            return self.window
+        size = self.tileSize
+        window = np.empty(((lastTileX - firstTileX + 1) * size, (lastTileY - firstTileY + 1) * size), dtype=bool)
+        for tileX in range(firstTileX, lastTileX + 1):
+            for tileY in range(firstTileY, lastTileY + 1):
+                window[(tileX - firstTileX) * size:(tileX - firstTileX + 1) * size, (tileY - firstTileY) * size:(tileY - firstTileY + 1) * size] = self.Tile(tileX, tileY)
+        self.window = window
+        self.windowBounds = (firstTileX, firstTileY, lastTileX, lastTileY)
+        return window
+    
+    
+    # checks for an obstacle at the given position
+    def IsObstacle(self, row, col):
+        """
+        Inputs:
+        
+        row - the current x-position of the robot.
+        col - the current y-posiiton of the robot.
+        
+        Outputs:
+        
+        True / False depending on whether the nodes lies within obstacle or not (outside the grid counts as obstacle).
+        """
+        
+        indexX = int(math.floor((row + self.xLength) / self.resolution))
+        indexY = int(math.floor((col + self.yLength) / self.resolution))
+        if(indexX < 0 or indexY < 0 or indexX >= self.xCells or indexY >= self.yCells):
+            return True
+        tile = self.Tile(indexX // self.tileSize, indexY // self.tileSize)
+        return bool(tile[indexX % self.tileSize, indexY % self.tileSize])
+    
+    
+    # checks for obstacles at a batch of positions
+    def IsObstacleBatch(self, rows, cols):
+        """
+        Inputs:
+        
+        rows - array of x-positions.
+        cols - array of y-positions.
+        
+        Outputs:
+        
+        Boolean array of the same shape, True for the positions lying within obstacle (or outside the grid).
+        """
+        
+        rows = np.asarray(rows)
+        indexX = np.floor((rows.reshape(-1) + self.xLength) / self.resolution).astype(np.int64)
+        indexY = np.floor((np.asarray(cols).reshape(-1) + self.yLength) / self.resolution).astype(np.int64)
+        if(len(indexX) == 0):
+            return np.zeros(rows.shape, dtype=bool)
+        outside = (indexX < 0) | (indexY < 0) | (indexX >= self.xCells) | (indexY >= self.yCells)
+        np.clip(indexX, 0, self.xCells - 1, out=indexX)
+        np.clip(indexY, 0, self.yCells - 1, out=indexY)
+        
+        # the positions of a batch lie close together, so the few tiles around them are gathered from in one take
+        size = self.tileSize
+        firstTileX = int(indexX.min()) // size
+        firstTileY = int(indexY.min()) // size
+        lastTileX = int(indexX.max()) // size
+        lastTileY = int(indexY.max()) // size
+        if((lastTileX - firstTileX + 1) * (lastTileY - firstTileY + 1) <= self.cacheTiles):
+            window = self.Window(firstTileX, firstTileY, lastTileX, lastTileY)
+            (windowX, windowY) = self.windowBounds[0:2]
+            occupied = np.take(window, (indexX - windowX * size) * window.shape[1] + (indexY - windowY * size))
+        
+        # positions spread over more tiles than the cache holds are gathered tile by tile
+        else:
+            tileIndex = (indexX // size) * self.tilesY + indexY // size
+            occupied = np.empty(len(tileIndex), dtype=bool)
+            for index in np.unique(tileIndex).tolist():
+                inTile = tileIndex == index
+                tile = self.Tile(index // self.tilesY, index % self.tilesY)
+                occupied[inTile] = tile[indexX[inTile] % size, indexY[inTile] % size]
+        return (occupied | outside).reshape(rows.shape)
@@ -0,0 +1,285 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+
+
+# header files
+import os
+import numpy as np
+from turtlebot_astar.node_store import NodeStore
+
+
+# inflated obstacle space of a planner rasterized as a boolean image
+def obstacle_image(astar, resolution=2.0):
+    """
+    Inputs:
+    
+    astar: the AStar object.
+    resolution: the side of a pixel (in cms).
+    
+    Outputs:
+    
+    Boolean numpy array of shape (yCells, xCells), row 0 at the bottom of the map, True for the pixels within the obstacle space.
+    """
+    
+    xCells = int(np.ceil(2 * astar.xLength / resolution))
+    yCells = int(np.ceil(2 * astar.yLength / resolution))
+    return astar.obstacleMap.Rasterize(xCells, yCells, resolution, astar.clearance, astar.radius).T
+
+
+# draw the obstacles of a planner on matplotlib axes
+def draw_obstacles(ax, astar, style="image", resolution=2.0):
+    """
+    Inputs:
+    
+    ax: the matplotlib axes.
+    astar: the AStar object.
+    style: "image" (the inflated obstacle space rasterized with resolution) or "patches"
+           (one shape per obstacle, the inflated obstacle in light blue around the obstacle itself).
+    resolution: the side of a pixel (in cms) of the image.
+    """
+    
+    from matplotlib.patches import Circle as CirclePatch, Polygon
+    from turtlebot_astar.obstacles import Circle
+    
+    if(style == "image"):
+        occupied = obstacle_image(astar, resolution)
+        pixels = np.zeros(occupied.shape + (4,), dtype=np.float32)
+        pixels[occupied] = (0.0, 0.0, 1.0, 1.0)
+        extent = (-astar.xLength / 100.0, astar.xLength / 100.0, -astar.yLength / 100.0, astar.yLength / 100.0)
+        ax.imshow(pixels, origin="lower", extent=extent, interpolation="nearest", zorder=0)
+        return
+    if(style != "patches"):
+        raise ValueError("style must be 'image' or 'patches', got %r" % (style,))
+    
+    # one patch for the inflated obstacle and one for the obstacle
+    margin = astar.clearance + astar.radius
+    for obstacle in astar.obstacleMap.obstacles:
+        for (inflation, color) in ((margin, "lightblue"), (0.0, "b")):
+            if(isinstance(obstacle, Circle)):
+                ax.add_patch(CirclePatch((obstacle.x / 100.0, obstacle.y / 100.0), (obstacle.radius + inflation) / 100.0, color=color, zorder=0))
+            else:
+                halfWidth = 0.5 * obstacle.width + obstacle.Inflation(inflation)
+                halfHeight = 0.5 * obstacle.height + obstacle.Inflation(inflation)
+                localX = np.array([-halfWidth, halfWidth, halfWidth, -halfWidth])
+                localY = np.array([-halfHeight, -halfHeight, halfHeight, halfHeight])
+                cornersX = obstacle.x + obstacle.cos * localX - obstacle.sin * localY
+                cornersY = obstacle.y + obstacle.sin * localX + obstacle.cos * localY
+                ax.add_patch(Polygon(np.stack([cornersX, cornersY], axis=1) / 100.0, closed=True, color=color, zorder=0))
+
+
+# arrows from the parent of every explored state to the state
+def explored_segments(astar, exploredStates):
+    """
+    Inputs:
+    
+    astar: the AStar object that was searched.
+    exploredStates: NodeStore (or list) of explored states returned by the search.
+    
+    Outputs:
+    
+    Tuple of numpy arrays (x, y, u, v) in meters, the tails and the components of the arrows, in the order of expansion.
+    """
+    
+    if(len(exploredStates) == 0):
+        empty = np.zeros(0)
+        return (empty, empty, empty, empty)
+    
+    # the parents are kept by a NodeStore, otherwise read from the lattice cells of the states, the start has none
+    lattice = astar.lattice
+    states = np.asarray(exploredStates, dtype=np.float64)
+    if(isinstance(exploredStates, NodeStore)):
+        parents = exploredStates.parent[:len(exploredStates)]
+    else:
+        parents = lattice.parent[lattice.IndexBatch(states[:, 0], states[:, 1], states[:, 2])]
+    keep = parents >= 0
+    states = states[keep]
+    parents = parents[keep]
+    parentX = lattice.x[parents].astype(np.float64)
+    parentY = lattice.y[parents].astype(np.float64)
+    return (parentX / 100.0, parentY / 100.0, (states[:, 0] - parentX) / 100.0, (states[:, 1] - parentY) / 100.0)
+
+
+# arrows between consecutive states of a path
+def path_segments(backtrackStates):
+    """
+    Inputs:
+    
+    backtrackStates: list of states of the path from start node to goal node.
+    
+    Outputs:
+    
+    Tuple of numpy arrays (x, y, u, v) in meters, the tails and the components of the arrows.
+    """
+    
+    states = np.asarray(backtrackStates, dtype=np.float64).reshape(-1, 3)[:, :2] / 100.0
+    steps = np.diff(states, axis=0)
+    return (states[:-1, 0], states[:-1, 1], steps[:, 0], steps[:, 1])
+
+
+# set up axes with the map extent, the labels and the legend
+def _setup(ax, astar, obstacles, resolution):
+    from matplotlib.lines import Line2D
+    
+    ax.set_xlabel("x-coordinate(in m)")
+    ax.set_ylabel("y-coordinate(in m)")
+    ax.grid()
+    ax.set_aspect('equal')
+    ax.set_xlim(-astar.xLength / 100.0, astar.xLength / 100.0)
+    ax.set_ylim(-astar.yLength / 100.0, astar.yLength / 100.0)
+    draw_obstacles(ax, astar, obstacles, resolution)
+    
+    # proxy handles, so the legend is complete before the arrows are drawn
+    ax.legend(handles=[Line2D([], [], color='g', label='Explored region'), Line2D([], [], color='r', label='Backtrack path')], loc='upper right')
+
+
+# quiver of arrows in the style of the original animation
+def _quiver(ax, segments, color, **options):
+    (x, y, u, v) = segments
+    return ax.quiver(x, y, u, v, units='xy', scale=1, color=color, **options)
+
+
+# headless figure of a search
+def plot_search(astar, exploredStates, backtrackStates, obstacles="image", resolution=2.0, figsize=(8, 8)):
+    """
+    Inputs:
+    
+    astar: the AStar object that was searched.
+    exploredStates: list of explored states returned by the search.
+    backtrackStates: list of states of the path from start node to goal node.
+    obstacles: "image" or "patches", see draw_obstacles.
+    resolution: the side of a pixel (in cms) of the obstacle image.
+    figsize: the size of the figure (in inches).
+    
+    Outputs:
+    
+    The matplotlib Figure, drawn on an Agg canvas (no display or pyplot needed).
+    """
+    
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    
+    figure = Figure(figsize=figsize)
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot(1, 1, 1)
+    _setup(ax, astar, obstacles, resolution)
+    _quiver(ax, explored_segments(astar, exploredStates), 'g')
+    if(len(backtrackStates) > 1):
+        _quiver(ax, path_segments(backtrackStates), 'r')
+    return figure
+
+
+# save the figure of a search as a PNG file
+def save_plot(astar, exploredStates, backtrackStates, path, dpi=200, obstacles="image", resolution=2.0):
+    """
+    Inputs:
+    
+    astar: the AStar object that was searched.
+    exploredStates: list of explored states returned by the search.
+    backtrackStates: list of states of the path from start node to goal node.
+    path: the PNG file written.
+    dpi: the resolution of the PNG file.
+    obstacles: "image" or "patches", see draw_obstacles.
+    resolution: the side of a pixel (in cms) of the obstacle image.
+    """
+    
+    plot_search(astar, exploredStates, backtrackStates, obstacles, resolution).savefig(path, dpi=dpi)
+
+
+# write the exploration as PNG frames, one every interval expansions
+def export_frames(astar, exploredStates, backtrackStates, directory, interval=2000, dpi=100, obstacles="image", resolution=2.0):
+    """
+    Inputs:
+    
+    astar: the AStar object that was searched.
+    exploredStates: list of explored states returned by the search.
+    backtrackStates: list of states of the path from start node to goal node.
+    directory: the directory the frames are written to (created if needed).
+    interval: the number of expansions added by every frame.
+    dpi: the resolution of the frames.
+    obstacles: "image" or "patches", see draw_obstacles.
+    resolution: the side of a pixel (in cms) of the obstacle image.
+    
+    Outputs:
+    
+    List of the paths of the frames (frame_00000.png, ...), the last one adds the backtrack path.
+    
+    The map and the obstacles are rendered once. Every frame only draws the arrows of its new expansions on top of
+    the pixels of the previous frame, so the cost of a frame does not grow with the number of expansions.
+    """
+    
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.image import imsave
+    
+    if(os.path.isdir(directory) == False):
+        os.makedirs(directory)
+    figure = Figure(figsize=(8, 8), dpi=dpi)
+    canvas = FigureCanvasAgg(figure)
+    ax = figure.add_subplot(1, 1, 1)
+    _setup(ax, astar, obstacles, resolution)
+    canvas.draw()
+    
+    # new arrows are drawn straight into the pixel buffer of the canvas
+    def frame(segments, color):
+        if(len(segments[0]) > 0):
+            ax.draw_artist(_quiver(ax, segments, color, animated=True))
+        path = os.path.join(directory, "frame_%05d.png" % len(paths))
+        imsave(path, np.asarray(canvas.buffer_rgba()))
+        paths.append(path)
+    
+    paths = []
+    (x, y, u, v) = explored_segments(astar, exploredStates)
+    for first in range(0, len(x), max(int(interval), 1)):
+        last = first + max(int(interval), 1)
+        frame((x[first:last], y[first:last], u[first:last], v[first:last]), 'g')
+    if(len(backtrackStates) > 1):
+        frame(path_segments(backtrackStates), 'r')
+    return paths
+
+
+# animate path and show the nodes on map in a window
+def animate(astar, exploredStates, backtrackStates, obstacles="image", resolution=2.0):
+    """
+    Inputs:
+    
+    astar: the AStar object that was searched.
+    exploredStates: list of explored states when going from start to goal node.
+    backtrackStates: list of states to go from start to goal node.
+    obstacles: "image" or "patches", see draw_obstacles.
+    resolution: the side of a pixel (in cms) of the obstacle image.
+    """
+    
+    # pyplot is only needed for the window
+    import matplotlib.pyplot as plt
+    
+    fig, ax = plt.subplots()
+    _setup(ax, astar, obstacles, resolution)
+    _quiver(ax, explored_segments(astar, exploredStates), 'g')
+    if(len(backtrackStates) > 1):
+        _quiver(ax, path_segments(backtrackStates), 'r')
+    plt.show()
+    plt.close(fig)
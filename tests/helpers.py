@@ -0,0 +1,56 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+
+
+# header files
+from turtlebot_astar.obstacles import Box, ObstacleMap
+
+
+# query of the default map with a short path (in cms), start, goal, RPM and clearance of AStar
+SHORT_QUERY = ((-400.0, -400.0, 0.0), (-100.0, -400.0), (50, 100), 10.0)
+
+
+# a map whose goal (0, 75) is walled in
+def walled_map():
+    return ObstacleMap([Box(0.0, 0.0, 200.0, 20.0), Box(0.0, 150.0, 200.0, 20.0), Box(-90.0, 75.0, 20.0, 150.0), Box(90.0, 75.0, 20.0, 150.0)], 200, 200)
+
+
+# check that actions followed from a pose stay collision free and end in the goal region
+def assert_reaches_goal(test, astar, start, actions):
+    """
+    Inputs:
+    
+    test: the TestCase running the check.
+    astar: the AStar object (its map, clearance and goal).
+    start: the pose the actions start from, tuple of form (x, y, theta).
+    actions: list of (dvx, dvy, dw) values, each followed for 1 s.
+    """
+    
+    test.assertGreater(len(actions), 0)
+    states = astar.FollowActions(start, actions)
+    test.assertIsNotNone(states, "the actions hit an obstacle or leave the map")
+    test.assertTrue(astar.IsGoal(states[-1][0], states[-1][1]), "the actions end at " + repr(states[-1]))
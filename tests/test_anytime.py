@@ -0,0 +1,71 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+
+
+# header files
+import unittest
+from turtlebot_astar.astar import AStar
+from tests.helpers import SHORT_QUERY, walled_map
+
+
+# anytime repairing a-star
+class TestAnytime(unittest.TestCase):
+    
+    def test_bound(self):
+        
+        # every solution costs at most its bound times the cost of the last (optimal on the lattice) one
+        (start, goal, rpm, clearance) = SHORT_QUERY
+        astar = AStar(start, goal, rpm, clearance)
+        solutions = []
+        final = astar.search_anytime(120.0, callback=solutions.append)
+        self.assertTrue(final["complete"])
+        self.assertEqual(final["bound"], 1.0)
+        self.assertGreater(len(solutions), 0)
+        for solution in solutions:
+            self.assertLessEqual(solution["bound"], solution["weight"])
+            self.assertLessEqual(solution["cost"], solution["bound"] * final["cost"] + 1e-6)
+            self.assertGreaterEqual(solution["cost"], final["cost"] - 1e-6)
+        self.assertEqual(len(final["states"]), len(final["actions"]) + 1)
+        self.assertTrue(astar.IsGoal(final["states"][-1][0], final["states"][-1][1]))
+    
+    def test_deadline(self):
+        (start, goal, rpm, clearance) = SHORT_QUERY
+        astar = AStar(start, goal, rpm, clearance)
+        solution = astar.search_anytime(0.0)
+        self.assertTrue(solution["partial"])
+        self.assertFalse(solution["complete"])
+    
+    def test_no_path(self):
+        astar = AStar((-140.0, -140.0, 0.0), (0.0, 75.0), (50, 100), 10.0, obstacleMap=walled_map())
+        solution = astar.search_anytime(120.0)
+        self.assertFalse(solution["partial"])
+        self.assertTrue(solution["complete"])
+        self.assertEqual(solution["states"], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+# header files
+import unittest
+from turtlebot_astar.batch import plan_batch
+from turtlebot_astar.query import run_query
+
+# queries of the default map (in meters and radians) with two clearances, so two grids are shared
+QUERIES = [
+    {"startX": -4.0, "startY": -4.0, "startOrientation": 0.0, "goalX": -1.0, "goalY": -4.0, "firstRPM": 50, "secondRPM": 100, "clearance": 0.1},
+    {"startX": 0.0, "startY": -2.0, "startOrientation": 0.0, "goalX": 1.5, "goalY": -1.5, "firstRPM": 50, "secondRPM": 100, "clearance": 0.05},
+    {"startX": 0.0, "startY": -2.0, "startOrientation": 0.0, "goalX": 0.0, "goalY": 0.0, "firstRPM": 50, "secondRPM": 100, "clearance": 0.1},
+]
+
+
+# the worker processes reading the shared grids against the search in this process
+class TestPlanBatch(unittest.TestCase):
+    
+    def test_matches_serial(self):
+        results = sorted(plan_batch(QUERIES, 2), key=lambda result: result["index"])
+        self.assertEqual([result["index"] for result in results], [0, 1, 2])
+        for (query, result) in zip(QUERIES, results):
+            serial = run_query(query)
+            self.assertEqual(result["status"], serial["status"])
+            self.assertEqual(result["actions"], serial["actions"])
+            self.assertEqual(result["cost"], serial["cost"])
+            self.assertEqual(result["explored"], serial["explored"])
+        self.assertEqual(results[2]["status"], "goal_in_obstacle")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+# header files
+import unittest
+from turtlebot_astar.benchmark import SCENARIOS, compare, run_scenario
+
+
+# the metrics of the benchmark scenarios and their comparison with a baseline
+class TestBenchmark(unittest.TestCase):
+    
+    def scenario(self, name):
+        return [scenario for scenario in SCENARIOS if scenario["name"] == name][0]
+    
+    def test_unreachable(self):
+        
+        # the same scenario with a lower cap, the search stops at the cap without a path
+        scenario = self.scenario("unreachable_goal")
+        self.assertEqual(scenario["settings"]["goalThreshold"], 0)
+        scenario = dict(scenario, settings=dict(scenario["settings"], maxSteps=2000))
+        metrics = run_scenario(scenario, repeat=1, memory=False)
+        self.assertTrue(metrics["max_steps_hit"])
+        self.assertGreaterEqual(metrics["expanded"], 2000)
+        self.assertIsNone(metrics["cost"])
+    
+    def test_found(self):
+        metrics = run_scenario(self.scenario("easy_straight"), repeat=1)
+        self.assertFalse(metrics["max_steps_hit"])
+        self.assertIsNotNone(metrics["cost"])
+        self.assertGreater(metrics["path_length"], 300.0)
+        self.assertGreater(metrics["peak_memory"], 0)
+        
+        # a slower run, a lost path and an unchanged one
+        slower = dict(metrics, wall_time=metrics["wall_time"] * 2, expansions_per_second=metrics["expansions_per_second"] / 2)
+        lost = dict(metrics, cost=None)
+        regressions = compare({"slower": slower, "lost": lost, "same": metrics}, {"slower": metrics, "lost": metrics, "same": metrics})
+        self.assertEqual(sorted((name, metric) for (name, metric, _, _) in regressions), [("lost", "cost"), ("slower", "expansions_per_second"), ("slower", "wall_time")])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+# header files
+import unittest
+from turtlebot_astar.astar import AStar
+from turtlebot_astar.execution import Executor, RecordingPublisher, coalesce_actions
+from tests.helpers import SHORT_QUERY, assert_reaches_goal, walled_map
+
+
+# merging of the actions into commands
+class TestCoalesceActions(unittest.TestCase):
+    
+    def test_runs(self):
+        
+        # actions with the same speed and turn merge whatever their direction, a different turn starts a new command
+        actions = [(10.0, 0.0, 0.0), (0.0, 10.0, 0.0), (6.0, 8.0, 0.0), (5.0, 0.0, 0.2), (0.0, 5.0, 0.2), (10.0, 0.0, 0.0)]
+        self.assertEqual(coalesce_actions(actions), [(10.0, 0.0, 3.0, 3), (5.0, 0.2, 2.0, 2), (10.0, 0.0, 1.0, 1)])
+        self.assertEqual(coalesce_actions(actions[:2], actionDuration=0.5), [(10.0, 0.0, 1.0, 2)])
+        self.assertEqual(coalesce_actions([]), [])
+
+
+# the executor driving a recording publisher
+class TestExecutor(unittest.TestCase):
+    
+    def test_done(self):
+        (start, goal, rpm, clearance) = SHORT_QUERY
+        astar = AStar(start, goal, rpm, clearance)
+        publisher = RecordingPublisher()
+        result = Executor(astar, publisher, 60.0).Run()
+        self.assertEqual(result["status"], "done")
+        self.assertTrue(publisher.stopped)
+        
+        # the commands drive every action of the path once, for 1 s each
+        self.assertEqual(result["commands"], len(publisher.commands))
+        self.assertAlmostEqual(sum(command[2] for command in publisher.commands), len(result["actions"]))
+        self.assertEqual(len(coalesce_actions(result["actions"])), len(publisher.commands))
+        assert_reaches_goal(self, AStar(start, goal, rpm, clearance), start, result["actions"])
+    
+    def test_timeout(self):
+        
+        # the deadline stops the search before it could prove that the walled in goal can not be reached
+        astar = AStar((-140.0, -140.0, 0.0), (0.0, 75.0), (50, 100), 10.0, obstacleMap=walled_map())
+        publisher = RecordingPublisher()
+        result = Executor(astar, publisher, 0.0).Run()
+        self.assertEqual(result["status"], "timeout")
+        self.assertEqual(publisher.commands, [])
+        self.assertTrue(publisher.stopped)
+        self.assertIsNone(result["timeToFirstMotion"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+# header files
+import unittest
+from turtlebot_astar.astar import AStar
+from tests.helpers import SHORT_QUERY, assert_reaches_goal
+
+# queries of the default map (in cms), start and goal, planned with the RPM and clearance of SHORT_QUERY
+QUERIES = [(SHORT_QUERY[0], SHORT_QUERY[1]), ((0.0, -200.0, 0.0), (150.0, -150.0))]
+
+# length of the longest arc (both wheels at 100 RPM for 1 s, in cms)
+LONGEST_ARC = 3.8 * 2 * 3.1416 * 100 / 60.0
+
+
+# batched expansions against one node at a time
+class TestExpandBatch(unittest.TestCase):
+    
+    # cost to come of the path found with a weight and a batch size
+    def plan(self, start, goal, weight, batchSize):
+        (_, _, rpm, clearance) = SHORT_QUERY
+        astar = AStar(start, goal, rpm, clearance, recordExplored=0, batchSize=batchSize)
+        astar.weight = weight
+        (_, states, actions, distance) = astar.search()
+        assert_reaches_goal(self, astar, start, actions)
+        self.assertAlmostEqual(distance, astar.PathCost(states, actions), places=3)
+        return astar.PathCost(states, actions, costToCome=True)
+    
+    def test_bound(self):
+        
+        # a batch path costs at most weight times the best path on the lattice, plus the longest arc of the keys
+        for (start, goal) in QUERIES:
+            best = self.plan(start, goal, 1.0, 1)
+            for batchSize in (8, 32):
+                self.assertLessEqual(self.plan(start, goal, 3.0, batchSize), 3.0 * best + LONGEST_ARC)
+                self.assertAlmostEqual(self.plan(start, goal, 1.0, batchSize), best, places=6)
+
+
+if __name__ == '__main__':
+    unittest.main()
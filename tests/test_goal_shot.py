@@ -0,0 +1,70 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+# header files
+import unittest
+from turtlebot_astar.astar import AStar
+from turtlebot_astar.stats import SearchStats
+from tests.helpers import SHORT_QUERY, assert_reaches_goal
+
+# queries of the default map (in cms), start and goal, planned with the RPM and clearance of SHORT_QUERY
+QUERIES = [(SHORT_QUERY[0], SHORT_QUERY[1]), ((0.0, -200.0, 0.0), (150.0, -150.0))]
+
+
+# the paths ended by a goal shot against the paths ended by the goal test
+class TestGoalShot(unittest.TestCase):
+    
+    def test_distance(self):
+        (_, _, rpm, clearance) = SHORT_QUERY
+        for (start, goal) in QUERIES:
+            expanded = []
+            for goalShot in (False, True):
+                astar = AStar(start, goal, rpm, clearance, recordExplored=0, goalShot=goalShot)
+                stats = SearchStats()
+                (_, states, actions, distance) = astar.search(stats=stats)
+                assert_reaches_goal(self, astar, start, actions)
+                
+                # both searches return the key the last state of the path has in the lattice
+                self.assertAlmostEqual(distance, astar.PathCost(states, actions), places=3)
+                self.assertEqual(stats.shotAttempts > 0, goalShot)
+                expanded.append(stats.expanded)
+            self.assertLess(expanded[1], expanded[0])
+    
+    def test_shot(self):
+        
+        # shots from the last states of a path, the turn and the line are followed like any other actions
+        (start, goal, rpm, clearance) = SHORT_QUERY
+        astar = AStar(start, goal, rpm, clearance, recordExplored=0)
+        (_, path, _, _) = astar.search()
+        for state in path[-6:-1]:
+            (states, actions, cost) = astar.GoalShot(state)
+            self.assertEqual(astar.FollowActions(state, actions), states)
+            self.assertTrue(astar.IsGoal(states[-1][0], states[-1][1]))
+            self.assertAlmostEqual(cost, astar.PathCost(states, actions, costToCome=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
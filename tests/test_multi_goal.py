@@ -0,0 +1,63 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+# header files
+import unittest
+from turtlebot_astar.astar import AStar
+from tests.helpers import SHORT_QUERY
+
+
+# one search from the start of SHORT_QUERY to several goals
+class TestMultiGoal(unittest.TestCase):
+    
+    def setUp(self):
+        (start, goal, rpm, clearance) = SHORT_QUERY
+        self.astar = AStar(start, goal, rpm, clearance, recordExplored=0)
+    
+    def test_goals(self):
+        
+        # the obstacle at (0, 0) is left out, the other goals are reached by paths followed from the start
+        goals = [(-100.0, -400.0), (0.0, 0.0), (-250.0, -450.0)]
+        results = self.astar.search_goals(goals)
+        self.assertEqual(sorted(result["goal"] for result in results), [0, 2])
+        self.assertIsNone(self.astar.targets)
+        for result in results:
+            states = self.astar.FollowActions(self.astar.start, result["actions"])
+            self.assertIsNotNone(states)
+            (goalX, goalY) = goals[result["goal"]]
+            self.assertLess((states[-1][0] - goalX) ** 2 + (states[-1][1] - goalY) ** 2, self.astar.goalThreshold)
+    
+    def test_count(self):
+        results = self.astar.search_goals([(-100.0, -400.0), (-250.0, -450.0)], count=1)
+        self.assertEqual(len(results), 1)
+    
+    def test_invalid_goals(self):
+        self.assertEqual(self.astar.search_goals([(0.0, 0.0), (900.0, 0.0)]), [])
+        self.assertEqual(self.astar.search_goals([]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+
+
+# header files
+import unittest
+import numpy as np
+from turtlebot_astar.astar import AStar
+from turtlebot_astar.obstacles import ObstacleMap
+from turtlebot_astar.occupancy import OccupancyGrid, obstacle_space
+from tests.helpers import SHORT_QUERY
+
+
+# the rasterized grid against the obstacle equations
+class TestOccupancyGrid(unittest.TestCase):
+    
+    def test_grid_covers_analytic(self):
+        obstacleMap = ObstacleMap.Default()
+        rng = np.random.default_rng(0)
+        rows = rng.uniform(-500, 500, 50000)
+        cols = rng.uniform(-500, 500, 50000)
+        for (clearance, resolution) in ((20.0, 1.0), (30.0, 1.0), (30.0, 4.0)):
+            grid = OccupancyGrid.Build(obstacleMap, clearance, 20.0, resolution)
+            analytic = obstacle_space(rows, cols, clearance, 20.0, obstacleMap=obstacleMap)
+            occupied = grid.IsObstacleBatch(rows, cols)
+            
+            # every obstacle point is occupied, and the grid only adds a thin band around the obstacles
+            self.assertFalse(np.any(analytic & ~occupied))
+            self.assertLess(np.mean(occupied & ~analytic), 0.01 * resolution)
+    
+    def test_verify_search(self):
+        (start, goal, rpm, clearance) = SHORT_QUERY
+        astar = AStar(start, goal, rpm, clearance, collisionCheck="verify", recordExplored=0)
+        (exploredStates, backtrackStates, actions, distance) = astar.search()
+        self.assertGreater(len(actions), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+
+
+# header files
+import os
+import tempfile
+import unittest
+from turtlebot_astar.plan_cache import PlanCache
+from turtlebot_astar.query import make_planner, run_query
+
+# query of the default map (in meters and radians)
+QUERY = {"startX": -4.0, "startY": -4.0, "startOrientation": 0.0, "goalX": -1.0, "goalY": -4.0, "firstRPM": 50, "secondRPM": 100, "clearance": 0.1}
+
+
+# the plans returned by the cache are checked against the query
+class TestPlanCache(unittest.TestCase):
+    
+    def test_hit(self):
+        cache = PlanCache()
+        first = run_query(QUERY, cache=cache)
+        second = run_query(QUERY, cache=cache)
+        self.assertEqual(first["status"], "found")
+        self.assertFalse(first["cached"])
+        self.assertTrue(second["cached"])
+        self.assertEqual(second["actions"], first["actions"])
+        self.assertEqual((cache.hits, cache.misses, cache.rejected), (1, 1, 0))
+    
+    def test_cost(self):
+        
+        # a plan found by the search, looked up for the anytime search and for a start 4 mm away
+        cache = PlanCache()
+        found = run_query(QUERY, cache=cache)
+        cached = run_query(QUERY, timeLimit=60.0, cache=cache)
+        self.assertTrue(cached["cached"])
+        astar = make_planner(QUERY, recordExplored=0)
+        (_, states, actions, distance) = astar.search()
+        self.assertAlmostEqual(found["cost"], distance)
+        self.assertAlmostEqual(cached["cost"], float(astar.lattice.costToCome[astar.lattice.Index(*states[-1])]))
+        nearby = dict(QUERY, startX=QUERY["startX"] + 0.004)
+        cached = run_query(nearby, cache=cache)
+        self.assertTrue(cached["cached"])
+        astar = make_planner(nearby)
+        states = astar.FollowActions(astar.start, found["actions"])
+        self.assertAlmostEqual(cached["cost"], found["cost"] - astar.Heuristic(found["path"][-1][0] * 100.0, found["path"][-1][1] * 100.0) + astar.Heuristic(states[-1][0], states[-1][1]), places=3)
+        self.assertNotAlmostEqual(cached["cost"], found["cost"])
+    
+    def test_rejects_invalid_plans(self):
+        cache = PlanCache()
+        astar = make_planner(QUERY)
+        key = cache.Key(QUERY)
+        found = run_query(QUERY)
+        
+        # a plan stopping short of the goal, and a plan driving into the circle at (-2, -3)
+        for actions in (found["actions"][:-3], [(40.0, 0.0, 0.0)] * 8):
+            cache.Put(key, {"cost": found["cost"], "actions": actions})
+            self.assertIsNone(cache.Lookup(key, astar))
+            self.assertIsNone(cache.Get(key))
+        self.assertEqual(cache.rejected, 2)
+        
+        # the plan of the query, followed from its exact start
+        cache.Put(key, {"cost": found["cost"], "actions": found["actions"]})
+        plan = cache.Lookup(key, astar)
+        self.assertIsNotNone(plan)
+        self.assertEqual(plan["path"][0], (-4.0, -4.0, 0.0))
+    
+    def test_disk(self):
+        path = os.path.join(tempfile.mkdtemp(prefix="turtlebot_astar_tests_"), "plans.db")
+        run_query(QUERY, cache=PlanCache(path=path))
+        cache = PlanCache(path=path)
+        result = run_query(QUERY, cache=cache)
+        self.assertTrue(result["cached"])
+        self.assertEqual(cache.diskHits, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
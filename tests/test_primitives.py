@@ -0,0 +1,64 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+# header files
+import math
+import unittest
+import numpy as np
+from turtlebot_astar.primitives import MotionPrimitives, arc_offsets
+
+
+# the rotated samples of the primitives and their cache
+class TestMotionPrimitives(unittest.TestCase):
+    
+    def setUp(self):
+        self.primitives = MotionPrimitives((50, 100), 3.8, 34.0, 100, cacheSize=4)
+    
+    def test_rotated(self):
+        for theta in (0.0, 0.3, -2.0, 7.5):
+            (offsetX, offsetY, dvx, dvy) = self.primitives.Rotated(theta)
+            (expectedX, expectedY) = arc_offsets(self.primitives.velocity, self.primitives.angularVelocity, theta, 100)
+            self.assertTrue(np.allclose(offsetX, expectedX) and np.allclose(offsetY, expectedY))
+            for action in range(0, 8):
+                self.assertAlmostEqual(dvx[action], self.primitives.Command(theta, action)[0])
+                self.assertAlmostEqual(dvy[action], self.primitives.Command(theta, action)[1])
+    
+    def test_cache(self):
+        
+        # a heading a full turn away shares the entry, and the least recently used heading is dropped first
+        first = self.primitives.Rotated(0.5)
+        self.assertIs(self.primitives.Rotated(0.5 + 2 * math.pi), first)
+        for theta in (1.0, 1.5, 2.0):
+            self.primitives.Rotated(theta)
+        self.primitives.Rotated(0.5)
+        self.primitives.Rotated(2.5)
+        self.assertEqual(len(self.primitives.cache), 4)
+        self.assertIs(self.primitives.Rotated(0.5), first)
+        self.assertNotIn(round(1.0, 9), self.primitives.cache)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+# header files
+import unittest
+import numpy as np
+from turtlebot_astar.astar import AStar
+from turtlebot_astar.priority_queue import IndexedHeap, LazyHeap
+from tests.helpers import SHORT_QUERY
+
+
+# the indexed heap against the heapq open list it replaces
+class TestIndexedHeap(unittest.TestCase):
+    
+    def test_pop_order(self):
+        
+        # random pushes and decrease-keys, the lazy heap skips the entries left behind by a decrease
+        rng = np.random.default_rng(0)
+        indexed = IndexedHeap()
+        lazy = LazyHeap()
+        best = {}
+        popped = ([], [])
+        for _ in range(0, 4000):
+            if(len(indexed) > 0 and rng.random() < 0.3):
+                popped[0].append(indexed.Pop())
+                while(True):
+                    entry = lazy.Pop()
+                    if(best.get(entry[2]) == entry[:2]):
+                        del best[entry[2]]
+                        break
+                popped[1].append(entry)
+                continue
+            key = int(rng.integers(0, 500))
+            entry = (float(rng.integers(0, 1000)), int(rng.integers(0, 4)))
+            if(key in best and best[key] <= entry):
+                continue
+            best[key] = entry
+            indexed.Push(key, entry[0], entry[1])
+            lazy.Push(key, entry[0], entry[1])
+            self.assertEqual(len(indexed), len(best))
+        while(len(indexed) > 0):
+            popped[0].append(indexed.Pop())
+        self.assertEqual(len(indexed.position), 0)
+        while(len(lazy) > 0):
+            entry = lazy.Pop()
+            if(best.get(entry[2]) == entry[:2]):
+                del best[entry[2]]
+                popped[1].append(entry)
+        self.assertEqual(popped[0], popped[1])
+    
+    def test_increase_key(self):
+        heap = IndexedHeap()
+        for key in range(0, 10):
+            heap.Push(key, float(key))
+        heap.Push(0, 20.0)
+        heap.Push(9, -1.0)
+        self.assertIn(0, heap)
+        self.assertEqual([heap.Pop()[2] for _ in range(0, 10)], [9, 1, 2, 3, 4, 5, 6, 7, 8, 0])
+        self.assertNotIn(0, heap)
+    
+    def test_search(self):
+        (start, goal, rpm, clearance) = SHORT_QUERY
+        paths = [AStar(start, goal, rpm, clearance, openList=openList, recordExplored=0).search() for openList in ("heapq", "indexed")]
+        self.assertEqual(paths[0][2], paths[1][2])
+        self.assertAlmostEqual(paths[0][3], paths[1][3])
+
+
+if __name__ == '__main__':
+    unittest.main()
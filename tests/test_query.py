@@ -0,0 +1,105 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+# header files
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from turtlebot_astar.cli import main
+from turtlebot_astar.query import QUERY_FIELDS, load_queries, make_planner, run_query, validate
+
+# query of the default map (in meters and radians)
+QUERY = {"startX": -4.0, "startY": -4.0, "startOrientation": 0.0, "goalX": -1.0, "goalY": -4.0, "firstRPM": 50, "secondRPM": 100, "clearance": 0.1}
+
+
+# reading and checking the queries
+class TestQuery(unittest.TestCase):
+    
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix="turtlebot_astar_tests_")
+    
+    # write a file of queries
+    def write(self, name, text):
+        path = os.path.join(self.directory, name)
+        with open(path, "w") as queryFile:
+            queryFile.write(text)
+        return path
+    
+    def test_load_queries(self):
+        values = [str(QUERY[field]) for field in QUERY_FIELDS]
+        paths = [
+            self.write("queries.csv", "id," + ",".join(QUERY_FIELDS) + "\nfirst," + ",".join(values) + "\n"),
+            self.write("queries.json", json.dumps({"queries": [dict(QUERY, id="first")]})),
+            self.write("queries.jsonl", json.dumps(dict(QUERY, id="first")) + "\n\n"),
+        ]
+        for path in paths:
+            queries = load_queries(path)
+            self.assertEqual(len(queries), 1)
+            self.assertEqual(queries[0]["id"], "first")
+            self.assertEqual({field: queries[0][field] for field in QUERY_FIELDS}, {field: float(QUERY[field]) for field in QUERY_FIELDS})
+        
+        # a query without a clearance
+        path = self.write("missing.json", json.dumps([{field: QUERY[field] for field in QUERY_FIELDS[:-1]}]))
+        with self.assertRaises(ValueError):
+            load_queries(path)
+    
+    def test_validate(self):
+        self.assertIsNone(validate(make_planner(QUERY)))
+        self.assertEqual(validate(make_planner(dict(QUERY, startX=-6.0))), "start_outside_map")
+        self.assertEqual(validate(make_planner(dict(QUERY, goalY=5.5))), "goal_outside_map")
+        self.assertEqual(validate(make_planner(dict(QUERY, startX=0.0, startY=0.0))), "start_in_obstacle")
+        self.assertEqual(validate(make_planner(dict(QUERY, goalX=0.0, goalY=0.0))), "goal_in_obstacle")
+        self.assertEqual(run_query(dict(QUERY, goalX=0.0, goalY=0.0))["status"], "goal_in_obstacle")
+    
+    def test_cli(self):
+        
+        # one query from the arguments, and a file of queries written as a JSON list
+        output = io.StringIO()
+        with redirect_stdout(output):
+            code = main(["--start", "-4", "-4", "0", "--goal", "-1", "-4", "--rpm", "50", "100", "--clearance", "0.1"])
+        self.assertEqual(code, 0)
+        result = json.loads(output.getvalue())
+        self.assertEqual(result["status"], "found")
+        self.assertEqual(result["query"], QUERY)
+        self.assertEqual([tuple(action) for action in result["actions"]], run_query(QUERY)["actions"])
+        
+        path = self.write("queries.jsonl", json.dumps(QUERY) + "\n" + json.dumps(dict(QUERY, goalX=0.0, goalY=0.0)) + "\n")
+        resultPath = os.path.join(self.directory, "results.json")
+        self.assertEqual(main(["--queries", path, "--output", resultPath, "--format", "json"]), 1)
+        with open(resultPath) as resultFile:
+            results = json.load(resultFile)
+        self.assertEqual([result["status"] for result in results], ["found", "goal_in_obstacle"])
+        
+        # neither a file of queries nor a whole query
+        with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            main(["--start", "-4", "-4", "0", "--rpm", "50", "100"])
+
+
+if __name__ == '__main__':
+    unittest.main()
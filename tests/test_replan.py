@@ -0,0 +1,85 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+
+
+# header files
+import unittest
+import numpy as np
+from turtlebot_astar.astar import AStar
+from turtlebot_astar.obstacles import Circle, ObstacleMap
+from turtlebot_astar.replan import Replanner
+from tests.helpers import SHORT_QUERY, assert_reaches_goal
+
+
+# the paths of the replanner, replayed from the pose of the robot
+class TestReplanner(unittest.TestCase):
+    
+    def setUp(self):
+        (start, goal, rpm, clearance) = SHORT_QUERY
+        self.astar = AStar(start, goal, rpm, clearance, recordExplored=0)
+        self.replanner = Replanner(self.astar)
+        (_, self.states, self.actions, _) = self.replanner.Plan()
+        assert_reaches_goal(self, self.astar, start, self.actions)
+    
+    def test_set_start_drift(self):
+        
+        # the repair joins the path with another heading, the rest of the path must not be replayed blindly
+        state = self.states[3]
+        start = (state[0] + 3.0, state[1] + 2.0, state[2] + 0.2)
+        self.replanner.SetStart(start)
+        (_, states, actions, _) = self.replanner.Plan()
+        assert_reaches_goal(self, self.astar, start, actions)
+    
+    def test_set_start_small_drifts(self):
+        rng = np.random.default_rng(0)
+        for _ in range(8):
+            state = self.states[int(rng.integers(1, len(self.states) - 2))]
+            start = (state[0] + rng.uniform(-4, 4), state[1] + rng.uniform(-4, 4), state[2] + rng.uniform(-0.3, 0.3))
+            self.replanner.SetStart(start)
+            (_, states, actions, _) = self.replanner.Plan()
+            assert_reaches_goal(self, self.astar, start, actions)
+            self.states = states
+    
+    def test_set_goal(self):
+        for goal in ((-90.0, -410.0), (-250.0, -450.0), (-60.0, -380.0)):
+            self.replanner.SetGoal(goal)
+            (_, states, actions, _) = self.replanner.Plan()
+            assert_reaches_goal(self, self.astar, self.astar.start, actions)
+    
+    def test_update_map(self):
+        
+        # a new obstacle on the path
+        old = ObstacleMap.Default()
+        obstacleMap = ObstacleMap(list(old.obstacles) + [Circle(-250.0, -400.0, 30.0)], old.xLength, old.yLength)
+        self.replanner.UpdateMap(obstacleMap, (-280.0, -430.0, -220.0, -370.0))
+        (_, states, actions, _) = self.replanner.Plan()
+        assert_reaches_goal(self, self.astar, self.astar.start, actions)
+        self.assertIsNone(AStar(self.astar.start, self.astar.goal, self.astar.wheelRPM, 10.0, obstacleMap=obstacleMap).FollowActions(self.astar.start, self.actions))
+
+
+if __name__ == '__main__':
+    unittest.main()
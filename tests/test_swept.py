@@ -0,0 +1,81 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+# header files
+import unittest
+import numpy as np
+from turtlebot_astar.astar import AStar
+from turtlebot_astar.hierarchical import Corridor
+from tests.helpers import SHORT_QUERY
+
+
+# the swept arcs against all the samples checked in the distance field
+class TestSweptCheck(unittest.TestCase):
+    
+    def test_swept_matches_dense(self):
+        
+        # nodes close to obstacles, where the arcs are partly skipped, on a coarse field with a large cell slack
+        (start, goal, rpm, clearance) = SHORT_QUERY
+        astar = AStar(start, goal, rpm, clearance, resolution=4.0, collisionCheck="distance")
+        margin = astar.clearance + astar.radius
+        rng = np.random.default_rng(1)
+        checked = 0
+        while(checked < 3000):
+            (x, y, theta) = (rng.uniform(-480, 480), rng.uniform(-480, 480), rng.uniform(-np.pi, np.pi))
+            if(astar.signedDistance.Distance(x, y) <= margin or astar.signedDistance.Distance(x, y) >= margin + 40.0):
+                continue
+            (offsetX, offsetY, _, _) = astar.primitives.Rotated(theta)
+            (sampleX, sampleY) = (x + offsetX, y + offsetY)
+            dense = ~np.any(~astar.IsValidBatch(sampleX, sampleY) | astar.IsObstacleBatch(sampleX, sampleY), axis=1)
+            swept = astar.IsSweptFree((x, y, theta), sampleX, sampleY)
+            self.assertTrue(np.array_equal(swept, dense), "node " + repr((x, y, theta)))
+            checked += 1
+    
+    def test_corridor(self):
+        
+        # nodes in open space next to the border of a corridor, the skipped samples may leave the corridor
+        (start, goal, rpm, clearance) = SHORT_QUERY
+        astar = AStar(start, goal, rpm, clearance, collisionCheck="distance")
+        inside = np.zeros((100, 100), dtype=bool)
+        inside[20:60, 10:35] = True
+        astar.corridor = Corridor(inside, astar.xLength, astar.yLength, 10.0)
+        margin = astar.clearance + astar.radius
+        rng = np.random.default_rng(2)
+        checked = 0
+        while(checked < 1000):
+            (x, y, theta) = (rng.uniform(-300, 100), rng.uniform(-400, -150), rng.uniform(-np.pi, np.pi))
+            if(astar.corridor.Contains(x, y) == False or astar.signedDistance.Distance(x, y) <= margin + 40.0):
+                continue
+            (offsetX, offsetY, _, _) = astar.primitives.Rotated(theta)
+            (sampleX, sampleY) = (x + offsetX, y + offsetY)
+            dense = ~np.any(~astar.IsValidBatch(sampleX, sampleY) | astar.IsObstacleBatch(sampleX, sampleY), axis=1)
+            swept = astar.IsSweptFree((x, y, theta), sampleX, sampleY)
+            self.assertTrue(np.array_equal(swept, dense), "node " + repr((x, y, theta)))
+            checked += 1
+
+
+if __name__ == '__main__':
+    unittest.main()
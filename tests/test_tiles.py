@@ -0,0 +1,60 @@
+"""
+ *  MIT License
+ *
+ *  Copyright (c) 2019 Arpit Aggarwal Shantam Bajpai
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a
+ *  copy of this software and associated documentation files (the "Software"),
+ *  to deal in the Software without restriction, including without
+ *  limitation the rights to use, copy, modify, merge, publish, distribute,
+ *  sublicense, and/or sell copies of the Software, and to permit persons to
+ *  whom the Software is furnished to do so, subject to the following
+ *  conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included
+ *  in all copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ *  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ *  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ *  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ *  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ *  DEALINGS IN THE SOFTWARE.
+"""
+
+
+# header files
+import unittest
+import numpy as np
+from turtlebot_astar.astar import AStar
+from turtlebot_astar.obstacles import ObstacleMap
+from turtlebot_astar.occupancy import OccupancyGrid
+from turtlebot_astar.tiles import TiledOccupancy
+from tests.helpers import SHORT_QUERY
+
+
+# the tiled grid against the dense grid
+class TestTiledOccupancy(unittest.TestCase):
+    
+    def test_matches_grid(self):
+        obstacleMap = ObstacleMap.Default()
+        grid = OccupancyGrid.Build(obstacleMap, 20.0, 20.0, 1.0)
+        tiled = TiledOccupancy.Build(obstacleMap, 20.0, 20.0, 1.0, tileSize=128, cacheDirectory=False, cacheTiles=8)
+        rng = np.random.default_rng(1)
+        rows = rng.uniform(-520, 520, (400, 50))
+        cols = rng.uniform(-520, 520, (400, 50))
+        self.assertTrue(np.array_equal(grid.IsObstacleBatch(rows, cols), tiled.IsObstacleBatch(rows, cols)))
+        self.assertTrue(np.array_equal(grid.IsObstacleBatch(rows[0] * 0.01, cols[0] * 0.01), tiled.IsObstacleBatch(rows[0] * 0.01, cols[0] * 0.01)))
+        for (row, col) in zip(rows[0].tolist(), cols[0].tolist()):
+            self.assertEqual(grid.IsObstacle(row, col), tiled.IsObstacle(row, col))
+    
+    def test_search(self):
+        (start, goal, rpm, clearance) = SHORT_QUERY
+        paths = [AStar(start, goal, rpm, clearance, collisionCheck=collisionCheck, recordExplored=0).search() for collisionCheck in ("grid", "tiled")]
+        self.assertEqual(paths[0][2], paths[1][2])
+        self.assertEqual(paths[0][3], paths[1][3])
+
+
+if __name__ == '__main__':
+    unittest.main()